@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+'''
+Compare the generator and visitor export engines of PyDocXExporter.
+
+For each document, this measures how long the html export takes once the
+document has been loaded, with the nested generators of export_node and with
+the explicit stack of visit_node (see PyDocXExporter.visitor_engine). The
+documents are the docx files in tests/fixtures, plus synthetic documents with
+a configurable number of paragraphs, and with deeply nested tables.
+
+Usage:
+
+    python benchmarks/export_engines.py --paragraphs 1000 10000 --repeat 3
+'''
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+import argparse
+import glob
+import os
+import sys
+import time
+from io import BytesIO
+
+BENCHMARKS_DIR = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, '..'))
+
+from pydocx.exceptions import MalformedDocxException  # noqa
+from pydocx.export.html import PyDocXHTMLExporter  # noqa
+from pydocx.openxml.packaging import MainDocumentPart  # noqa
+from pydocx.test.utils import WordprocessingDocumentFactory  # noqa
+from pydocx.util.zip import create_zip_archive  # noqa
+
+FIXTURES_DIR = os.path.join(BENCHMARKS_DIR, '..', 'tests', 'fixtures')
+
+PARAGRAPH_XML = '''
+    <p>
+      <r><rPr><b/></rPr><t>Paragraph {index}</t></r>
+      <r><t xml:space="preserve"> with some text</t></r>
+      <r><rPr><i/></rPr><t xml:space="preserve"> and some more</t></r>
+    </p>
+'''
+
+TABLE_XML = '''
+    <tbl>
+      <tr>
+        <tc><p><r><t>Cell {index}.1</t></r></p></tc>
+        <tc><p><r><t>Cell {index}.2</t></r></p></tc>
+      </tr>
+    </tbl>
+'''
+
+NESTED_TABLE_XML = '<tbl><tr><tc>{content}</tc></tr></tbl>'
+
+
+class GeneratorExporter(PyDocXHTMLExporter):
+    visitor_engine = False
+
+
+class VisitorExporter(PyDocXHTMLExporter):
+    visitor_engine = True
+
+
+ENGINES = [
+    ('generator', GeneratorExporter),
+    ('visitor', VisitorExporter),
+]
+
+
+def create_document(body):
+    document = WordprocessingDocumentFactory()
+    document.add(MainDocumentPart, body)
+    return create_zip_archive(document.to_zip_dict()).getvalue()
+
+
+def create_synthetic_document(paragraphs):
+    '''
+    Return the bytes of a docx with the given number of paragraphs, and a
+    small table after every tenth paragraph.
+    '''
+    body = []
+    for index in range(paragraphs):
+        body.append(PARAGRAPH_XML.format(index=index))
+        if index % 10 == 9:
+            body.append(TABLE_XML.format(index=index))
+    return create_document(''.join(body))
+
+
+def create_nested_tables_document(depth, count):
+    '''
+    Return the bytes of a docx with `count` tables, each of which is nested
+    `depth` tables deep.
+    '''
+    content = '<p><r><t>Nested</t></r></p>'
+    for _ in range(depth):
+        content = NESTED_TABLE_XML.format(content=content)
+    return create_document(content * count)
+
+
+def get_fixtures():
+    '''
+    Return the paths to the fixtures that can be exported. Some fixtures are
+    deliberately malformed.
+    '''
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.docx'))):
+        try:
+            PyDocXHTMLExporter(path).export()
+        except MalformedDocxException:
+            continue
+        fixtures.append(path)
+    return fixtures
+
+
+def load(exporter_class, document):
+    if isinstance(document, bytes):
+        document = BytesIO(document)
+    exporter = exporter_class(document)
+    # Only the export is measured
+    exporter.main_document_part.document
+    return exporter
+
+
+def benchmark_export(exporter_class, documents, repeat):
+    '''
+    Return the best time out of `repeat` to export all of the documents, or
+    None if the engine can't export one of them.
+    '''
+    timings = []
+    for _ in range(repeat):
+        exporters = [load(exporter_class, document) for document in documents]
+        start = time.time()
+        try:
+            for exporter in exporters:
+                exporter.export()
+        except RuntimeError:
+            # Most likely, the maximum recursion depth was exceeded
+            return
+        timings.append(time.time() - start)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument(
+        '--paragraphs',
+        type=int,
+        nargs='*',
+        default=[1000, 10000],
+        help='The sizes of the synthetic documents',
+    )
+    parser.add_argument(
+        '--depth',
+        type=int,
+        default=60,
+        help='How deep the tables of the nested tables document are nested',
+    )
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    fixtures = get_fixtures()
+    suites = [('fixtures ({0} documents)'.format(len(fixtures)), fixtures)]
+    for paragraphs in args.paragraphs:
+        suites.append((
+            'synthetic ({0} paragraphs)'.format(paragraphs),
+            [create_synthetic_document(paragraphs)],
+        ))
+    suites.append((
+        'nested tables (depth {0})'.format(args.depth),
+        [create_nested_tables_document(args.depth, count=100)],
+    ))
+
+    row_format = '{0:<32}' + ''.join(
+        ' {%d:>10}' % (index + 1)
+        for index in range(len(ENGINES))
+    )
+    print(row_format.format('documents', *[name for name, _ in ENGINES]))
+    for suite_name, documents in suites:
+        timings = []
+        for _, exporter_class in ENGINES:
+            timing = benchmark_export(exporter_class, documents, args.repeat)
+            if timing is None:
+                timings.append('failed')
+            else:
+                timings.append('{0:.3f}s'.format(timing))
+        print(row_format.format(suite_name, *timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+'''
+Measure how many html tags per second are rendered.
+
+Each tag is created, wrapped around a result with HtmlTag.apply (which adds
+its closing tag) and rendered, the way the html exporter does it. The tags
+are a mix of the most common ones in a document, plus a few that are unique
+(e.g. links). They are rendered both by HtmlTag.to_html, and by
+PyDocXHTMLExporter.render_tag, which only renders each distinct tag once.
+
+Usage:
+
+    python benchmarks/html_tags.py --tags 100000 --repeat 3
+'''
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+import argparse
+import os
+import sys
+import time
+
+BENCHMARKS_DIR = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, '..'))
+
+from pydocx.export.html import HtmlTag, PyDocXHTMLExporter  # noqa
+
+COMMON_TAGS = [
+    ('p', {}),
+    ('strong', {}),
+    ('em', {}),
+    ('td', {}),
+    ('td', {'colspan': '2'}),
+    ('tr', {}),
+    ('span', {'class': 'pydocx-underline'}),
+    ('span', {'class': 'pydocx-caps'}),
+    ('span', {'style': 'font-size:12pt'}),
+    ('span', {'class': 'pydocx-tab'}),
+]
+
+
+def get_tag_arguments(count):
+    '''
+    Return the tag names and attributes of `count` tags. One in fifty is a
+    unique link.
+    '''
+    tags = []
+    for index in range(count):
+        if index % 50 == 49:
+            tags.append(('a', {'href': 'http://example.com/{0}'.format(index)}))
+        else:
+            tags.append(COMMON_TAGS[index % len(COMMON_TAGS)])
+    return tags
+
+
+def render_tags(tags, render):
+    results = []
+    for tag_name, attrs in tags:
+        tag = HtmlTag(tag_name, **attrs)
+        for result in tag.apply(['text']):
+            if isinstance(result, HtmlTag):
+                result = render(result)
+            results.append(result)
+    return results
+
+
+def render_tags_without_cache(tags):
+    return render_tags(tags, HtmlTag.to_html)
+
+
+def render_tags_with_cache(tags):
+    exporter = PyDocXHTMLExporter(None)
+    return render_tags(tags, exporter.render_tag)
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        timings.append(time.time() - start)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--tags', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    tags = get_tag_arguments(args.tags)
+    for name, func in [
+        ('to_html', render_tags_without_cache),
+        ('render_tag', render_tags_with_cache),
+    ]:
+        timing = best_of(args.repeat, func, tags)
+        print('{0:<10} {1} tags in {2:.3f}s: {3:.0f} tags per second'.format(
+            name,
+            args.tags,
+            timing,
+            args.tags / timing,
+        ))
+
+
+if __name__ == '__main__':
+    main()
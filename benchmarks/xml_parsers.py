@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+'''
+Compare the xml parser backends in pydocx.util.xml.
+
+For each available backend, this measures how long it takes to parse every
+xml part of a document (with namespaces stripped), and how long a complete
+html export of the document takes. The documents are the docx files in
+tests/fixtures, plus synthetic documents with a configurable number of
+paragraphs.
+
+Usage:
+
+    python benchmarks/xml_parsers.py --paragraphs 1000 10000 --repeat 3
+'''
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+import argparse
+import glob
+import os
+import sys
+import time
+import zipfile
+from io import BytesIO
+
+BENCHMARKS_DIR = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, '..'))
+
+from pydocx.exceptions import MalformedDocxException  # noqa
+from pydocx.export.html import PyDocXHTMLExporter  # noqa
+from pydocx.openxml.packaging import MainDocumentPart  # noqa
+from pydocx.test.utils import WordprocessingDocumentFactory  # noqa
+from pydocx.util.xml import (  # noqa
+    XML_PARSERS,
+    get_xml_parser,
+    parse_xml_without_namespaces,
+)
+from pydocx.util.zip import create_zip_archive  # noqa
+
+FIXTURES_DIR = os.path.join(BENCHMARKS_DIR, '..', 'tests', 'fixtures')
+
+PARAGRAPH_XML = '''
+    <p>
+      <pPr><pStyle val="Normal"/></pPr>
+      <r><rPr><b/></rPr><t>Paragraph {index}</t></r>
+      <r><t xml:space="preserve"> with some text</t></r>
+    </p>
+'''
+
+TABLE_XML = '''
+    <tbl>
+      <tr>
+        <tc><p><r><t>Cell {index}.1</t></r></p></tc>
+        <tc><p><r><t>Cell {index}.2</t></r></p></tc>
+      </tr>
+    </tbl>
+'''
+
+
+def create_synthetic_document(paragraphs):
+    '''
+    Return the bytes of a docx with the given number of paragraphs, and a
+    small table after every tenth paragraph.
+    '''
+    body = []
+    for index in range(paragraphs):
+        body.append(PARAGRAPH_XML.format(index=index))
+        if index % 10 == 9:
+            body.append(TABLE_XML.format(index=index))
+    document = WordprocessingDocumentFactory()
+    document.add(MainDocumentPart, ''.join(body))
+    return create_zip_archive(document.to_zip_dict()).getvalue()
+
+
+def get_fixtures():
+    '''
+    Return the paths to the fixtures that can be exported. Some fixtures are
+    deliberately malformed.
+    '''
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.docx'))):
+        try:
+            PyDocXHTMLExporter(path).export()
+        except MalformedDocxException:
+            continue
+        fixtures.append(path)
+    return fixtures
+
+
+def get_available_parsers():
+    for name in sorted(XML_PARSERS):
+        try:
+            get_xml_parser(name)
+        except ImportError:
+            print('Skipping the {0} parser, which is not installed'.format(name))
+            continue
+        yield name
+
+
+def read_xml_parts(path_or_data):
+    if not isinstance(path_or_data, bytes):
+        with open(path_or_data, 'rb') as f:
+            path_or_data = f.read()
+    archive = zipfile.ZipFile(BytesIO(path_or_data))
+    return [
+        archive.read(name)
+        for name in archive.namelist()
+        if name.endswith('.xml') or name.endswith('.rels')
+    ]
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        timings.append(time.time() - start)
+    return min(timings)
+
+
+def benchmark_parse(xml_parser, documents):
+    parts = []
+    for document in documents:
+        parts.extend(read_xml_parts(document))
+
+    def parse():
+        for part in parts:
+            parse_xml_without_namespaces(part, xml_parser=xml_parser)
+    return parse
+
+
+def benchmark_export(xml_parser, documents):
+    class Exporter(PyDocXHTMLExporter):
+        pass
+    Exporter.xml_parser = xml_parser
+
+    def export():
+        for document in documents:
+            Exporter(document).export()
+    return export
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument(
+        '--paragraphs',
+        type=int,
+        nargs='*',
+        default=[1000, 10000],
+        help='The sizes of the synthetic documents',
+    )
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--no-export',
+        action='store_true',
+        help='Only measure parsing',
+    )
+    args = parser.parse_args(argv)
+
+    fixtures = get_fixtures()
+    suites = [('fixtures ({0} documents)'.format(len(fixtures)), fixtures)]
+    for paragraphs in args.paragraphs:
+        suites.append((
+            'synthetic ({0} paragraphs)'.format(paragraphs),
+            [create_synthetic_document(paragraphs)],
+        ))
+
+    benchmarks = [('parse', benchmark_parse)]
+    if not args.no_export:
+        benchmarks.append(('export', benchmark_export))
+
+    parsers = list(get_available_parsers())
+    row_format = '{0:<32} {1:<8}' + ''.join(
+        ' {%d:>10}' % (index + 2)
+        for index in range(len(parsers))
+    )
+    print(row_format.format('documents', 'phase', *parsers))
+    for suite_name, documents in suites:
+        for benchmark_name, benchmark in benchmarks:
+            timings = [
+                '{0:.3f}s'.format(best_of(args.repeat, benchmark(name, documents)))
+                for name in parsers
+            ]
+            print(row_format.format(suite_name, benchmark_name, *timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,39 +1,266 @@
 from __future__ import (
     absolute_import,
+    division,
     print_function,
     unicode_literals,
 )
 
+import glob
+import json
+import os
+import re
 import sys
 import logging
+import time
 
 from pydocx import PyDocX
+from pydocx.batch import (
+    ConversionResult,
+    convert_document,
+    format_to_export_func_map,
+    open_output,
+)
+
+output_type_to_format_map = {
+    '--html': 'html',
+    '--markdown': 'markdown',
+}
+
+format_to_extension_map = {
+    'html': '.html',
+    'markdown': '.md',
+}
+
+# The number of slowest documents listed in the summary of a batch
+BATCH_SUMMARY_SLOWEST_COUNT = 5
+
+glob_magic_characters = re.compile('[*?[]')
 
 
 def convert(output_type, docx_path, output_path):
     if output_type == '--html':
-        output = PyDocX.to_html(docx_path)
+        # The html is written as it's generated, so that large documents
+        # don't need to be held in memory in their entirety
+        with open_output(output_path) as f:
+            PyDocX.to_html_stream(docx_path, f)
+        return 0
     elif output_type == '--markdown':
         output = PyDocX.to_markdown(docx_path)
     else:
         print('Only valid output formats are --html and --markdown')
         return 2
-    with open(output_path, 'wb') as f:
+    with open_output(output_path) as f:
         f.write(output.encode('utf-8'))
     return 0
 
 
+def find_batch_inputs(input_path):
+    '''
+    Return a list of (docx path, path relative to the input) for every docx
+    within the `input_path` directory and its subdirectories, or matching the
+    `input_path` glob. The relative path of a glob match is relative to the
+    leading part of the glob that doesn't contain any wildcards.
+    '''
+    if os.path.isdir(input_path):
+        inputs = []
+        for dirpath, dirnames, filenames in os.walk(input_path):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.lower().endswith('.docx'):
+                    path = os.path.join(dirpath, filename)
+                    inputs.append((path, os.path.relpath(path, input_path)))
+        return inputs
+
+    base_parts = []
+    for part in input_path.split(os.sep):
+        if glob_magic_characters.search(part):
+            break
+        base_parts.append(part)
+    base = os.sep.join(base_parts) or os.curdir
+    return [
+        (path, os.path.relpath(path, base))
+        for path in sorted(glob.glob(input_path))
+        if os.path.isfile(path)
+    ]
+
+
+def is_up_to_date(input_path, output_path):
+    # Outputs are only ever written whole (see open_output), so an output
+    # that exists is complete
+    if not os.path.exists(output_path):
+        return False
+    return os.path.getmtime(output_path) >= os.path.getmtime(input_path)
+
+
+def convert_batch(output_type, input_path, output_dir, jobs=None, force=False):
+    '''
+    Convert every docx found by find_batch_inputs into `output_dir`, keeping
+    their relative paths, using `jobs` worker processes. Documents whose
+    output is newer than the docx are skipped, unless `force` is set.
+    '''
+    output_format = output_type_to_format_map.get(output_type)
+    if output_format is None:
+        print('Only valid output formats are --html and --markdown')
+        return 2
+    extension = format_to_extension_map[output_format]
+
+    start = time.time()
+    paths = []
+    output_paths = []
+    skipped = 0
+    for path, relative_path in find_batch_inputs(input_path):
+        output_path = os.path.join(
+            output_dir,
+            os.path.splitext(relative_path)[0] + extension,
+        )
+        if not force and is_up_to_date(path, output_path):
+            skipped += 1
+            continue
+        output_directory = os.path.dirname(output_path)
+        if not os.path.isdir(output_directory):
+            os.makedirs(output_directory)
+        paths.append(path)
+        output_paths.append(output_path)
+
+    results = PyDocX.convert_many(
+        paths,
+        format=output_format,
+        workers=jobs,
+        ordered=False,
+        output_paths=output_paths,
+    )
+    converted = []
+    failed = []
+    for result in results:
+        if result.succeeded:
+            converted.append(result)
+        else:
+            failed.append(result)
+            print('Failed to convert {0}: {1}'.format(result.path, result.error))
+    elapsed = time.time() - start
+
+    print('Converted {0} documents in {1:.2f}s ({2:.2f} documents/s)'.format(
+        len(converted),
+        elapsed,
+        len(converted) / elapsed if elapsed else 0,
+    ))
+    print('Skipped {0} up to date documents'.format(skipped))
+    print('Failed to convert {0} documents'.format(len(failed)))
+    slowest = sorted(
+        converted + failed,
+        key=lambda result: result.duration,
+        reverse=True,
+    )[:BATCH_SUMMARY_SLOWEST_COUNT]
+    if slowest:
+        print('Slowest documents:')
+        for result in slowest:
+            print('  {0:.2f}s {1}'.format(result.duration, result.path))
+
+    if failed:
+        return 3
+    return 0
+
+
+def serve(stdin, stdout):
+    '''
+    Convert the jobs read from `stdin`, one JSON object per line, and write
+    the result of each one to `stdout`, also as one JSON object per line.
+
+    A job has an "input" path, a "format" ("html" by default) and optionally
+    an "output" path and an "id". The result echoes the "id", "input" and
+    "output". If no output path was given, "output" is the converted
+    document instead. A job that fails, including one that isn't valid
+    JSON, doesn't stop the worker; its result has "ok" set to false and an
+    "error".
+
+    Since the worker keeps running, imports and other setup are only paid for
+    once, instead of once per document.
+    '''
+    for index, line in enumerate(iter(stdin.readline, '')):
+        line = line.strip()
+        if not line:
+            continue
+        job_id = None
+        input_path = None
+        try:
+            job = json.loads(line)
+            job_id = job.get('id')
+            input_path = job.get('input')
+            if input_path is None:
+                raise ValueError('Missing input')
+            output_format = job.get('format', 'html')
+            if output_format not in format_to_export_func_map:
+                raise ValueError('Unknown format: {0!r}'.format(output_format))
+            task = (index, input_path, output_format, job.get('output'))
+        except Exception as e:
+            result = ConversionResult(index, input_path, error='{0}: {1}'.format(
+                e.__class__.__name__,
+                e,
+            ))
+        else:
+            result = convert_document(task)
+        response = {
+            'id': job_id,
+            'input': result.path,
+            'output': result.output_path or result.output,
+            'ok': result.succeeded,
+            'error': result.error,
+            'duration': result.duration,
+        }
+        stdout.write(json.dumps(response, sort_keys=True) + '\n')
+        stdout.flush()
+    return 0
+
+
 def usage():
     print('Usage: pydocx --html|--markdown input.docx output')
+    print(
+        '       pydocx --html|--markdown --batch input_directory|glob '
+        'output_directory [--jobs N] [--force]',
+    )
+    print('       pydocx --serve-stdin')
     return 1
 
 
+def main_batch(output_type, args):
+    '''
+    Parse the arguments that follow --batch: the input, the output directory
+    and options.
+    '''
+    jobs = None
+    force = False
+    positional = []
+    args = iter(args)
+    for arg in args:
+        if arg == '--jobs':
+            try:
+                jobs = int(next(args))
+            except (StopIteration, ValueError):
+                return usage()
+            if jobs < 1:
+                return usage()
+        elif arg == '--force':
+            force = True
+        else:
+            positional.append(arg)
+    if len(positional) != 2:
+        return usage()
+    input_path, output_dir = positional
+    return convert_batch(output_type, input_path, output_dir, jobs, force)
+
+
 def main(args=None):
     logging.basicConfig(level=logging.DEBUG)
 
     if args is None:
         return usage()
 
+    if args == ['--serve-stdin']:
+        return serve(sys.stdin, sys.stdout)
+
+    if len(args) > 1 and args[1] == '--batch':
+        return main_batch(args[0], args[2:])
+
     try:
         output_type = args[0]
         docx_path = args[1]
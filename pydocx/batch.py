@@ -0,0 +1,197 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+import multiprocessing
+import os
+import time
+import traceback
+from contextlib import contextmanager
+
+
+@contextmanager
+def open_output(output_path):
+    '''
+    A context manager that opens a temporary file next to `output_path` for
+    writing, and moves it to `output_path` once the block succeeds. If the
+    block raises, the temporary file is removed instead, so a failed
+    conversion doesn't leave a partial output behind (or replace an existing
+    one).
+    '''
+    temp_path = '{0}.{1}.tmp'.format(output_path, os.getpid())
+    try:
+        with open(temp_path, 'wb') as f:
+            yield f
+        replace_file(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def replace_file(source_path, destination_path):
+    try:
+        replace = os.replace
+    except AttributeError:
+        # Python 2, where rename doesn't replace an existing file on Windows
+        if os.path.exists(destination_path) and os.name == 'nt':
+            os.remove(destination_path)
+        replace = os.rename
+    replace(source_path, destination_path)
+
+
+def export_html(path, output_path=None):
+    from pydocx.export import PyDocXHTMLExporter
+    exporter = PyDocXHTMLExporter(path)
+    if output_path is None:
+        return exporter.export()
+    with open_output(output_path) as f:
+        exporter.export_to(f)
+
+
+def export_markdown(path, output_path=None):
+    from pydocx.export import PyDocXMarkdownExporter
+    output = PyDocXMarkdownExporter(path).export()
+    if output_path is None:
+        return output
+    with open_output(output_path) as f:
+        f.write(output.encode('utf-8'))
+
+
+format_to_export_func_map = {
+    'html': export_html,
+    'markdown': export_markdown,
+}
+
+
+class ConversionResult(object):
+    '''
+    The outcome of converting a single document with convert_many.
+
+    `index` is the position of the document in the `paths` given to
+    convert_many. `output` is the converted document, unless it was written
+    to `output_path`. If the conversion failed, `error` describes the
+    exception and `traceback` is its formatted traceback.
+    '''
+
+    def __init__(
+        self,
+        index,
+        path,
+        output_path=None,
+        output=None,
+        error=None,
+        traceback=None,
+        duration=None,
+    ):
+        self.index = index
+        self.path = path
+        self.output_path = output_path
+        self.output = output
+        self.error = error
+        self.traceback = traceback
+        self.duration = duration
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+    def __repr__(self):
+        return '{0}(index={1!r}, path={2!r}, error={3!r})'.format(
+            self.__class__.__name__,
+            self.index,
+            self.path,
+            self.error,
+        )
+
+
+def convert_document(task):
+    '''
+    Convert a single document, as described by a task of convert_many, and
+    return its ConversionResult. Exceptions are reported in the result
+    instead of being raised, so that one bad document doesn't stop the rest
+    of the batch. (The exception itself is not kept, since it isn't
+    necessarily picklable.)
+    '''
+    index, path, format, output_path = task
+    export_func = format_to_export_func_map[format]
+    result = ConversionResult(index, path, output_path=output_path)
+    start = time.time()
+    try:
+        result.output = export_func(path, output_path)
+    except Exception as e:
+        result.error = ''.join(
+            traceback.format_exception_only(type(e), e),
+        ).strip()
+        result.traceback = traceback.format_exc()
+    result.duration = time.time() - start
+    return result
+
+
+def convert_many(
+    paths,
+    format='html',
+    workers=None,
+    ordered=True,
+    chunksize=1,
+    output_paths=None,
+):
+    '''
+    Convert each of the documents in `paths` to `format` ('html' or
+    'markdown') using a pool of `workers` processes (by default, one per CPU),
+    and return an iterator over their ConversionResults.
+
+    Results are yielded as soon as they're available: in the order of `paths`
+    if `ordered` is set, otherwise in the order in which they complete. The
+    documents are handed to the workers `chunksize` at a time. Larger chunks
+    cost less to dispatch, but balance the work between workers less evenly.
+
+    If `output_paths` is given, each document is written to the corresponding
+    output path by the worker that converted it, instead of being sent back
+    in the result.
+
+    With a single worker, the documents are converted in the current process.
+
+    >>> results = convert_many(['missing.docx'], workers=1)
+    >>> [result.succeeded for result in results]
+    [False]
+    '''
+    if format not in format_to_export_func_map:
+        raise ValueError('Unknown format: {0!r}'.format(format))
+    if output_paths is None:
+        tasks = (
+            (index, path, format, None)
+            for index, path in enumerate(paths)
+        )
+    else:
+        tasks = (
+            (index, path, format, output_path)
+            for index, (path, output_path) in enumerate(zip(paths, output_paths))
+        )
+    if workers == 1:
+        return (convert_document(task) for task in tasks)
+    return yield_pool_results(tasks, workers, ordered, chunksize)
+
+
+def yield_pool_results(tasks, workers, ordered, chunksize):
+    pool = multiprocessing.Pool(workers)
+    completed = False
+    try:
+        if ordered:
+            results = pool.imap(convert_document, tasks, chunksize)
+        else:
+            results = pool.imap_unordered(convert_document, tasks, chunksize)
+        for result in results:
+            yield result
+        completed = True
+    finally:
+        # If the iteration was abandoned, there is no point in converting the
+        # remaining documents
+        if completed:
+            pool.close()
+        else:
+            pool.terminate()
+        pool.join()
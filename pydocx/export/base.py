@@ -6,8 +6,8 @@ from __future__ import (
     unicode_literals,
 )
 
-import xml.sax.saxutils
 
+from pydocx import tracing
 from pydocx.constants import TWIPS_PER_POINT
 from pydocx.exceptions import MalformedDocxException
 from pydocx.export.numbering_span import (
@@ -15,18 +15,79 @@ from pydocx.export.numbering_span import (
     NumberingSpan,
     NumberingSpanBuilder,
 )
+from pydocx.export.instrumentation import ExportInstrumentation, no_phase
+from pydocx.export.visitor import (
+    ExportPlaceholder,
+    get_function,
+    is_pydocx_function,
+    look_ahead,
+)
 from pydocx.openxml import markup_compatibility, vml, wordprocessing
 from pydocx.openxml.packaging import WordprocessingDocument
+from pydocx.util.xml import quoteattr
 
 
 class PyDocXExporter(object):
     numbering_span_builder_class = NumberingSpanBuilder
 
+    # The most components that are held back while waiting to see whether a
+    # numbering span continues after them. Once there are more, the span is
+    # closed and a numbering paragraph that follows starts a new list. If
+    # None, any number is held, so the lists are always continued. Along with
+    # stream_body, this bounds how much of the body is held in memory at once.
+    # See BaseNumberingSpanBuilder.iter_numbering_spans
+    numbering_span_lookahead = None
+
+    # If enabled, the children of the document body are loaded and exported
+    # one at a time instead of loading the entire document up front. The
+    # children that a complex field spans are held until the field ends.
+    stream_body = False
+
+    # The xml parser backend used to load the document: 'etree', 'lxml' or
+    # 'auto'. If None, the PYDOCX_XML_PARSER environment variable decides.
+    # See pydocx.util.xml.get_xml_parser
+    xml_parser = None
+
+    # If enabled, the document is exported by walking the tree with an
+    # explicit stack instead of nesting generators. See visit_node
+    visitor_engine = False
+
+    # The first pass is skipped if none of these tag names occur in the main
+    # document. See needs_first_pass
+    first_pass_tag_names = frozenset(['fldChar', 'AlternateContent'])
+
+    # If enabled, the time spent in each phase of the export, and in exporting
+    # each node type, is measured. Once the export is done, the measurements
+    # are available as `report`, an ExportReport. With visitor_engine, the
+    # time spent in a node mostly excludes its children, since visit_node
+    # exports them on their own. See pydocx.export.instrumentation
+    instrument = False
+
+    # If enabled, consecutive runs of a paragraph that have the same
+    # properties are exported as a single run, so that their formatting is
+    # applied once instead of once per run. Word often splits a run without
+    # changing its formatting (e.g. for spell checking or revision tracking).
+    # See coalesce_paragraph_runs
+    coalesce_runs = False
+
+    # The only children a run may have to be coalesced with another one
+    coalescable_run_child_types = frozenset([
+        wordprocessing.Break,
+        wordprocessing.NoBreakHyphen,
+        wordprocessing.TabChar,
+        wordprocessing.Text,
+    ])
+
     def __init__(self, path):
         self.path = path
         self._document = None
         self._page_width = None
         self.first_pass = False
+        # Whether visit_node is exporting the document. See export_node
+        self.visiting = False
+        self.visitable_node_types = {}
+        self.instrumentation = None
+        self.report = None
 
         self.footnote_tracker = []
 
@@ -87,7 +148,10 @@ class PyDocXExporter(object):
         self._document = document
 
     def load_document(self):
-        self.document = WordprocessingDocument(path=self.path)
+        self.document = WordprocessingDocument(
+            path=self.path,
+            xml_parser=self.xml_parser,
+        )
         return self.document
 
     @property
@@ -105,29 +169,109 @@ class PyDocXExporter(object):
             return self.main_document_part.numbering_definitions_part
 
     def export(self):
-        if self.main_document_part is None:
-            raise MalformedDocxException
-        document = self.main_document_part.document
-        if document:
-            # process the document in two passes, since there are some cases
-            # where we can't know what to do until we look at the entire
-            # document (e.g. fields)
-            # In the first pass, discard any generated results
-            self.first_pass = True
-            self._first_pass_export()
-
-            self._post_first_pass_processing()
-
-            # actually render the results
-            self.first_pass = False
-            for result in self.export_node(document):
-                yield result
+        if self.instrument:
+            self.start_instrumentation()
+        try:
+            with self.export_phase('open'):
+                main_document_part = self.main_document_part
+            if main_document_part is None:
+                raise MalformedDocxException
+            if self.stream_body:
+                # Each body child goes through the first pass as it's loaded.
+                # See yield_streaming_body_children
+                with self.export_phase('load'):
+                    document = main_document_part.load_streaming_document()
+                for result in self.render(document):
+                    yield result
+                return
+            with self.export_phase('load'):
+                document = main_document_part.document
+            if document:
+                # process the document in two passes, since there are some
+                # cases where we can't know what to do until we look at the
+                # entire document (e.g. fields)
+                # The first pass only collects what the second one needs.
+                self.first_pass = True
+                with self.export_phase('first_pass'):
+                    with tracing.trace('first_pass') as info:
+                        self._first_pass_export()
+                        info['complex_field_runs'] = len(self.complex_field_runs)
+
+                        self._post_first_pass_processing()
+
+                # actually render the results
+                self.first_pass = False
+                for result in self.render(document):
+                    yield result
+        finally:
+            # Every part needed for the conversion has been read at this
+            # point, so the handle to the archive is no longer needed.
+            self.document.close()
+            if self.instrumentation is not None:
+                self.stop_instrumentation()
 
     def _first_pass_export(self):
         document = self.main_document_part.document
-        if document:
-            for result in self.export_node(document):
-                pass
+        if document and self.needs_first_pass():
+            self.first_pass_scan(document)
+
+    def needs_first_pass(self):
+        '''
+        Return False if the main document is known to not contain any of the
+        `first_pass_tag_names`, in which case the first pass has nothing to
+        collect.
+        '''
+        local_names = self.main_document_part.local_names
+        if local_names is None:
+            return True
+        return not self.first_pass_tag_names.isdisjoint(local_names)
+
+    def first_pass_scan(self, node):
+        '''
+        Walk the given node and its descendants in document order and collect
+        the runs that make up complex fields. AlternateContent is replaced by
+        its Fallback content along the way.
+        '''
+        for descendant in node.iter_descendants():
+            if isinstance(descendant, wordprocessing.Run):
+                if self.captured_runs is not None:
+                    self.captured_runs.append(descendant)
+            elif isinstance(descendant, wordprocessing.FieldChar):
+                self.first_pass_field_char(descendant)
+            elif isinstance(descendant, markup_compatibility.AlternateContent):
+                self.replace_alternate_content_with_fallback(descendant)
+
+    def first_pass_field_char(self, field_char):
+        if field_char.is_type_begin():
+            self.captured_runs = [field_char.parent]
+        elif field_char.is_type_end() and self.captured_runs is not None:
+            self.complex_field_runs.extend(self.captured_runs)
+            self.captured_runs = None
+
+    def replace_alternate_content_with_fallback(self, alternate_content):
+        parent = alternate_content.parent
+        new_parent_children = []
+        for child in parent.children:
+            # AlternateContent has two kinds of children: Choice and
+            # Fallback. We don't care about any of the Choices. We want to
+            # replace the AlternateContent in the parent node with the
+            # content of the Fallback children.
+            if isinstance(child, markup_compatibility.AlternateContent):
+                for alternate_content_child in child.children:
+                    # This will future-proof us in case we ever implement
+                    # markup_compatibility.Choice.
+                    child_is_fallback = isinstance(
+                        alternate_content_child,
+                        markup_compatibility.Fallback,
+                    )
+                    if not child_is_fallback:
+                        continue
+                    new_parent_children.extend(alternate_content_child.children)
+            else:
+                new_parent_children.append(child)
+        parent.children = new_parent_children
+        for child in new_parent_children:
+            child.parent = parent
 
     def _post_first_pass_processing(self):
         self._convert_complex_fields_into_simple_fields()
@@ -186,37 +330,202 @@ class PyDocXExporter(object):
             previous_run = run
 
         # Next, remove all of the runs from the run's current parent, and
-        # inject the field in their place.
+        # inject the fields in their place. Each parent is rebuilt only once,
+        # no matter how many fields it contains.
+        parents = []
+        runs_to_remove_by_parent = {}
+        fields_by_first_run = {}
         for field in fields:
-            runs_to_remove = runs_to_remove_by_field.get(field, set())
             if not field.children:
                 continue
             first_run = field.children[0]
-            previous_parent_new_children = []
-            for child in first_run.parent.children:
-                if child is first_run:
-                    # This is the insertion point of the new field
-                    previous_parent_new_children.append(field)
-                elif child not in runs_to_remove:
-                    previous_parent_new_children.append(child)
-            first_run.parent.children = previous_parent_new_children
+            parent = first_run.parent
+            if parent not in runs_to_remove_by_parent:
+                parents.append(parent)
+                runs_to_remove_by_parent[parent] = set()
+            runs_to_remove_by_parent[parent].update(
+                runs_to_remove_by_field.get(field, set()),
+            )
+            # The first run is the insertion point of the new field
+            fields_by_first_run.setdefault(first_run, []).append(field)
 
             # If we don't do this, the field's parent will be None. That will
             # break the hierarchy.
-            field.parent = first_run.parent
+            field.parent = parent
+
+        for parent in parents:
+            runs_to_remove = runs_to_remove_by_parent[parent]
+            new_children = []
+            for child in parent.children:
+                inserted_fields = fields_by_first_run.get(child)
+                if inserted_fields is not None:
+                    new_children.extend(inserted_fields)
+                elif child not in runs_to_remove:
+                    new_children.append(child)
+            parent.children = new_children
 
-            # Update the run parent links to point to the field, since the
-            # field is now the run's new parent.
+        # Update the run parent links to point to the field, since the field
+        # is now the run's new parent.
+        for field in fields:
             for run in field.children:
                 run.parent = field
 
+    def start_instrumentation(self):
+        self.instrumentation = ExportInstrumentation()
+        self.report = self.instrumentation.report
+        self.uninstrumented_export_func_map = self.node_type_to_export_func_map
+        self.node_type_to_export_func_map = (
+            self.instrumentation.instrument_export_func_map(
+                self.node_type_to_export_func_map,
+            )
+        )
+
+    def stop_instrumentation(self):
+        '''
+        Restore the export functions that start_instrumentation wrapped, so
+        exporting again with the same exporter doesn't wrap them twice. The
+        report is kept.
+        '''
+        self.node_type_to_export_func_map = self.uninstrumented_export_func_map
+        self.instrumentation = None
+
+    def export_phase(self, name):
+        '''
+        Return a context manager that measures the given phase of the export,
+        if the export is instrumented.
+        '''
+        if self.instrumentation is None:
+            return no_phase()
+        return self.instrumentation.phase(name)
+
+    def iter_export_phase(self, name, func, *args):
+        '''
+        Return func(*args), measuring both the call and the iteration of its
+        results as the given phase of the export, if the export is
+        instrumented.
+        '''
+        if self.instrumentation is None:
+            return func(*args)
+        return self.instrumentation.iter_phase(name, func, *args)
+
+    def render(self, document):
+        with tracing.trace('render') as info:
+            results = self.iter_export_phase('render', self.export_root, document)
+            count = 0
+            for result in results:
+                count += 1
+                yield result
+            info['results'] = count
+
+    def export_root(self, document):
+        if self.visitor_engine:
+            return self.visit_node(document)
+        return self.export_node(document)
+
     def export_node(self, node):
+        if not self.visiting:
+            for result in self.get_node_results(node):
+                yield result
+        elif self.node_type_can_be_visited(type(node)):
+            # visit_node exports the node once the placeholder gets there
+            yield ExportPlaceholder(node, self.get_node_results)
+        else:
+            for result in self.yield_node_results_without_placeholders(node):
+                yield result
+
+    def get_node_results(self, node):
         caller = self.node_type_to_export_func_map.get(type(node))
         if callable(caller):
             results = caller(node)
             if results is not None:
-                for result in results:
+                return results
+        return ()
+
+    def yield_node_results_without_placeholders(self, node):
+        '''
+        Yield the results of the node, with the children of the node exported
+        by their generators rather than by visit_node, even while visiting.
+        '''
+        results = None
+        while True:
+            # Only while the node's own code runs, since visit_node runs other
+            # generators in between
+            self.visiting = False
+            try:
+                if results is None:
+                    results = iter(self.get_node_results(node))
+                result = next(results)
+            except StopIteration:
+                return
+            finally:
+                self.visiting = True
+            yield result
+
+    def node_type_can_be_visited(self, node_type):
+        '''
+        Return True if the children of nodes of the given type can be exported
+        by visit_node, which leaves an ExportPlaceholder in the results of the
+        node for each of them. The export methods of pydocx only pass
+        placeholders through, or look past them (see look_ahead). An export
+        method that's overridden outside of pydocx may look at the results of
+        its children, so it gets the actual results instead.
+        '''
+        try:
+            return self.visitable_node_types[node_type]
+        except KeyError:
+            pass
+        export_func = self.node_type_to_export_func_map.get(node_type)
+        visitable = is_pydocx_function(export_func)
+        self.visitable_node_types[node_type] = visitable
+        return visitable
+
+    def overrides_result_methods(self):
+        '''
+        Return True if a method that may get the results of nodes, other than
+        the export functions of node_type_to_export_func_map (e.g.
+        export_run_property_bold), is overridden outside of pydocx. Since it
+        can't be told which nodes call it, none of the nodes are visited.
+        '''
+        export_funcs = set(
+            get_function(export_func)
+            for export_func in self.node_type_to_export_func_map.values()
+        )
+        for name in dir(type(self)):
+            if not name.startswith(('export_', 'yield_')):
+                continue
+            method = getattr(type(self), name)
+            if not callable(method) or get_function(method) in export_funcs:
+                continue
+            if not is_pydocx_function(method):
+                return True
+        return False
+
+    def visit_node(self, node):
+        '''
+        Export the given node like export_node does. Instead of each generator
+        iterating over the generators of its children, the generators are kept
+        on an explicit stack, so the results of a node don't pass through the
+        generators of all of its ancestors, and deeply nested documents don't
+        hit the recursion limit. The results are yielded as they're produced.
+
+        While visiting, export_node yields an ExportPlaceholder for the node,
+        which the generators of its parents pass through until it gets here.
+        See pydocx.export.visitor.ExportPlaceholder
+        '''
+        self.visitable_node_types = {}
+        self.visiting = not self.overrides_result_methods()
+        try:
+            stack = [self.export_node(node)]
+            while stack:
+                for result in stack[-1]:
+                    if isinstance(result, ExportPlaceholder):
+                        stack.append(iter(result.get_results()))
+                        break
                     yield result
+                else:
+                    stack.pop()
+        finally:
+            self.visiting = False
 
     @property
     def page_width(self):
@@ -227,10 +536,19 @@ class PyDocXExporter(object):
             self._page_width = page_width
         return self._page_width
 
-    def calculate_page_width(self):
+    def get_final_section_properties(self):
+        if self.stream_body:
+            return self.main_document_part.load_final_section_properties()
         document = self.main_document_part.document
         try:
-            page_size = document.body.final_section_properties.page_size
+            return document.body.final_section_properties
+        except AttributeError:
+            return None
+
+    def calculate_page_width(self):
+        section_properties = self.get_final_section_properties()
+        try:
+            page_size = section_properties.page_size
         except AttributeError:
             page_size = None
         if page_size:
@@ -262,32 +580,35 @@ class PyDocXExporter(object):
         previous_was_paragraph = False
         previous_was_empty = True
         for item in iterable:
-            empty = True
             is_paragraph = isinstance(item, wordprocessing.Paragraph)
-            for result in func(item):
-                if empty:
-                    empty = False
-                    if is_paragraph and previous_was_paragraph and not previous_was_empty:
-                        for br_result in func(br):
-                            yield br_result
-                yield result
-            previous_was_paragraph = is_paragraph
-            if not empty:
+            # Any result at all makes the item non-empty
+            first_results, results = look_ahead(func(item), lambda result: True)
+            if results is not None:
+                if is_paragraph and previous_was_paragraph and not previous_was_empty:
+                    for br_result in func(br):
+                        yield br_result
+                for result in first_results:
+                    yield result
+                for result in results:
+                    yield result
                 # Once it's not empty, there's always a previous non-empty
                 # paragraph.
-                previous_was_empty = empty
+                previous_was_empty = False
+            previous_was_paragraph = is_paragraph
 
     def yield_numbering_spans(self, items):
-        if self.first_pass:
-            # If we're in the first pass, just yield back the items we are
-            # passed in instead of processing for the numbering spans, since
-            # doing that is destructive and will cause the second pass to not
-            # convert properly.
-            for item in items:
-                yield item
-            return
         builder = self.numbering_span_builder_class(items)
-        numbering_spans = builder.get_numbering_spans()
+        numbering_spans = builder.iter_numbering_spans(
+            lookahead=self.numbering_span_lookahead,
+        )
+        if tracing.hooks and isinstance(items, list):
+            # The spans are built up front while tracing, so that building
+            # them isn't attributed to whatever consumes them. A streamed body
+            # isn't traced, since building its spans is interleaved with
+            # loading and rendering it.
+            with tracing.trace('numbering_spans', nodes=len(items)) as info:
+                numbering_spans = list(numbering_spans)
+                info['items'] = len(numbering_spans)
         for item in numbering_spans:
             yield item
 
@@ -296,7 +617,59 @@ class PyDocXExporter(object):
         return self.yield_nested(children, self.export_node)
 
     def yield_body_children(self, body):
-        return self.yield_numbering_spans(body.children)
+        if self.stream_body:
+            children = self.yield_streaming_body_children(body)
+        else:
+            children = body.children
+        return self.yield_numbering_spans(children)
+
+    def yield_streaming_body_children(self, body):
+        '''
+        Load the children of the body one at a time, and run each of them
+        through the first pass before yielding them back. While a complex
+        field is open, the children are held back until the field ends, so
+        that fields spanning several children are resolved as they would be
+        if the entire document was loaded.
+        '''
+        children = self.iter_export_phase(
+            'load',
+            self.main_document_part.iter_body_children,
+            body,
+        )
+        # The first pass may replace a child in its parent's children (e.g.
+        # AlternateContent), so the body only ever holds the children that are
+        # currently being processed.
+        body.children = []
+        for child in children:
+            body.children.append(child)
+            self.first_pass = True
+            with self.export_phase('first_pass'):
+                self.first_pass_scan(child)
+                # If a field is still open, it continues in the next child
+                field_is_open = self.captured_runs is not None
+                if not field_is_open:
+                    self._post_first_pass_processing()
+                    self.complex_field_runs = []
+            self.first_pass = False
+            if not field_is_open:
+                for released_child in self.release_body_children(body):
+                    yield released_child
+        if body.children:
+            # A field that never ends is left unresolved, as it is when the
+            # entire document is loaded
+            self.captured_runs = None
+            self.first_pass = True
+            with self.export_phase('first_pass'):
+                self._post_first_pass_processing()
+                self.complex_field_runs = []
+            self.first_pass = False
+            for child in self.release_body_children(body):
+                yield child
+
+    def release_body_children(self, body):
+        children = body.children
+        body.children = []
+        return children
 
     def export_paragraph(self, paragraph):
         children = self.yield_paragraph_children(paragraph)
@@ -306,9 +679,65 @@ class PyDocXExporter(object):
         return results
 
     def yield_paragraph_children(self, paragraph):
+        if self.coalesce_runs:
+            self.coalesce_paragraph_runs(paragraph)
         for child in paragraph.children:
             yield child
 
+    def coalesce_paragraph_runs(self, paragraph):
+        '''
+        Merge each run of the paragraph into the run before it, if they have
+        the same properties (and so the same effective properties, within the
+        same paragraph) and only contain text. A run that starts with
+        whitespace is left alone, since the formatting isn't applied to the
+        leading whitespace of a run.
+        '''
+        new_children = []
+        previous_run = None
+        previous_properties = None
+        for child in paragraph.children:
+            if not self.run_can_be_coalesced(child):
+                previous_run = None
+                new_children.append(child)
+                continue
+            properties = self.get_fields_key(child.properties)
+            if previous_run is not None and properties == previous_properties:
+                if not self.run_starts_with_whitespace(child):
+                    for run_child in child.children:
+                        run_child.parent = previous_run
+                    previous_run.children.extend(child.children)
+                    continue
+            previous_run = child
+            previous_properties = properties
+            new_children.append(child)
+        if len(new_children) != len(paragraph.children):
+            paragraph.children = new_children
+
+    def get_fields_key(self, model):
+        '''
+        Return a key that's equal for models that have the same fields,
+        including the fields of any models within them.
+        '''
+        if model is None:
+            return ()
+        return model.get_fields_key()
+
+    def run_can_be_coalesced(self, node):
+        if type(node) is not wordprocessing.Run:
+            return False
+        for child in node.children:
+            if type(child) not in self.coalescable_run_child_types:
+                return False
+        return True
+
+    def run_starts_with_whitespace(self, run):
+        for child in run.children:
+            if not isinstance(child, wordprocessing.Text):
+                return False
+            if child.text:
+                return not child.text.strip()
+        return False
+
     def get_paragraph_styles_to_apply(self, paragraph):
         properties = paragraph.effective_properties
         property_rules = [
@@ -335,10 +764,6 @@ class PyDocXExporter(object):
         pass
 
     def export_run(self, run):
-        if self.first_pass:
-            if self.captured_runs is not None:
-                self.captured_runs.append(run)
-
         # TODO squash multiple sequential text nodes into one?
         results = self.yield_nested(run.children, self.export_node)
         if run.effective_properties:
@@ -435,7 +860,7 @@ class PyDocXExporter(object):
 
     def escape(self, text):
         #  TODO should we use escape here instead?
-        return xml.sax.saxutils.quoteattr(text)[1:-1]
+        return quoteattr(text)[1:-1]
 
     def export_drawing(self, drawing):
         pass
@@ -453,9 +878,6 @@ class PyDocXExporter(object):
         return self.yield_nested(deleted_run.children, self.export_node)
 
     def export_footnote_reference(self, footnote_reference):
-        if self.first_pass:
-            return
-
         if footnote_reference.footnote is None:
             return
         self.footnote_tracker.append(footnote_reference)
@@ -532,13 +954,7 @@ class PyDocXExporter(object):
         return default_results
 
     def export_field_char(self, field_char):
-        if self.first_pass:
-            if field_char.is_type_begin():
-                self.captured_runs = [field_char.parent]
-            elif field_char.is_type_end() and self.captured_runs is not None:
-                self.complex_field_runs.extend(self.captured_runs)
-                self.captured_runs = None
-            return
+        pass
 
     def export_field_code(self, field_code):
         pass
@@ -550,26 +966,6 @@ class PyDocXExporter(object):
         return self.yield_nested(textbox_content.children, self.export_node)
 
     def export_markup_compatibility_alternate_content(self, alternate_content):
-        if self.first_pass:
-            new_parent_children = []
-            for child in alternate_content.parent.children:
-                # AlternateContent has two kinds of children: Choice and
-                # Fallback. We don't care about any of the Choices. We want to
-                # replace the AlternateContent in the parent node with the
-                # content of the Fallback children.
-                if isinstance(child, markup_compatibility.AlternateContent):
-                    for alternate_content_child in alternate_content.children:
-                        # This will future-proof us in case we ever implement
-                        # markup_compatibility.Choice.
-                        child_is_fallback = isinstance(
-                            alternate_content_child,
-                            markup_compatibility.Fallback,
-                        )
-                        if not child_is_fallback:
-                            continue
-                        new_parent_children.extend(alternate_content_child.children)
-                else:
-                    new_parent_children.append(child)
-            alternate_content.parent.children = new_parent_children
-            for child in new_parent_children:
-                child.parent = alternate_content.parent
+        # AlternateContent is replaced by its Fallback content in the first
+        # pass. See replace_alternate_content_with_fallback
+        pass
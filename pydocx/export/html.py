@@ -7,7 +7,10 @@ from __future__ import (
 )
 
 import base64
+import codecs
 import posixpath
+import weakref
+from collections import OrderedDict
 from itertools import chain
 
 from pydocx.constants import (
@@ -21,6 +24,7 @@ from pydocx.constants import (
 )
 from pydocx.export.base import PyDocXExporter
 from pydocx.export.numbering_span import NumberingItem
+from pydocx.export.visitor import look_ahead
 from pydocx.openxml import wordprocessing
 from pydocx.util.uri import uri_is_external
 from pydocx.util.xml import (
@@ -29,6 +33,11 @@ from pydocx.util.xml import (
 )
 
 
+# Stands in for the rules of the generated style classes, within the style
+# block. See PyDocXHTMLExporter.style_classes
+STYLE_CLASSES_PLACEHOLDER = object()
+
+
 def convert_twips_to_ems(value):
     '''
     >>> convert_twips_to_ems(30)
@@ -64,6 +73,16 @@ def is_only_whitespace(obj):
     return False
 
 
+def is_whitespace_result(result):
+    '''
+    Return True if the given result of an export doesn't count as content.
+    Tags only count as content if they allow whitespace.
+    '''
+    if isinstance(result, HtmlTag):
+        return not result.allow_whitespace
+    return is_only_whitespace(result)
+
+
 def is_not_empty_and_not_only_whitespace(gen):
     '''
     Determine if a generator is empty, or consists only of whitespace.
@@ -71,25 +90,12 @@ def is_not_empty_and_not_only_whitespace(gen):
     If the generator is non-empty, return the original generator. Otherwise,
     return None
     '''
-    queue = []
     if gen is None:
         return
-    try:
-        for item in gen:
-            queue.append(item)
-            is_whitespace = True
-            if isinstance(item, HtmlTag):
-                # If we encounter a tag that allows whitespace, then we can stop
-                is_whitespace = not item.allow_whitespace
-            else:
-                is_whitespace = is_only_whitespace(item)
-
-            if not is_whitespace:
-                # This item isn't whitespace, so we're done scanning
-                return chain(queue, gen)
-
-    except StopIteration:
-        pass
+    # If we encounter a tag that allows whitespace, then we can stop
+    queue, gen = look_ahead(gen, lambda item: not is_whitespace_result(item))
+    if gen is not None:
+        return chain(queue, gen)
 
 
 class HtmlTag(object):
@@ -155,9 +161,36 @@ class HtmlTag(object):
 
 
 class PyDocXHTMLExporter(PyDocXExporter):
+    # The number of characters export_to collects before encoding and writing
+    # them to the stream
+    export_to_buffer_size = 64 * 1024
+
+    # If enabled, inline styles (e.g. the color of a run, or the indentation
+    # of a paragraph) are replaced by a class that's generated for each
+    # distinct style, and defined in the style block. Since the style block
+    # comes before the body, the html that follows it is held until the
+    # export is done. See get_style_attrs
+    style_classes = False
+    style_class_prefix = 'pydocx-s'
+
+    # The most distinct tags whose markup each exporter keeps. Most of the
+    # tags of a document are identical (e.g. each <p> and </td>), so each of
+    # them is only rendered once. Some tags are unique (e.g. links), so the
+    # markup is forgotten once there are more. See render_tag
+    rendered_tags_max_size = 4096
+
     def __init__(self, *args, **kwargs):
         super(PyDocXHTMLExporter, self).__init__(*args, **kwargs)
-        self.table_cell_rowspan_tracking = {}
+        # The class generated for each distinct inline style, in the order
+        # they were generated
+        self.style_class_names = OrderedDict()
+        # The markup of each distinct opening tag, keyed by get_tag_key, and
+        # of each closing tag, keyed by tag name. See render_tag
+        self.rendered_tags = {}
+        self.rendered_closing_tags = {}
+        # Weakly keyed, so that tables which have already been exported can
+        # be garbage collected when the body is streamed
+        self.table_cell_rowspan_tracking = weakref.WeakKeyDictionary()
         self.in_table_cell = False
         self.heading_level_conversion_map = {
             'heading 1': 'h1',
@@ -198,18 +231,132 @@ class PyDocXHTMLExporter(PyDocXExporter):
                 convert_dictionary_to_style_fragment(definition),
             ))
 
+        results = [''.join(result)]
+        if self.style_classes:
+            results.append(STYLE_CLASSES_PLACEHOLDER)
+
         tag = HtmlTag('style')
-        return tag.apply(''.join(result))
+        return tag.apply(results)
+
+    def get_style_attrs(self, style):
+        '''
+        Return the attributes that apply the given inline style (e.g.
+        'color:#FF0000') to an element: the style itself, or the class that's
+        generated for it if style_classes is enabled.
+        '''
+        # A style that could end the style block is left inline
+        if not self.style_classes or '<' in style:
+            return {'style': style}
+        class_name = self.style_class_names.get(style)
+        if class_name is None:
+            class_name = '{0}{1}'.format(
+                self.style_class_prefix,
+                len(self.style_class_names) + 1,
+            )
+            self.style_class_names[style] = class_name
+        return {'class': class_name}
+
+    def get_style_class_rules(self):
+        return ''.join(
+            '.{0} {{{1}}}'.format(class_name, style)
+            for style, class_name in self.style_class_names.items()
+        )
 
     def meta(self):
         yield HtmlTag('meta', charset='utf-8', allow_self_closing=True)
 
     def export(self):
-        return ''.join(
-            result.to_html() if isinstance(result, HtmlTag)
-            else result
-            for result in super(PyDocXHTMLExporter, self).export()
-        )
+        return ''.join(self.yield_html())
+
+    def export_to(self, stream, encoding='utf-8'):
+        '''
+        Write the html to the binary file-like `stream`, encoded with
+        `encoding`. The html is written as it's generated, at most
+        `export_to_buffer_size` characters at a time, instead of being joined
+        into a single string first.
+        '''
+        # Encodings such as utf-16 start with a byte order mark, which must
+        # only be written once
+        encoder = codecs.getincrementalencoder(encoding)()
+        buffered = []
+        buffered_size = 0
+        for result in self.yield_html():
+            buffered.append(result)
+            buffered_size += len(result)
+            if buffered_size >= self.export_to_buffer_size:
+                stream.write(encoder.encode(''.join(buffered)))
+                buffered = []
+                buffered_size = 0
+        data = encoder.encode(''.join(buffered), final=True)
+        if data:
+            stream.write(data)
+
+    def yield_html(self):
+        results = super(PyDocXHTMLExporter, self).export()
+        if self.style_classes:
+            results = self.yield_results_with_style_classes(results)
+        for result in results:
+            if isinstance(result, HtmlTag):
+                yield self.render_tag(result)
+            else:
+                yield result
+
+    def render_tag(self, tag):
+        '''
+        Return the markup of the given HtmlTag, which is only rendered the
+        first time this exporter comes across an identical tag.
+        '''
+        if type(tag) is not HtmlTag:
+            # A subclass may render itself differently
+            return tag.to_html()
+        if tag.closed is True:
+            try:
+                return self.rendered_closing_tags[tag.tag]
+            except KeyError:
+                html = self.rendered_closing_tags[tag.tag] = tag.to_html()
+                return html
+        try:
+            key = self.get_tag_key(tag)
+            return self.rendered_tags[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # One of the attributes can't be hashed
+            return tag.to_html()
+        html = tag.to_html()
+        if len(self.rendered_tags) >= self.rendered_tags_max_size:
+            self.rendered_tags.clear()
+        self.rendered_tags[key] = html
+        return html
+
+    def get_tag_key(self, tag):
+        attrs = tag.attrs
+        if attrs:
+            attrs = tuple(sorted(attrs.items()))
+        else:
+            attrs = ()
+        return (tag.tag, tag.allow_self_closing, attrs)
+
+    def yield_results_with_style_classes(self, results):
+        '''
+        Yield the results up to the style block, and hold the rest until all
+        of the style classes have been generated, so that their rules can be
+        added to the style block.
+        '''
+        for result in results:
+            if result is STYLE_CLASSES_PLACEHOLDER:
+                break
+            yield result
+        else:
+            # There's no style block to add the rules to
+            return
+        held_results = [
+            self.render_tag(result) if isinstance(result, HtmlTag) else result
+            for result in results
+        ]
+        yield self.get_style_class_rules()
+        for result in held_results:
+            yield result
 
     def export_document(self, document):
         tag = HtmlTag('html')
@@ -351,9 +498,9 @@ class PyDocXHTMLExporter(PyDocXExporter):
                 style['text-indent'] = '{0:.2f}em'.format(first_line)
 
         if style:
-            attrs = {
-                'style': convert_dictionary_to_style_fragment(style)
-            }
+            attrs = self.get_style_attrs(
+                convert_dictionary_to_style_fragment(style),
+            )
             tag = HtmlTag('span', **attrs)
             results = tag.apply(results, allow_empty=False)
 
@@ -382,15 +529,15 @@ class PyDocXHTMLExporter(PyDocXExporter):
 
     def export_run_property(self, tag, run, results):
         # Any leading whitespace in the run is not styled.
-        for result in results:
-            if is_only_whitespace(result):
-                yield result
-            else:
-                # We've encountered something that isn't explicit whitespace
-                results = chain([result], results)
-                break
-        else:
-            results = None
+        leading_results, results = look_ahead(
+            results,
+            lambda result: not is_only_whitespace(result),
+        )
+        if results is not None:
+            # We've encountered something that isn't explicit whitespace
+            results = chain([leading_results.pop()], results)
+        for result in leading_results:
+            yield result
 
         if results:
             for result in tag.apply(results):
@@ -478,9 +625,7 @@ class PyDocXHTMLExporter(PyDocXExporter):
         if run.properties is None or run.properties.color is None:
             return results
 
-        attrs = {
-            'style': 'color:#' + run.properties.color
-        }
+        attrs = self.get_style_attrs('color:#' + run.properties.color)
         tag = HtmlTag('span', **attrs)
         return self.export_run_property(tag, run, results)
 
@@ -550,7 +695,7 @@ class PyDocXHTMLExporter(PyDocXExporter):
         tag = HtmlTag('tr')
         return tag.apply(results)
 
-    def export_table_cell(self, table_cell):
+    def get_table_cell_tag(self, table_cell):
         start_new_tag = False
         colspan = 1
         if table_cell.properties:
@@ -578,6 +723,10 @@ class PyDocXHTMLExporter(PyDocXExporter):
             if rowspan > 1:
                 attrs['rowspan'] = rowspan
             tag = HtmlTag('td', **attrs)
+        return tag
+
+    def export_table_cell(self, table_cell):
+        tag = self.get_table_cell_tag(table_cell)
 
         numbering_spans = self.yield_numbering_spans(table_cell.children)
         results = self.yield_nested_with_line_breaks_between_paragraphs(
@@ -645,7 +794,9 @@ class PyDocXHTMLExporter(PyDocXExporter):
                 attrs['width'] = width
                 attrs['height'] = height
             if rotate:
-                attrs['style'] = 'transform: rotate(%sdeg);' % rotate
+                attrs.update(self.get_style_attrs(
+                    'transform: rotate(%sdeg);' % rotate,
+                ))
 
             return HtmlTag(
                 'img',
@@ -714,8 +865,7 @@ class PyDocXHTMLExporter(PyDocXExporter):
         tag = HtmlTag('span', allow_whitespace=True, **attrs)
         return tag.apply(results)
 
-    def export_numbering_span(self, numbering_span):
-        results = super(PyDocXHTMLExporter, self).export_numbering_span(numbering_span)
+    def get_numbering_span_tag(self, numbering_span):
         pydocx_class = 'pydocx-list-style-type-{fmt}'.format(
             fmt=numbering_span.numbering_level.num_format,
         )
@@ -724,7 +874,11 @@ class PyDocXHTMLExporter(PyDocXExporter):
         if not numbering_span.numbering_level.is_bullet_format():
             attrs['class'] = pydocx_class
             tag_name = 'ol'
-        tag = HtmlTag(tag_name, **attrs)
+        return HtmlTag(tag_name, **attrs)
+
+    def export_numbering_span(self, numbering_span):
+        results = super(PyDocXHTMLExporter, self).export_numbering_span(numbering_span)
+        tag = self.get_numbering_span_tag(numbering_span)
         return tag.apply(results)
 
     def export_numbering_item(self, numbering_item):
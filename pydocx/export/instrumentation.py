@@ -0,0 +1,191 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+timer = getattr(time, 'perf_counter', time.time)
+
+
+@contextmanager
+def no_phase():
+    yield
+
+
+class TimingStats(object):
+    '''
+    How many times something was called, and how long it took in seconds.
+    `total_time` includes the time spent in nested calls that are measured as
+    well (e.g. the runs of a paragraph), while `self_time` excludes it.
+    '''
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'total_time': self.total_time,
+            'self_time': self.self_time,
+        }
+
+
+class ExportReport(object):
+    '''
+    The measurements of a single export, keyed by phase ('open', 'load',
+    'first_pass' and 'render'), by node type name (e.g. 'Paragraph') and by
+    export method name (e.g. 'export_paragraph').
+    '''
+
+    def __init__(self):
+        self.phases = defaultdict(TimingStats)
+        self.node_types = defaultdict(TimingStats)
+        self.export_methods = defaultdict(TimingStats)
+
+    def as_dict(self):
+        return dict(
+            (section, dict(
+                (name, stats.as_dict())
+                for name, stats in getattr(self, section).items()
+            ))
+            for section in ['phases', 'node_types', 'export_methods']
+        )
+
+    def format(self, limit=None):
+        '''
+        Return the report as a table. Node types and export methods are
+        sorted by self time, the slowest first, and at most `limit` of each
+        are listed.
+        '''
+        lines = []
+        row_format = '{0:<40} {1:>8} {2:>10} {3:>10}'
+        for title, section, sort in [
+            ('phase', self.phases, False),
+            ('node type', self.node_types, True),
+            ('export method', self.export_methods, True),
+        ]:
+            items = list(section.items())
+            if sort:
+                items.sort(key=lambda item: item[1].self_time, reverse=True)
+                items = items[:limit]
+            lines.append(row_format.format(title, 'count', 'total', 'self'))
+            for name, stats in items:
+                lines.append(row_format.format(
+                    name,
+                    stats.count,
+                    '{0:.4f}s'.format(stats.total_time),
+                    '{0:.4f}s'.format(stats.self_time),
+                ))
+            lines.append('')
+        return '\n'.join(lines)
+
+
+class ExportInstrumentation(object):
+    '''
+    Measures an export into an ExportReport. See PyDocXExporter.instrument
+    '''
+
+    def __init__(self):
+        self.report = ExportReport()
+        # The time spent in measured calls nested within each of the calls
+        # that are currently being measured
+        self.nested_times = []
+
+    def add_time(self, elapsed, stats_list):
+        nested_time = self.nested_times.pop()
+        for stats in stats_list:
+            stats.total_time += elapsed
+            stats.self_time += elapsed - nested_time
+        if self.nested_times:
+            self.nested_times[-1] += elapsed
+
+    @contextmanager
+    def phase(self, name):
+        stats = self.report.phases[name]
+        stats.count += 1
+        self.nested_times.append(0.0)
+        start = timer()
+        try:
+            yield
+        finally:
+            self.add_time(timer() - start, [stats])
+
+    def iter_phase(self, name, func, *args):
+        '''
+        Call `func` with the given arguments and yield its results, measuring
+        both as the given phase.
+        '''
+        stats = self.report.phases[name]
+        stats.count += 1
+        self.nested_times.append(0.0)
+        start = timer()
+        try:
+            results = func(*args)
+        finally:
+            self.add_time(timer() - start, [stats])
+        return self.iter_results(results, [stats])
+
+    def instrument_export_func_map(self, node_type_to_export_func_map):
+        '''
+        Return a copy of the given map with each export function wrapped by
+        instrument_export_func.
+        '''
+        return dict(
+            (node_type, self.instrument_export_func(node_type, export_func))
+            for node_type, export_func in node_type_to_export_func_map.items()
+        )
+
+    def instrument_export_func(self, node_type, export_func):
+        if not callable(export_func):
+            return export_func
+        name = getattr(export_func, '__name__', None) or repr(export_func)
+        node_types = self.report.node_types
+        export_methods = self.report.export_methods
+
+        def instrumented_export_func(node):
+            # Only node types that are actually exported show up in the
+            # report
+            stats_list = [
+                node_types[node_type.__name__],
+                export_methods[name],
+            ]
+            for stats in stats_list:
+                stats.count += 1
+            self.nested_times.append(0.0)
+            start = timer()
+            try:
+                results = export_func(node)
+            finally:
+                self.add_time(timer() - start, stats_list)
+            if results is None:
+                return
+            return self.iter_results(results, stats_list)
+
+        instrumented_export_func.__name__ = str(name)
+        instrumented_export_func.__wrapped__ = export_func
+        return instrumented_export_func
+
+    def iter_results(self, results, stats_list):
+        '''
+        Yield the given results, adding the time it takes to produce each of
+        them to the stats. Most export functions are generators, so this is
+        where the actual work of exporting a node is measured.
+        '''
+        results = iter(results)
+        while True:
+            self.nested_times.append(0.0)
+            start = timer()
+            try:
+                result = next(results)
+            except StopIteration:
+                return
+            finally:
+                self.add_time(timer() - start, stats_list)
+            yield result
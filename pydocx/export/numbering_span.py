@@ -8,9 +8,10 @@ from __future__ import (
 
 import re
 import string
+import weakref
+from collections import deque
 
 from pydocx.openxml import wordprocessing
-from pydocx.util.memoize import memoized
 
 from pydocx.openxml.wordprocessing.run import Run
 from pydocx.openxml.wordprocessing.tab_char import TabChar
@@ -198,12 +199,18 @@ class BaseNumberingSpanBuilder(object):
         self.current_item = None
         self.current_item_index = 0
         self.candidate_numbering_items = []
+        # Kept for as long as the paragraph exists. See get_numbering_level
+        self.numbering_levels = weakref.WeakKeyDictionary()
 
-    @memoized
     def get_numbering_level(self, paragraph):
+        try:
+            return self.numbering_levels[paragraph]
+        except KeyError:
+            pass
         level = paragraph.get_numbering_level()
         if level and level.format_is_none():
-            return None
+            level = None
+        self.numbering_levels[paragraph] = level
         return level
 
     def include_candidate_items_in_current_item(self, new_item_index):
@@ -403,24 +410,83 @@ class BaseNumberingSpanBuilder(object):
         else:
             yield component
 
+    def close_current_span(self):
+        '''
+        A generator that stops adding to the current numbering span. The
+        candidate numbering items are yielded back, to be added directly,
+        outside of any numbering span. A numbering paragraph that follows
+        starts a new span.
+        '''
+        for _, item in self.candidate_numbering_items:
+            yield item
+        self.candidate_numbering_items = []
+        self.numbering_span_stack = []
+        self.current_span = None
+        self.current_item = None
+
     def get_numbering_spans(self):
         '''
         For each flattened numbering span defined in `self.components`, return
         a new list of items that is de-flattened.
         '''
-        new_items = []
-        index = 0
-
-        for index, component in enumerate(self.components):
-            new_items.extend(self.process_component(index, component))
+        return list(self.iter_numbering_spans())
 
-        for item in self.include_candidate_items_in_current_item(self.current_item_index):
-            new_items.append(item)
+    def iter_numbering_spans(self, lookahead=None):
+        '''
+        Like get_numbering_spans, but yield each item of the de-flattened list
+        as soon as it's complete, consuming `self.components` as they're
+        needed.
+
+        A numbering span is complete once it can no longer change: once
+        another span has been started, or the components have run out. Until
+        then, the components that don't belong to the span are held as
+        candidates, since they are added to the current item if the span
+        continues further on. If `lookahead` is given, the span is closed
+        once more than `lookahead` candidates are held, so that at most
+        `lookahead` components are held besides the current span. This
+        changes the result only for spans that would have continued after
+        that many components.
+        '''
+        # The items that have been produced, but not yielded yet. Only the
+        # last top level span that was started can still change, and only
+        # while there is a current span.
+        pending = deque()
+        open_span = None
 
-        return new_items
+        for index, component in enumerate(self.components):
+            for item in self.process_component(index, component):
+                if isinstance(item, NumberingSpan):
+                    open_span = item
+                pending.append(item)
+
+            if lookahead is not None:
+                if len(self.candidate_numbering_items) > lookahead:
+                    pending.extend(self.close_current_span())
+
+            while pending:
+                if pending[0] is open_span and self.current_span is not None:
+                    break
+                yield pending.popleft()
+
+        pending.extend(
+            self.include_candidate_items_in_current_item(self.current_item_index),
+        )
+        for item in pending:
+            yield item
 
 
 class DefaultFakeNumberingDetector(object):
+    # Matches the leading text that any of the detect_* methods below matches,
+    # whatever the digit, capturing the digit in the group named after the
+    # method. See match_leading_text
+    leading_text_pattern = re.compile(
+        r'^\s*(?:'
+        r'\(\s*(?P<paren_digit_paren>[0-9]+|[A-Za-z]+)\s*\)\s*'
+        r'|(?P<digit_paren>[0-9]+|[A-Za-z]+)\s*\)\s*'
+        r'|(?P<digit_dot_space>[0-9]+|[A-Za-z]+)\s*\.\s+'
+        r')'
+    )
+
     def __iter__(self):
         for name in dir(self):
             if name.startswith('detect_'):
@@ -428,6 +494,29 @@ class DefaultFakeNumberingDetector(object):
                 if callable(func):
                     yield func
 
+    def can_match_leading_text(self):
+        '''
+        Whether match_leading_text is equivalent to trying each of the
+        detect_* methods, which isn't the case once a subclass adds or
+        overrides any of them.
+        '''
+        for cls in type(self).__mro__:
+            if cls is DefaultFakeNumberingDetector:
+                return True
+            if any(name.startswith('detect_') for name in vars(cls)):
+                return False
+        return False
+
+    def match_leading_text(self, text):
+        '''
+        Match the leading text of `text` against all of the detect_* methods
+        in one pass. Return a tuple of the matching text and the digit it
+        contains (e.g. ('(iv) ', 'iv')), or None if none of them match.
+        '''
+        matching = self.leading_text_pattern.match(text)
+        if matching:
+            return matching.group(), matching.group(matching.lastgroup)
+
     def detect_paren_digit_paren(self, digit, text):
         pattern_template = r'^\s*\(\s*{0}\s*\)\s*'
         pattern = pattern_template.format(digit)
@@ -462,6 +551,14 @@ class FakeNumberingDetection(object):
         super(FakeNumberingDetection, self).__init__(*args, **kwargs)
 
         self.faked_list_detectors = self.faked_list_detector_class()
+        can_match_leading_text = getattr(
+            self.faked_list_detectors,
+            'can_match_leading_text',
+            None,
+        )
+        self.faked_list_detectors_match_leading_text = (
+            callable(can_match_leading_text) and can_match_leading_text()
+        )
 
         self.faked_list_numbering_format_sequencer = {
             'decimal': lambda i: int(i),
@@ -470,10 +567,24 @@ class FakeNumberingDetection(object):
             'upperLetter': lambda i: int_to_alpha(i).upper(),
             'lowerLetter': lambda i: int_to_alpha(i).lower(),
         }
+        # See get_sequenced_index
+        self.sequenced_indexes = {}
+        # Detecting a faked list changes the state of the builder and cleans
+        # the paragraph, so neither can be computed again afterwards. Like
+        # numbering_levels, they are kept for as long as the paragraph exists
+        # instead of in a bounded cache. See get_numbering_level
+        self.left_positions = weakref.WeakKeyDictionary()
+        # See get_faked_list_leading_text
+        self.faked_list_leading_texts = weakref.WeakKeyDictionary()
 
-    @memoized
     def get_numbering_level(self, paragraph):
-        return self.detect_faked_list(paragraph)
+        try:
+            return self.numbering_levels[paragraph]
+        except KeyError:
+            pass
+        level = self.detect_faked_list(paragraph)
+        self.numbering_levels[paragraph] = level
+        return level
 
     def convert_tab_count_to_distance(self, tab_count):
         # TODO the full implementation of this is significantly more
@@ -481,6 +592,71 @@ class FakeNumberingDetection(object):
         # the document's default tab stop.
         return tab_count * DEFAULT_AUTOMATIC_TAB_STOP_INTERVAL
 
+    def get_sequenced_index(self, num_format, index):
+        '''
+        Return the text of the given index in the given numbering format (e.g.
+        'iv' for 4 in lowerRoman), or None if it has none.
+        '''
+        key = (num_format, index)
+        try:
+            return self.sequenced_indexes[key]
+        except KeyError:
+            pass
+        sequenced_index = None
+        sequencer = self.faked_list_numbering_format_sequencer.get(num_format)
+        if callable(sequencer):
+            try:
+                sequenced_index = '{0}'.format(sequencer(index))
+            except ValueError:
+                pass
+        self.sequenced_indexes[key] = sequenced_index
+        return sequenced_index
+
+    def get_faked_list_leading_text(self, paragraph):
+        '''
+        Return a tuple of the leading text of the paragraph that makes it look
+        like a list item and the digit it contains, or None. See
+        DefaultFakeNumberingDetector.match_leading_text
+
+        The result is kept until the paragraph is cleaned (see
+        clean_paragraph), which removes that text.
+        '''
+        try:
+            return self.faked_list_leading_texts[paragraph]
+        except KeyError:
+            pass
+        paragraph_text = self.get_paragraph_text(paragraph)
+        leading_text = self.faked_list_detectors.match_leading_text(paragraph_text)
+        self.faked_list_leading_texts[paragraph] = leading_text
+        return leading_text
+
+    def paragraph_is_a_faked_list(self, paragraph, num_format, index):
+        '''
+        If the paragraph looks like the item at `index` of a list in the given
+        numbering format, return the text that makes it look like one.
+        Otherwise, return False.
+        '''
+        if not self.faked_list_detectors_match_leading_text:
+            paragraph_text = self.get_paragraph_text(paragraph)
+            for detector in self.faked_list_detectors:
+                matching_text = self.text_is_a_faked_list(
+                    paragraph_text,
+                    detector,
+                    num_format,
+                    index,
+                )
+                if matching_text:
+                    return matching_text
+            return False
+
+        leading_text = self.get_faked_list_leading_text(paragraph)
+        if not leading_text:
+            return False
+        matching_text, digit = leading_text
+        if digit == self.get_sequenced_index(num_format, index):
+            return matching_text
+        return False
+
     def text_is_a_faked_list(self, text, detector, num_format, index):
         sequencer = self.faked_list_numbering_format_sequencer.get(num_format)
         if callable(sequencer):
@@ -506,8 +682,11 @@ class FakeNumberingDetection(object):
         level_start = int(level.start)
         return level_start == next_span_position
 
-    @memoized
     def get_left_position_for_paragraph(self, paragraph):
+        try:
+            return self.left_positions[paragraph]
+        except KeyError:
+            pass
         tab_count = paragraph.get_number_of_initial_tabs()
 
         left_position = 0
@@ -518,34 +697,55 @@ class FakeNumberingDetection(object):
         # Add the tab distance
         tab_distance = self.convert_tab_count_to_distance(tab_count)
         left_position += tab_distance
+        self.left_positions[paragraph] = left_position
         return left_position
 
     def get_paragraph_text(self, paragraph):
         return paragraph.get_text(tab_char=' ')
 
     def detect_new_faked_level_started(self, paragraph, current_level_id=None):
-        paragraph_text = self.get_paragraph_text(paragraph)
-
         level_id = 0
         if current_level_id is not None:
             level_id = current_level_id + 1
 
         next_span_position = 1
+        faked_list_format = self.find_faked_list_format(paragraph, next_span_position)
+        if faked_list_format:
+            num_format, matching_text = faked_list_format
+            self.clean_paragraph(paragraph, matching_text)
+            level = wordprocessing.Level(
+                level_id='{0}'.format(level_id),
+                num_format=num_format,
+            )
+            return level
+
+    def find_faked_list_format(self, paragraph, index):
+        '''
+        Return a tuple of the first numbering format in which the paragraph
+        looks like the item at `index` of a list, and the text that makes it
+        look like one. Return None if there is no such format.
+        '''
+        if self.faked_list_detectors_match_leading_text:
+            leading_text = self.get_faked_list_leading_text(paragraph)
+            if not leading_text:
+                return
+            matching_text, digit = leading_text
+            for num_format in self.faked_list_numbering_format_sequencer:
+                if digit == self.get_sequenced_index(num_format, index):
+                    return num_format, matching_text
+            return
+
+        paragraph_text = self.get_paragraph_text(paragraph)
         for detector in self.faked_list_detectors:
             for num_format in self.faked_list_numbering_format_sequencer:
                 matching_text = self.text_is_a_faked_list(
                     paragraph_text,
                     detector,
                     num_format,
-                    next_span_position,
+                    index,
                 )
                 if matching_text:
-                    self.clean_paragraph(paragraph, matching_text)
-                    level = wordprocessing.Level(
-                        level_id='{0}'.format(level_id),
-                        num_format=num_format,
-                    )
-                    return level
+                    return num_format, matching_text
 
     def get_left_position_for_numbering_span(self, numbering_span):
         paragraph = numbering_span.get_first_child_of_first_item()
@@ -575,7 +775,6 @@ class FakeNumberingDetection(object):
             elif level:
                 return level
 
-            paragraph_text = self.get_paragraph_text(paragraph)
             current_span_left_position = self.get_left_position_for_numbering_span(
                 self.current_span,
             )
@@ -601,30 +800,26 @@ class FakeNumberingDetection(object):
                     previous_span_position = len(previous_span.children)
                     next_span_position = previous_span_position + 1
                     # TODO shouldn't we use the previous_levels num format?
-                    for detector in self.faked_list_detectors:
-                        matching_text = self.text_is_a_faked_list(
-                            paragraph_text,
-                            detector,
-                            previous_level.num_format,
-                            next_span_position,
-                        )
-                        if matching_text:
-                            self.clean_paragraph(paragraph, matching_text)
-                            return previous_level
-
-            elif left_position == current_span_left_position:
-                # TODO shouldn't we just be using the num_format pattern for
-                # this level instead of checking them all?
-                for detector in self.faked_list_detectors:
-                    matching_text = self.text_is_a_faked_list(
-                        paragraph_text,
-                        detector,
-                        current_level.num_format,
+                    matching_text = self.paragraph_is_a_faked_list(
+                        paragraph,
+                        previous_level.num_format,
                         next_span_position,
                     )
                     if matching_text:
                         self.clean_paragraph(paragraph, matching_text)
-                        return current_level
+                        return previous_level
+
+            elif left_position == current_span_left_position:
+                # TODO shouldn't we just be using the num_format pattern for
+                # this level instead of checking them all?
+                matching_text = self.paragraph_is_a_faked_list(
+                    paragraph,
+                    current_level.num_format,
+                    next_span_position,
+                )
+                if matching_text:
+                    self.clean_paragraph(paragraph, matching_text)
+                    return current_level
                 # Maybe it's a new level?
                 level = self.detect_new_faked_level_started(paragraph)
                 if level:
@@ -729,6 +924,7 @@ class FakeNumberingDetection(object):
         Given a paragraph and initial_text, remove any initial tabs, whitespace
         in addition to the initial_text.
         '''
+        self.faked_list_leading_texts.pop(paragraph, None)
         self.remove_initial_text_from_paragraph(paragraph, initial_text, tab_char=' ')
         self.remove_initial_tab_chars_from_paragraph(paragraph)
         self.remove_left_indentation_from_paragraph(paragraph)
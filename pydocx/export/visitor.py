@@ -0,0 +1,86 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+from itertools import chain
+
+
+def get_function(method):
+    '''
+    Return the function behind the given (bound or unbound) method, looking
+    through wrappers that set `__wrapped__` (e.g. the instrumentation of an
+    export function).
+    '''
+    method = getattr(method, '__func__', method)
+    while hasattr(method, '__wrapped__'):
+        method = getattr(method.__wrapped__, '__func__', method.__wrapped__)
+    return method
+
+
+def is_pydocx_function(method):
+    '''
+    Return True if the given method is defined within pydocx, rather than
+    overridden by a subclass outside of it.
+    '''
+    module = getattr(get_function(method), '__module__', None) or ''
+    return module.split('.')[0] == 'pydocx'
+
+
+class ExportPlaceholder(object):
+    '''
+    Stands in for the results of exporting `node` while
+    PyDocXExporter.visit_node is running. Instead of iterating over the
+    generator of each child, export_node yields a placeholder, which is passed
+    up through the generators of the parents until it reaches visit_node. The
+    generator returned by `export(node)` is then pushed on its stack, so the
+    results of the child don't pass through the generators of its parents.
+
+    The code within pydocx that looks at the results of its children, rather
+    than passing them through, looks past the placeholders with look_ahead.
+    Export methods that are overridden outside of pydocx never see them. See
+    PyDocXExporter.node_type_can_be_visited
+    '''
+
+    __slots__ = ('node', 'export')
+
+    def __init__(self, node, export):
+        self.node = node
+        self.export = export
+
+    def get_results(self):
+        return self.export(self.node)
+
+
+def look_ahead(results, is_content):
+    '''
+    Iterate over the given results up to the first one for which
+    `is_content(result)` is true. Any ExportPlaceholder on the way is replaced
+    by the results it stands for.
+
+    Return the results that were looked at (ending with the one that is
+    content) as a list, and an iterator over the rest of them. If none of the
+    results is content, the iterator is None.
+
+    >>> seen, rest = look_ahead(['', 'a', 'b'], bool)
+    >>> seen, list(rest)
+    (['', 'a'], ['b'])
+    >>> look_ahead(['', ''], bool)
+    (['', ''], None)
+    '''
+    seen = []
+    stack = [iter(results)]
+    while stack:
+        for result in stack[-1]:
+            if isinstance(result, ExportPlaceholder):
+                stack.append(iter(result.get_results()))
+                break
+            seen.append(result)
+            if is_content(result):
+                # The placeholders in the rest are left for visit_node
+                return seen, chain(*reversed(stack))
+        else:
+            stack.pop()
+    return seen, None
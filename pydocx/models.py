@@ -6,9 +6,10 @@ from __future__ import (
 )
 
 import importlib
-import inspect
 from collections import defaultdict
 
+from pydocx import tracing
+
 try:
     unicode_string = unicode
 except NameError:
@@ -180,7 +181,175 @@ class XmlCollection(XmlField):
         return self.name_to_type_map.get(tag)
 
 
-class XmlModel(object):
+class XmlModelLoadPlan(object):
+    '''
+    Everything XmlModel.load needs to know about a model class, which only
+    depends on the class and not on the element being loaded: which fields are
+    attributes, content, children and collections, and which handlers process
+    each child tag.
+
+    Use XmlModel.get_load_plan to get the (cached) plan for a class.
+    '''
+
+    def __init__(self, model):
+        self.model = model
+        # Like the rest of XmlModel, only the fields defined directly on the
+        # class are considered. See XmlModelType
+        self.fields = model.__dict__['_fields']
+        self.content_field_names = []
+        self.collection_field_names = []
+        # The fields that hold other models: collections, and children whose
+        # type is a XmlModel. See XmlModel.iter_children
+        self.node_fields = []
+        # (field_name, attribute name, default)
+        self.attributes = []
+        # tag name -> [(field_name, handler, is_collection), ...]
+        self.child_handlers = defaultdict(list)
+
+        collections = []
+        for field_name, field in self.fields:
+            if isinstance(field, XmlAttribute):
+                attr_name = field_name
+                if field.name is not None:
+                    attr_name = field.name
+                self.attributes.append((field_name, attr_name, field.default))
+            if isinstance(field, XmlChild):
+                self.add_child_field(field_name, field)
+                field_type = field.type
+                if isinstance(field_type, type) and issubclass(field_type, XmlModel):
+                    self.node_fields.append((field_name, False))
+            if isinstance(field, XmlContent):
+                self.content_field_names.append(field_name)
+            if isinstance(field, XmlCollection):
+                self.collection_field_names.append(field_name)
+                self.node_fields.append((field_name, True))
+                collections.append((field_name, field))
+
+        # The children of a tag are processed before the collections
+        for field_name, field in collections:
+            self.add_collection_field(field_name, field)
+
+        self.child_handlers = dict(self.child_handlers)
+
+    def add_child_field(self, field_name, field):
+        # The attribute name is whatever the field name is, unless:
+        # field.name is set, or
+        # field.type.XML_TAG is set
+        tag_name = field_name
+
+        if field.name is not None:
+            tag_name = field.name
+        elif field.type:
+            field_type_tag = getattr(field.type, 'XML_TAG', None)
+            if field_type_tag:
+                tag_name = field_type_tag
+
+        assert tag_name
+
+        self.child_handlers[tag_name].append(
+            (field_name, self.create_child_handler(field), False),
+        )
+
+    def create_child_handler(self, field):
+        attrname = field.attrname
+        default = field.default
+        # The type may be an XmlModel, if so, construct a new instance using
+        # XmlModel.load
+        load = None
+        field_type = None
+        if callable(field.type):
+            if isinstance(field.type, type) and issubclass(field.type, XmlModel):
+                load = field.type.load_element
+            else:
+                field_type = field.type
+
+        def child_handler(child, load_kwargs):
+            # If attrname is set, then the value is an attribute on the child
+            if attrname:
+                value = child.attrib.get(attrname, default)
+            else:
+                # Otherwise it's just the child
+                value = child
+            if load is not None:
+                return load(value, load_kwargs)
+            if field_type is not None:
+                return field_type(value)
+            return value
+        return child_handler
+
+    def add_collection_field(self, field_name, field):
+        for tag_name, handler in field.name_to_type_map.items():
+            # different collection definitions may define different handlers
+            # for the same child.
+            # If the handler is a XmlModel we want to use the load method, not
+            # the constructor
+            # load_element already takes the same arguments as the handlers
+            if issubclass(handler, XmlModel):
+                handler = handler.load_element
+            elif callable(handler):
+                handler = self.create_collection_handler(handler)
+            else:
+                continue
+            self.child_handlers[tag_name].append((field_name, handler, True))
+
+    def create_collection_handler(self, handler):
+        def collection_handler(child, load_kwargs):
+            return handler(child, **load_kwargs)
+        return collection_handler
+
+
+class XmlModelType(type):
+    '''
+    The metaclass of XmlModel. The fields declared on a model class are moved
+    into the class's `_fields` list, and a slot is generated for each of them,
+    so that the fields are not stored in the instance's __dict__. The field
+    defaults are kept on the class (see XmlModel.__getattr__), so fields that
+    were never set are not stored on the instance at all.
+
+    As with any other class, a model only goes without a __dict__ if it and
+    every class it inherits from declare __slots__, in which case any other
+    instance attributes it needs must be declared there. The models in pydocx
+    all do; subclasses that don't declare __slots__ have a __dict__ as usual.
+    '''
+
+    def __new__(mcs, name, bases, namespace):
+        fields = [
+            (field_name, field)
+            for field_name, field in namespace.items()
+            if isinstance(field, XmlField)
+        ]
+        inherited_slots = set()
+        field_defaults = {}
+        for base in reversed(bases):
+            for klass in reversed(base.__mro__):
+                inherited_slots.update(klass.__dict__.get('__slots__', ()))
+                field_defaults.update(klass.__dict__.get('_field_defaults', {}))
+
+        slots = list(namespace.get('__slots__', ()))
+        if '__slots__' not in namespace:
+            if not any(base.__dictoffset__ for base in bases):
+                slots.append('__dict__')
+        for field_name, field in fields:
+            del namespace[field_name]
+            field_defaults[field_name] = field.default
+            if field_name not in inherited_slots:
+                slots.append(field_name)
+
+        namespace['__slots__'] = tuple(slots)
+        namespace['_fields'] = fields
+        namespace['_field_defaults'] = field_defaults
+        return super(XmlModelType, mcs).__new__(mcs, name, bases, namespace)
+
+
+def with_metaclass(metaclass, base=object):
+    '''
+    Return a class, to inherit from, that has the given metaclass. This works
+    the same on python 2 and 3.
+    '''
+    return metaclass(str('XmlModelBase'), (base,), {'__slots__': ()})
+
+
+class XmlModel(with_metaclass(XmlModelType)):
     '''
     Xml models are defined by inheriting this class, and then specifying class
     variables to define the structure of the XML data.
@@ -203,27 +372,44 @@ class XmlModel(object):
     person = Person.load(xml)
     '''
 
+    __slots__ = ('_parent', 'container', '__weakref__')
+
     def __init__(
         self,
         parent=None,
         **kwargs
     ):
-        for field_name, field in self.__class__.__dict__.items():
-            if isinstance(field, XmlField):
-                # TODO field.default may only refer to the attr, and not if the
-                # field itself is missing
-                value = kwargs.get(field_name, field.default)
-                if hasattr(value, 'parent'):
-                    value.parent = self
-                if isinstance(field, XmlCollection):
-                    for item in value:
-                        if hasattr(item, 'parent'):
-                            item.parent = self
-                setattr(self, field_name, value)
+        for field_name, field in self.get_load_plan().fields:
+            # TODO field.default may only refer to the attr, and not if the
+            # field itself is missing
+            if field_name not in kwargs:
+                # Unset fields fall back to the default. See __getattr__
+                continue
+            value = kwargs[field_name]
+            if hasattr(value, 'parent'):
+                value.parent = self
+            if isinstance(field, XmlCollection):
+                for item in value:
+                    if hasattr(item, 'parent'):
+                        item.parent = self
+            setattr(self, field_name, value)
 
         self._parent = parent
         self.container = kwargs.get('container')
 
+    def __getattr__(self, name):
+        # Only called for attributes that were not found on the instance or
+        # the class, such as fields that were never set
+        try:
+            return self._field_defaults[name]
+        except KeyError:
+            raise AttributeError(
+                "'{klass}' object has no attribute '{name}'".format(
+                    klass=self.__class__.__name__,
+                    name=name,
+                ),
+            )
+
     @property
     def parent(self):
         return self._parent
@@ -232,6 +418,36 @@ class XmlModel(object):
     def parent(self, parent):
         self._parent = parent
 
+    def iter_children(self):
+        '''
+        A generator that yields back the models that are held by this model's
+        fields, in the order the fields are defined.
+        '''
+        for field_name, is_collection in self.get_load_plan().node_fields:
+            value = getattr(self, field_name)
+            if is_collection:
+                for item in value:
+                    yield item
+            elif value is not None:
+                yield value
+
+    def iter_descendants(self):
+        '''
+        A generator that walks the tree rooted at this model depth first, in
+        document order, and yields back each model (including this one).
+
+        The children of a model are only looked up once the model has been
+        yielded, so the caller may replace them before they are visited.
+        '''
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            if isinstance(node, XmlModel):
+                children = list(node.iter_children())
+                children.reverse()
+                stack.extend(children)
+
     def nearest_ancestors(self, ancestor_type):
         node = self.parent
         while node:
@@ -263,14 +479,79 @@ class XmlModel(object):
         model, and yields back only those fields which have been set to a value
         that isn't the field's default.
         '''
-        for field_name, field in self.__class__.__dict__.items():
-            if isinstance(field, XmlField):
-                value = getattr(self, field_name, field.default)
-                if value != field.default:
-                    yield field_name, value
+        for field_name, field in self.get_load_plan().fields:
+            value = getattr(self, field_name, field.default)
+            if value != field.default:
+                yield field_name, value
+
+    def get_fields_key(self):
+        '''
+        Return a hashable key that's equal for models of the same class that
+        have the same fields, including the fields of the models within them,
+        which otherwise compare by identity.
+        '''
+        key = []
+        for field_name, value in self.fields:
+            if isinstance(value, XmlModel):
+                value = value.get_fields_key()
+            elif isinstance(value, list):
+                value = tuple(
+                    item.get_fields_key() if isinstance(item, XmlModel) else item
+                    for item in value
+                )
+            key.append((field_name, value))
+        return (self.__class__, tuple(key))
+
+    def copy(self):
+        '''
+        Return a new model of the same class with the same fields. The models
+        within its fields are copied as well, so that the original ones keep
+        their parent. The copy has no parent or container.
+        '''
+        fields = {}
+        for field_name, value in self.fields:
+            if isinstance(value, XmlModel):
+                value = value.copy()
+            elif isinstance(value, list):
+                value = [
+                    item.copy() if isinstance(item, XmlModel) else item
+                    for item in value
+                ]
+            fields[field_name] = value
+        return self.__class__(**fields)
+
+    @classmethod
+    def get_load_plan(cls):
+        '''
+        Return the XmlModelLoadPlan for this class. The plan is created the
+        first time it is needed and stored on the class itself, so subclasses
+        get their own plan.
+        '''
+        plan = cls.__dict__.get('_load_plan')
+        if plan is None:
+            plan = XmlModelLoadPlan(cls)
+            cls._load_plan = plan
+        return plan
 
     @classmethod
     def load(cls, element, **load_kwargs):
+        '''
+        Construct a model, and the models nested within it, from the given
+        element.
+        '''
+        if not tracing.hooks:
+            return cls.load_element(element, load_kwargs)
+        with tracing.trace('load', model=cls.__name__) as info:
+            model = cls.load_element(element, load_kwargs)
+            info['nodes'] = sum(1 for _ in model.iter_descendants())
+        return model
+
+    @classmethod
+    def load_element(cls, element, load_kwargs):
+        '''
+        The work of XmlModel.load, which the models nested within the element
+        are loaded with as well, so that only the outermost load is traced.
+        '''
         xml_tag_decl = getattr(cls, 'XML_TAG', None)
         if element is not None and xml_tag_decl:
             if xml_tag_decl != element.tag:
@@ -281,117 +562,35 @@ class XmlModel(object):
                     ),
                 )
 
+        plan = cls.get_load_plan()
         kwargs = dict(load_kwargs)
-        attribute_fields = {}
-        tag_fields = {}
-        collections = {}
 
-        # Enumerate the defined fields and separate them into attributes and
-        # tags
-        for field_name, field in cls.__dict__.items():
-            if isinstance(field, XmlAttribute):
-                attribute_fields[field_name] = field
-            if isinstance(field, XmlChild):
-                tag_fields[field_name] = field
-            if isinstance(field, XmlContent):
-                content = force_unicode(element.text)
-                kwargs[field_name] = content
-            if isinstance(field, XmlCollection):
-                collections[field_name] = field
+        for field_name in plan.content_field_names:
+            kwargs[field_name] = force_unicode(element.text)
 
-        for field_name in collections.keys():
+        for field_name in plan.collection_field_names:
             kwargs[field_name] = []
 
         # Evaluate each of the attribute fields against the given element
-        for field_name, field in attribute_fields.items():
-            attr_name = field_name
-            if field.name is not None:
-                attr_name = field.name
-            value = element.attrib.get(attr_name, field.default)
-            kwargs[field_name] = value
-
-        # Child tag fields may specify a handler/type, which is responsible for
-        # parsing the child tag
-        tag_name_to_field_names = defaultdict(list)
-        child_handlers = {}
-
-        def create_child_handler(field):
-            def child_handler(child):
-                # If attrname is set, then the value is an attribute on the
-                # child
-                if field.attrname:
-                    value = child.attrib.get(field.attrname, field.default)
-                else:
-                    # Otherwise it's just the child
-                    value = child
-
-                # The type may be an XmlModel, if so, construct a new instance
-                # using XmlModel.load
-                if callable(field.type):
-                    if inspect.isclass(field.type):
-                        if issubclass(field.type, XmlModel):
-                            return field.type.load(value, **load_kwargs)
-                    return field.type(value)
-                return value
-            return child_handler
-
-        # Evaluate the child tags
-        for field_name, field in tag_fields.items():
-            # The attribute name is whatever the field name is, unless:
-            # field.name is set, or
-            # field.type.XML_TAG is set
-            tag_name = field_name
-
-            if field.name is not None:
-                tag_name = field.name
-            elif field.type:
-                field_type_tag = getattr(field.type, 'XML_TAG', None)
-                if field_type_tag:
-                    tag_name = field_type_tag
-
-            assert tag_name
-
-            # Based on the tag name, we need to know what the field name is
-            tag_name_to_field_names[tag_name].append(field_name)
-            # Save the handler
-            child_handlers[field_name] = create_child_handler(field)
-
-        # Build a mapping of tag names to collections
-        collection_member_to_collections = defaultdict(list)
-        for field_name, field in collections.items():
-            for tag_name in field.name_to_type_map.keys():
-                collection_member_to_collections[tag_name].append(field_name)
+        if plan.attributes:
+            attrib = element.attrib
+            for field_name, attr_name, default in plan.attributes:
+                kwargs[field_name] = attrib.get(attr_name, default)
 
         if element is not None:
+            child_handlers = plan.child_handlers
             # Process each child
             for child in element:
-                tag = child.tag
-                # Does this child have a corresponding field?
-                field_names = tag_name_to_field_names.get(tag, [])
-                for field_name in field_names:
-                    # Execute the handler
-                    handler = child_handlers.get(field_name, None)
-                    if callable(handler):
-                        kwargs[field_name] = handler(child)
-
-                # Does a this child belong to a collection?
-                parent_collections = collection_member_to_collections.get(
-                    tag,
-                    [],
-                )
-                for field_name in parent_collections:
-                    collection = collections.get(field_name)
-                    if collection:
-                        # different collection definitions may define different
-                        # handlers for the same child
-                        handler = collection.get_handler_for_tag(tag)
-                        # If the handler is a XmlModel we want to use the load
-                        # method, not the constructor
-                        if issubclass(handler, XmlModel):
-                            handler = handler.load
-                        if callable(handler):
-                            item = handler(child, **load_kwargs)
-                            kwargs[field_name].append(item)
+                # Does this child have corresponding fields or collections?
+                handlers = child_handlers.get(child.tag)
+                if handlers is None:
+                    continue
+                for field_name, handler, is_collection in handlers:
+                    value = handler(child, load_kwargs)
+                    if is_collection:
+                        kwargs[field_name].append(value)
+                    else:
+                        kwargs[field_name] = value
 
         # Create a new instance using the values we've calculated
         return cls(**kwargs)
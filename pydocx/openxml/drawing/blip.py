@@ -11,5 +11,7 @@ from pydocx.models import XmlModel, XmlAttribute
 class Blip(XmlModel):
     XML_TAG = 'blip'
 
+    __slots__ = ()
+
     embedded_picture_id = XmlAttribute(name='embed')
     linked_picture_id = XmlAttribute(name='link')
@@ -11,5 +11,7 @@ from pydocx.models import XmlModel, XmlAttribute
 class Extents(XmlModel):
     XML_TAG = 'ext'
 
+    __slots__ = ()
+
     length = XmlAttribute(name='cx')
     width = XmlAttribute(name='cy')
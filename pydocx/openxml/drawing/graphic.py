@@ -12,4 +12,6 @@ from pydocx.openxml.drawing.graphic_data import GraphicData
 class Graphic(XmlModel):
     XML_TAG = 'graphic'
 
+    __slots__ = ()
+
     graphic_data = XmlChild(type=GraphicData)
@@ -12,4 +12,6 @@ from pydocx.openxml.drawing.pictures.picture import Picture
 class GraphicData(XmlModel):
     XML_TAG = 'graphicData'
 
+    __slots__ = ()
+
     picture = XmlChild(type=Picture)
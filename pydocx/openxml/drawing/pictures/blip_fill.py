@@ -12,4 +12,6 @@ from pydocx.openxml.drawing.blip import Blip
 class BlipFill(XmlModel):
     XML_TAG = 'blipFill'
 
+    __slots__ = ()
+
     blip = XmlChild(type=Blip)
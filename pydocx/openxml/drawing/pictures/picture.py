@@ -13,5 +13,7 @@ from pydocx.openxml.drawing.pictures.blip_fill import BlipFill
 class Picture(XmlModel):
     XML_TAG = 'pic'
 
+    __slots__ = ()
+
     shape_properties = XmlChild(type=ShapeProperties)
     blip_fill = XmlChild(type=BlipFill)
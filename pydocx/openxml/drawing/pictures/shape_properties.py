@@ -12,4 +12,6 @@ from pydocx.openxml.drawing.transform_2d import Transform2D
 class ShapeProperties(XmlModel):
     XML_TAG = 'spPr'
 
+    __slots__ = ()
+
     xfrm = XmlChild(type=Transform2D)
@@ -12,5 +12,7 @@ from pydocx.openxml.drawing.extents import Extents
 class Transform2D(XmlModel):
     XML_TAG = 'xfrm'
 
+    __slots__ = ()
+
     extents = XmlChild(type=Extents)
     rotate = XmlAttribute(name='rot', default=None)
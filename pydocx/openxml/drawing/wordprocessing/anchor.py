@@ -12,4 +12,6 @@ from pydocx.openxml.drawing.graphic import Graphic
 class Anchor(XmlModel):
     XML_TAG = 'anchor'
 
+    __slots__ = ()
+
     graphic = XmlChild(type=Graphic)
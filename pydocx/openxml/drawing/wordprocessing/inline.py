@@ -12,4 +12,6 @@ from pydocx.openxml.drawing.graphic import Graphic
 class Inline(XmlModel):
     XML_TAG = 'inline'
 
+    __slots__ = ()
+
     graphic = XmlChild(type=Graphic)
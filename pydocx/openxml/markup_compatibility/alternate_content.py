@@ -11,4 +11,6 @@ from pydocx.openxml.markup_compatibility.fallback import Fallback
 
 class AlternateContent(XmlModel):
     XML_TAG = 'AlternateContent'
+
+    __slots__ = ()
     children = XmlCollection(Fallback)
@@ -11,6 +11,8 @@ from pydocx.models import XmlModel, XmlCollection
 class Fallback(XmlModel):
     XML_TAG = 'Fallback'
 
+    __slots__ = ()
+
     # It would be better to refer to the grandparent's children XmlCollection
     # lazily. The problem is that we don't have a good way to represent lazy
     # fields, nor do we have a way for those fields to reference their parents
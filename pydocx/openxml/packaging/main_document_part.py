@@ -11,7 +11,11 @@ from pydocx.openxml.packaging.image_part import ImagePart
 from pydocx.openxml.packaging.numbering_definitions_part import NumberingDefinitionsPart  # noqa
 from pydocx.openxml.packaging.open_xml_part import OpenXmlPart
 from pydocx.openxml.packaging.style_definitions_part import StyleDefinitionsPart  # noqa
-from pydocx.openxml.wordprocessing import Document
+from pydocx.openxml.wordprocessing import Body, Document, SectionProperties
+from pydocx.util.xml import (
+    iterparse_without_namespaces,
+    parse_trailing_element_without_namespaces,
+)
 
 
 class MainDocumentPart(OpenXmlPart):
@@ -53,6 +57,62 @@ class MainDocumentPart(OpenXmlPart):
         self._document = Document.load(self.root_element, container=self)
         return self._document
 
+    def load_streaming_document(self):
+        '''
+        Return a Document whose Body has no children. The children of the body
+        are loaded one at a time by `iter_body_children`, so the complete
+        document tree never has to be held in memory.
+        '''
+        body = Body(children=[])
+        return Document(body=body, container=self)
+
+    def iter_body_children(self, body):
+        '''
+        Incrementally parse the document and yield the children of the body
+        (paragraphs, tables, etc) one at a time as they are loaded. The
+        yielded children have `body` as their parent. Their XML elements are
+        discarded as soon as they have been loaded.
+        '''
+        stream = self.stream
+        if stream is None:
+            return
+        stream.seek(0)
+        elements = iterparse_without_namespaces(
+            stream,
+            depth=2,
+            xml_parser=self.xml_parser,
+        )
+        for element in elements:
+            if element.tag == SectionProperties.XML_TAG:
+                # Loaded separately by load_final_section_properties
+                continue
+            # Load the child in the same way that Body.load would
+            wrapper = element.makeelement(Body.XML_TAG, {})
+            wrapper.append(element)
+            loaded_body = Body.load(wrapper, container=self)
+            wrapper.clear()
+            for child in loaded_body.children:
+                child.parent = body
+                yield child
+
+    def load_final_section_properties(self):
+        '''
+        Return the section properties of the body without loading the rest of
+        the document. They are the last child of the body, so only the end of
+        the document is read.
+        '''
+        stream = self.stream
+        if stream is None:
+            return
+        section_properties = parse_trailing_element_without_namespaces(
+            stream,
+            tag=SectionProperties.XML_TAG,
+            parent_tag=Body.XML_TAG,
+            xml_parser=self.xml_parser,
+        )
+        if section_properties is not None:
+            return SectionProperties.load(section_properties, container=self)
+
     def get_relationship_lookup(self):
         package_lookup = self.open_xml_package.get_relationship_lookup()
         return package_lookup.get_part(self.uri)
@@ -7,6 +7,7 @@ from __future__ import (
 
 from pydocx.packaging import ZipPackage
 from pydocx.openxml.packaging.open_xml_part_container import OpenXmlPartContainer  # noqa
+from pydocx.util.xml import get_xml_parser
 
 
 class OpenXmlPackage(OpenXmlPartContainer):
@@ -16,6 +17,12 @@ class OpenXmlPackage(OpenXmlPartContainer):
     See also: http://msdn.microsoft.com/en-us/library/documentformat.openxml.packaging.openxmlpackage%28v=office.14%29.aspx  # noqa
     '''
 
-    def __init__(self, path):
+    def __init__(self, path, xml_parser=None):
         super(OpenXmlPackage, self).__init__()
         self.package = ZipPackage(path=path)
+        # The backend used to parse the xml of every part in this package.
+        # See pydocx.util.xml.get_xml_parser
+        self.xml_parser = get_xml_parser(xml_parser)
+
+    def close(self):
+        self.package.close()
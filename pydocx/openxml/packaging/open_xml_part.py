@@ -5,8 +5,9 @@ from __future__ import (
     unicode_literals,
 )
 
+from pydocx import tracing
 from pydocx.openxml.packaging.open_xml_part_container import OpenXmlPartContainer  # noqa
-from pydocx.util.xml import parse_xml_from_string
+from pydocx.util.xml import NamespaceStripper, parse_xml_without_namespaces
 
 
 class OpenXmlPart(OpenXmlPartContainer):
@@ -24,6 +25,9 @@ class OpenXmlPart(OpenXmlPartContainer):
     ):
         super(OpenXmlPart, self).__init__()
         self._root_element = None
+        # The set of the (namespace-free) tag and attribute names that occur
+        # in the part, or None if the part hasn't been parsed yet.
+        self.local_names = None
         self.uri = uri
         self.open_xml_package = open_xml_package
 
@@ -33,12 +37,19 @@ class OpenXmlPart(OpenXmlPartContainer):
             if self.stream is None:
                 return
             data = self.stream.read()
-            self._root_element = parse_xml_from_string(
-                xml=data,
-                remove_namespaces=True,
-            )
+            with tracing.trace('parse', uri=self.uri, bytes=len(data)):
+                stripper = NamespaceStripper(self.xml_parser)
+                self._root_element = parse_xml_without_namespaces(
+                    data,
+                    stripper=stripper,
+                )
+            self.local_names = set(stripper.local_names.values())
         return self._root_element
 
+    @property
+    def xml_parser(self):
+        return self.open_xml_package.xml_parser
+
     @property
     def package_part(self):
         return self.open_xml_package.package.get_part(self.uri)
@@ -9,6 +9,35 @@ from pydocx.openxml.packaging.open_xml_part import OpenXmlPart
 from pydocx.openxml.wordprocessing import Styles
 
 
+class ResolvedStyle(object):
+    '''
+    The result of resolving a style against the styles it is based on.
+
+    `style_chain` is the hierarchy of styles, ordered ascending (see
+    StyleDefinitionsPart.get_style_chain_stack).
+
+    `run_properties` is a dictionary of the run properties defined by the
+    styles in the chain, where a style's properties override those of the
+    styles it is based on. It is shared by everything that uses the style, so
+    it must not be modified.
+
+    `heading_style` is the nearest style in the chain that is a heading, or
+    None.
+    '''
+
+    def __init__(self, style_chain):
+        self.style_chain = tuple(style_chain)
+        self.run_properties = {}
+        for style in reversed(self.style_chain):
+            if style.run_properties:
+                self.run_properties.update(style.run_properties.fields)
+        self.heading_style = None
+        for style in self.style_chain:
+            if style.is_a_heading():
+                self.heading_style = style
+                break
+
+
 class StyleDefinitionsPart(OpenXmlPart):
     '''
     Represents style definitions within a Word document container.
@@ -27,6 +56,7 @@ class StyleDefinitionsPart(OpenXmlPart):
     def __init__(self, *args, **kwargs):
         super(StyleDefinitionsPart, self).__init__(*args, **kwargs)
         self._styles = None
+        self._resolved_styles = None
 
     @property
     def styles(self):
@@ -35,6 +65,31 @@ class StyleDefinitionsPart(OpenXmlPart):
         self._styles = Styles.load(self.root_element, container=self)
         return self._styles
 
+    @property
+    def resolved_styles(self):
+        '''
+        A dictionary of (style_type, style_id) to ResolvedStyle for every
+        style, so that resolving a style is a single lookup no matter how deep
+        its chain is.
+        '''
+        if self._resolved_styles is None:
+            resolved_styles = {}
+            for style_type, styles in self.styles.styles_by_type.items():
+                for style_id in styles:
+                    style_chain = self.get_style_chain_stack(style_type, style_id)
+                    resolved_styles[(style_type, style_id)] = ResolvedStyle(
+                        style_chain,
+                    )
+            self._resolved_styles = resolved_styles
+        return self._resolved_styles
+
+    def get_resolved_style(self, style_type, style_id):
+        '''
+        Return the ResolvedStyle for the given style_type and style_id, or None
+        if the style doesn't exist.
+        '''
+        return self.resolved_styles.get((style_type, style_id))
+
     def get_style_chain_stack(self, style_type, style_id):
         '''
         Given a style_type and style_id, return the hierarchy of styles ordered
@@ -11,6 +11,8 @@ from pydocx.models import XmlModel, XmlAttribute
 class ImageData(XmlModel):
     XML_TAG = 'imagedata'
 
+    __slots__ = ()
+
     # TODO We need namespaced attributes, because of conflicts like this. This
     # attribute is in the relationship namespace, and there's another attribute
     # named "id" which is in the default (in this case VML) namespace.
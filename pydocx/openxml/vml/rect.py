@@ -12,6 +12,8 @@ from pydocx.openxml.vml.image_data import ImageData
 class Rect(XmlModel):
     XML_TAG = 'rect'
 
+    __slots__ = ()
+
     style = XmlAttribute()
     children = XmlCollection(ImageData, 'vml.Textbox')
 
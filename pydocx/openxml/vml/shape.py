@@ -12,6 +12,8 @@ from pydocx.openxml.vml.image_data import ImageData
 class Shape(XmlModel):
     XML_TAG = 'shape'
 
+    __slots__ = ()
+
     style = XmlAttribute()
     children = XmlCollection(ImageData, 'vml.Textbox')
 
@@ -11,6 +11,8 @@ from pydocx.models import XmlModel, XmlCollection
 class Textbox(XmlModel):
     XML_TAG = 'textbox'
 
+    __slots__ = ()
+
     children = XmlCollection(
         'wordprocessing.TxBxContent',
     )
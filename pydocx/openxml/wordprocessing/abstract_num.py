@@ -12,6 +12,8 @@ from pydocx.openxml.wordprocessing.level import Level
 class AbstractNum(XmlModel):
     XML_TAG = 'abstractNum'
 
+    __slots__ = ('_levels',)
+
     abstract_num_id = XmlAttribute(name='abstractNumId')
     name = XmlChild(attrname='val')
 
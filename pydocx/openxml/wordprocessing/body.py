@@ -17,6 +17,8 @@ from pydocx.openxml.wordprocessing.sdt_block import SdtBlock
 class Body(XmlModel):
     XML_TAG = 'body'
 
+    __slots__ = ()
+
     children = XmlCollection(
         Paragraph,
         Table,
@@ -11,6 +11,8 @@ from pydocx.models import XmlAttribute, XmlModel
 class Break(XmlModel):
     XML_TAG = 'br'
 
+    __slots__ = ()
+
     break_type = XmlAttribute(name='type')
 
     def is_page_break(self):
@@ -13,6 +13,8 @@ from pydocx.openxml.wordprocessing.smart_tag_run import SmartTagRun
 class DeletedRun(XmlModel):
     XML_TAG = 'del'
 
+    __slots__ = ()
+
     children = XmlCollection(
         Run,
         SmartTagRun,
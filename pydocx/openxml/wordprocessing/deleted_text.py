@@ -11,4 +11,6 @@ from pydocx.models import XmlModel, XmlContent
 class DeletedText(XmlModel):
     XML_TAG = 'delText'
 
+    __slots__ = ()
+
     text = XmlContent()
@@ -12,5 +12,7 @@ from pydocx.openxml.wordprocessing.body import Body
 class Document(XmlModel):
     XML_TAG = 'document'
 
+    __slots__ = ()
+
     conformance = XmlAttribute(name='conformance')
     body = XmlChild(type=Body)
@@ -13,6 +13,8 @@ from pydocx.openxml.drawing.wordprocessing.inline import Inline
 class Drawing(XmlModel):
     XML_TAG = 'drawing'
 
+    __slots__ = ()
+
     anchor = XmlChild(type=Anchor)
     inline = XmlChild(type=Inline)
 
@@ -17,4 +17,6 @@ class EmbeddedObject(XmlModel):
 
     XML_TAG = 'object'
 
+    __slots__ = ()
+
     children = XmlCollection(Shape)
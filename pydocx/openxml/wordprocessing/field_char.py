@@ -11,6 +11,8 @@ from pydocx.models import XmlModel, XmlAttribute
 class FieldChar(XmlModel):
     XML_TAG = 'fldChar'
 
+    __slots__ = ()
+
     _char_type = XmlAttribute(name='fldCharType')
 
     @property
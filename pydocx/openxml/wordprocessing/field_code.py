@@ -11,4 +11,6 @@ from pydocx.models import XmlModel, XmlContent
 class FieldCode(XmlModel):
     XML_TAG = 'instrText'
 
+    __slots__ = ()
+
     content = XmlContent()
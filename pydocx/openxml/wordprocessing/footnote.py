@@ -15,6 +15,8 @@ from pydocx.openxml.wordprocessing.deleted_run import DeletedRun
 class Footnote(XmlModel):
     XML_TAG = 'footnote'
 
+    __slots__ = ()
+
     footnote_id = XmlAttribute(name='id')
 
     children = XmlCollection(
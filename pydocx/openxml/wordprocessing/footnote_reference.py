@@ -11,6 +11,8 @@ from pydocx.models import XmlModel, XmlAttribute
 class FootnoteReference(XmlModel):
     XML_TAG = 'footnoteReference'
 
+    __slots__ = ()
+
     footnote_id = XmlAttribute(name='id')
 
     @property
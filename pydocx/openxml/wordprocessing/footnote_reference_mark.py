@@ -10,3 +10,5 @@ from pydocx.models import XmlModel
 
 class FootnoteReferenceMark(XmlModel):
     XML_TAG = 'footnoteRef'
+
+    __slots__ = ()
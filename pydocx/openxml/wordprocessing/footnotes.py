@@ -12,6 +12,8 @@ from pydocx.openxml.wordprocessing.footnote import Footnote
 class Footnotes(XmlModel):
     XML_TAG = 'footnotes'
 
+    __slots__ = ('_footnote_by_id',)
+
     children = XmlCollection(Footnote)
 
     def __init__(self, *args, **kwargs):
@@ -14,6 +14,8 @@ from pydocx.util.memoize import memoized
 class Hyperlink(XmlModel):
     XML_TAG = 'hyperlink'
 
+    __slots__ = ()
+
     hyperlink_id = XmlAttribute(name='id')
     anchor = XmlAttribute(name='anchor')
     children = XmlCollection(
@@ -13,6 +13,8 @@ from pydocx.openxml.wordprocessing.smart_tag_run import SmartTagRun
 class InsertedRun(XmlModel):
     XML_TAG = 'ins'
 
+    __slots__ = ()
+
     children = XmlCollection(
         Run,
         SmartTagRun,
@@ -13,6 +13,8 @@ from pydocx.openxml.wordprocessing.paragraph_properties import ParagraphProperti
 class Level(XmlModel):
     XML_TAG = 'lvl'
 
+    __slots__ = ()
+
     level_id = XmlAttribute(name='ilvl')
     start = XmlChild(attrname='val')
     num_format = XmlChild(name='numFmt', attrname='val')
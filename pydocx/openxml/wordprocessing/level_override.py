@@ -12,6 +12,8 @@ from pydocx.openxml.wordprocessing.level import Level
 class LevelOverride(XmlModel):
     XML_TAG = 'lvlOverride'
 
+    __slots__ = ()
+
     level_id = XmlAttribute(name='ilvl')
     start_override = XmlChild(name='startOverride', attrname='val')
     level = XmlChild(type=Level)
@@ -10,3 +10,5 @@ from pydocx.models import XmlModel
 
 class NoBreakHyphen(XmlModel):
     XML_TAG = 'noBreakHyphen'
+
+    __slots__ = ()
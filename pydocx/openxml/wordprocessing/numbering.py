@@ -13,6 +13,8 @@ from pydocx.openxml.wordprocessing.numbering_instance import NumberingInstance
 class Numbering(XmlModel):
     XML_TAG = 'numbering'
 
+    __slots__ = ('_abstract_nums', '_nums')
+
     elements = XmlCollection(AbstractNum, NumberingInstance)
 
     def __init__(self, **kwargs):
@@ -12,6 +12,8 @@ from pydocx.openxml.wordprocessing.level_override import LevelOverride
 class NumberingInstance(XmlModel):
     XML_TAG = 'num'
 
+    __slots__ = ()
+
     num_id = XmlAttribute(name='numId')
     abstract_num_id = XmlChild(name='abstractNumId', attrname='val')
 
@@ -11,6 +11,8 @@ from pydocx.models import XmlModel, XmlChild
 class NumberingProperties(XmlModel):
     XML_TAG = 'numPr'
 
+    __slots__ = ()
+
     ROOT_LEVEL_ID = '0'
 
     level_id = XmlChild(name='ilvl', attrname='val')
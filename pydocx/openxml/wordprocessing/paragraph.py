@@ -21,6 +21,8 @@ from pydocx.openxml.wordprocessing.simple_field import SimpleField
 class Paragraph(XmlModel):
     XML_TAG = 'p'
 
+    __slots__ = ('_effective_properties', '_heading_style')
+
     properties = XmlChild(type=ParagraphProperties)
 
     children = XmlCollection(
@@ -50,6 +52,12 @@ class Paragraph(XmlModel):
         return self.has_ancestor(SdtBlock)
 
     def get_style_chain_stack(self):
+        resolved_style = self.get_resolved_style()
+        if resolved_style:
+            for style in resolved_style.style_chain:
+                yield style
+
+    def get_resolved_style(self):
         if not self.properties:
             return
 
@@ -62,20 +70,16 @@ class Paragraph(XmlModel):
         # doesn't have access to the style_definitions_part
         part = getattr(self.container, 'style_definitions_part', None)
         if part:
-            style_stack = part.get_style_chain_stack('paragraph', parent_style)
-            for result in style_stack:
-                yield result
+            return part.get_resolved_style('paragraph', parent_style)
 
     @property
     def heading_style(self):
         if hasattr(self, '_heading_style'):
             return getattr(self, '_heading_style')
-        style_stack = self.get_style_chain_stack()
         heading_style = None
-        for style in style_stack:
-            if style.is_a_heading():
-                heading_style = style
-                break
+        resolved_style = self.get_resolved_style()
+        if resolved_style:
+            heading_style = resolved_style.heading_style
         self.heading_style = heading_style
         return heading_style
 
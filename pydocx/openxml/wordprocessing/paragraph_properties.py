@@ -12,6 +12,8 @@ from pydocx.openxml.wordprocessing.numbering_properties import NumberingProperti
 class ParagraphProperties(XmlModel):
     XML_TAG = 'pPr'
 
+    __slots__ = ()
+
     parent_style = XmlChild(name='pStyle', attrname='val')
     numbering_properties = XmlChild(type=NumberingProperties)
     justification = XmlChild(name='jc', attrname='val')
@@ -12,4 +12,6 @@ from pydocx.openxml.vml import Shape, Rect
 class Picture(XmlModel):
     XML_TAG = 'pict'
 
+    __slots__ = ()
+
     children = XmlCollection(Shape, Rect)
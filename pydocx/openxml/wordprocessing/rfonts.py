@@ -11,6 +11,8 @@ from pydocx.models import XmlModel, XmlAttribute
 class RFonts(XmlModel):
     XML_TAG = 'rFonts'
 
+    __slots__ = ()
+
     hint = XmlAttribute(name='hint')
     ascii = XmlAttribute(name='ascii')
     h_ansi = XmlAttribute(name='hAnsi')
@@ -21,12 +21,13 @@ from pydocx.openxml.wordprocessing.footnote_reference import FootnoteReference
 from pydocx.openxml.wordprocessing.footnote_reference_mark import FootnoteReferenceMark
 from pydocx.openxml.wordprocessing.embedded_object import EmbeddedObject
 from pydocx.openxml.markup_compatibility import AlternateContent
-from pydocx.util.memoize import memoized
 
 
 class Run(XmlModel):
     XML_TAG = 'r'
 
+    __slots__ = ('_effective_properties',)
+
     properties = XmlChild(type=RunProperties)
 
     children = XmlCollection(
@@ -46,6 +47,12 @@ class Run(XmlModel):
     )
 
     def get_style_chain_stack(self):
+        resolved_style = self.get_resolved_style()
+        if resolved_style:
+            for style in resolved_style.style_chain:
+                yield style
+
+    def get_resolved_style(self):
         if not self.properties:
             return
 
@@ -58,34 +65,23 @@ class Run(XmlModel):
         # doesn't have access to the style_definitions_part
         part = getattr(self.container, 'style_definitions_part', None)
         if part:
-            style_stack = part.get_style_chain_stack('character', parent_style)
-            for result in style_stack:
-                yield result
+            return part.get_resolved_style('character', parent_style)
 
     def _get_properties_inherited_from_parent_paragraph(self):
         from pydocx.openxml.wordprocessing.paragraph import Paragraph
 
-        inherited_properties = {}
-
         parent_paragraph = self.get_first_ancestor(Paragraph)
         if parent_paragraph:
-            style_stack = parent_paragraph.get_style_chain_stack()
-            for style in reversed(list(style_stack)):
-                if style.run_properties:
-                    inherited_properties.update(
-                        dict(style.run_properties.fields),
-                    )
-        return inherited_properties
+            resolved_style = parent_paragraph.get_resolved_style()
+            if resolved_style:
+                return resolved_style.run_properties
+        return {}
 
     def _get_inherited_properties_from_parent_style(self):
-        inherited_properties = {}
-        style_stack = self.get_style_chain_stack()
-        for style in reversed(list(style_stack)):
-            if style.run_properties:
-                inherited_properties.update(
-                    dict(style.run_properties.fields),
-                )
-        return inherited_properties
+        resolved_style = self.get_resolved_style()
+        if resolved_style:
+            return resolved_style.run_properties
+        return {}
 
     @property
     def inherited_properties(self):
@@ -96,14 +92,22 @@ class Run(XmlModel):
         properties.update(
             self._get_inherited_properties_from_parent_style(),
         )
-        return RunProperties(**properties)
+        return RunProperties.get_interned(properties)
 
     @property
-    @memoized
     def effective_properties(self):
-        inherited_properties = self.inherited_properties
-        effective_properties = {}
-        effective_properties.update(dict(inherited_properties.fields))
+        try:
+            return self._effective_properties
+        except AttributeError:
+            pass
+        properties = {}
+        properties.update(
+            self._get_properties_inherited_from_parent_paragraph(),
+        )
+        properties.update(
+            self._get_inherited_properties_from_parent_style(),
+        )
         if self.properties:
-            effective_properties.update(dict(self.properties.fields))
-        return RunProperties(**effective_properties)
+            properties.update(self.properties.fields)
+        self._effective_properties = RunProperties.get_interned(properties)
+        return self._effective_properties
@@ -5,14 +5,25 @@ from __future__ import (
     unicode_literals,
 )
 
+import threading
+import weakref
+
 from pydocx.models import XmlModel, XmlChild
 from pydocx.types import OnOff, Underline
 from pydocx.openxml.wordprocessing.rfonts import RFonts
 
 
+# Interned RunProperties, keyed by their non-default fields. See
+# RunProperties.get_interned
+_interned_run_properties = weakref.WeakValueDictionary()
+_interned_run_properties_lock = threading.Lock()
+
+
 class RunProperties(XmlModel):
     XML_TAG = 'rPr'
 
+    __slots__ = ('_frozen',)
+
     bold = XmlChild(type=OnOff, name='b', attrname='val')
     italic = XmlChild(type=OnOff, name='i', attrname='val')
     underline = XmlChild(type=Underline, name='u', attrname='val')
@@ -29,6 +40,62 @@ class RunProperties(XmlModel):
     clr = XmlChild(name='color', attrname='val')
     r_fonts = XmlChild(type=RFonts)
 
+    def __init__(self, **kwargs):
+        # Set directly, since __setattr__ depends on it
+        object.__setattr__(self, '_frozen', False)
+        super(RunProperties, self).__init__(**kwargs)
+
+    def __setattr__(self, name, value):
+        if self._frozen and name in self._field_defaults:
+            raise AttributeError('Interned RunProperties are immutable')
+        super(RunProperties, self).__setattr__(name, value)
+
+    @classmethod
+    def get_interned(cls, properties):
+        '''
+        Given a dictionary of field names to values, return a RunProperties
+        with those fields. Identical combinations of (non-default) fields share
+        a single immutable instance, so most runs in a document end up sharing
+        a handful of instances, which can be compared by identity.
+
+        Models among the values (e.g. RFonts) are copied rather than adopted,
+        so they keep their parent, and the shared instance doesn't keep their
+        document alive. They are told apart by their fields.
+
+        If any of the values can't be hashed, a new mutable instance is
+        returned instead.
+        '''
+        fields = []
+        key = []
+        for field_name, field in cls.get_load_plan().fields:
+            value = properties.get(field_name, field.default)
+            if value != field.default:
+                fields.append((field_name, value))
+                if isinstance(value, XmlModel):
+                    value = value.get_fields_key()
+                key.append((field_name, value))
+        key = tuple(key)
+        try:
+            hash(key)
+        except TypeError:
+            return cls.from_fields(fields)
+        with _interned_run_properties_lock:
+            instance = _interned_run_properties.get(key)
+            if instance is None:
+                instance = cls.from_fields(fields)
+                instance._frozen = True
+                _interned_run_properties[key] = instance
+        return instance
+
+    @classmethod
+    def from_fields(cls, fields):
+        kwargs = {}
+        for field_name, value in fields:
+            if isinstance(value, XmlModel):
+                value = value.copy()
+            kwargs[field_name] = value
+        return cls(**kwargs)
+
     @property
     def color(self):
         if self.clr is None:
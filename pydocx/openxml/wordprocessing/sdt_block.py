@@ -12,4 +12,6 @@ from pydocx.openxml.wordprocessing.sdt_content_block import SdtContentBlock
 class SdtBlock(XmlModel):
     XML_TAG = 'sdt'
 
+    __slots__ = ()
+
     content = XmlChild(type=SdtContentBlock)
@@ -15,6 +15,8 @@ from pydocx.openxml.wordprocessing.deleted_run import DeletedRun
 class SdtContentBlock(XmlModel):
     XML_TAG = 'sdtContent'
 
+    __slots__ = ()
+
     children = XmlCollection(
         Paragraph,
         Table,
@@ -16,6 +16,8 @@ from pydocx.openxml.wordprocessing.deleted_run import DeletedRun
 class SdtContentRun(XmlModel):
     XML_TAG = 'sdtContent'
 
+    __slots__ = ()
+
     children = XmlCollection(
         Run,
         Hyperlink,
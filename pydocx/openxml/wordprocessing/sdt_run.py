@@ -12,4 +12,6 @@ from pydocx.openxml.wordprocessing.sdt_content_run import SdtContentRun
 class SdtRun(XmlModel):
     XML_TAG = 'sdt'
 
+    __slots__ = ()
+
     content = XmlChild(type=SdtContentRun)
@@ -11,4 +11,6 @@ from pydocx.models import XmlModel, XmlChild
 class SectionProperties(XmlModel):
     XML_TAG = 'sectPr'
 
+    __slots__ = ()
+
     page_size = XmlChild(name='pgSz', type=lambda el: dict(el.attrib))
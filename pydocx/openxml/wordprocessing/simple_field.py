@@ -20,6 +20,8 @@ from pydocx.openxml.wordprocessing.sdt_run import SdtRun
 class SimpleField(XmlModel):
     XML_TAG = 'fldSimple'
 
+    __slots__ = ()
+
     instr = XmlAttribute()
 
     children = XmlCollection(
@@ -12,6 +12,8 @@ from pydocx.openxml.wordprocessing.run import Run
 class SmartTagRun(XmlModel):
     XML_TAG = 'smartTag'
 
+    __slots__ = ()
+
     children = XmlCollection(
         Run,
         'wordprocessing.SmartTagRun',
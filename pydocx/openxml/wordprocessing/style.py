@@ -12,6 +12,8 @@ from pydocx.openxml.wordprocessing.run_properties import RunProperties
 class Style(XmlModel):
     XML_TAG = 'style'
 
+    __slots__ = ()
+
     style_type = XmlAttribute(name='type', default='paragraph')
     style_id = XmlAttribute(name='styleId', default='')
     name = XmlChild(attrname='val', default='')
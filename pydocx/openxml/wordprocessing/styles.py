@@ -14,6 +14,8 @@ from pydocx.openxml.wordprocessing.style import Style
 class Styles(XmlModel):
     XML_TAG = 'styles'
 
+    __slots__ = ('styles_by_type',)
+
     styles = XmlCollection(Style)
 
     def __init__(self, styles=None, *args, **kwargs):
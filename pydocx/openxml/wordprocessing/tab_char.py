@@ -10,3 +10,5 @@ from pydocx.models import XmlModel
 
 class TabChar(XmlModel):
     XML_TAG = 'tab'
+
+    __slots__ = ()
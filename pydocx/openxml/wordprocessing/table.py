@@ -14,6 +14,8 @@ from pydocx.openxml.wordprocessing.table_row import TableRow
 class Table(XmlModel):
     XML_TAG = 'tbl'
 
+    __slots__ = ()
+
     rows = XmlCollection(
         TableRow,
     )
@@ -13,6 +13,8 @@ from pydocx.openxml.wordprocessing.table_cell_properties import TableCellPropert
 class TableCell(XmlModel):
     XML_TAG = 'tc'
 
+    __slots__ = ()
+
     properties = XmlChild(type=TableCellProperties)
 
     children = XmlCollection(
@@ -11,6 +11,8 @@ from pydocx.models import XmlModel, XmlChild
 class TableCellProperties(XmlModel):
     XML_TAG = 'tcPr'
 
+    __slots__ = ()
+
     grid_span = XmlChild(name='gridSpan', attrname='val')
 
     vertical_merge = XmlChild(name='vMerge', type=lambda el: dict(el.attrib))  # noqa
@@ -12,6 +12,8 @@ from pydocx.openxml.wordprocessing.table_cell import TableCell
 class TableRow(XmlModel):
     XML_TAG = 'tr'
 
+    __slots__ = ()
+
     cells = XmlCollection(
         TableCell,
     )
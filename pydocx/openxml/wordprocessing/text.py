@@ -11,4 +11,6 @@ from pydocx.models import XmlModel, XmlContent
 class Text(XmlModel):
     XML_TAG = 't'
 
+    __slots__ = ()
+
     text = XmlContent()
@@ -10,6 +10,8 @@ from pydocx.models import XmlModel, XmlCollection
 
 class TxBxContent(XmlModel):
     XML_TAG = 'txbxContent'
+
+    __slots__ = ()
     children = XmlCollection(
         'wordprocessing.Paragraph',
         'wordprocessing.Table',
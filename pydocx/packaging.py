@@ -5,16 +5,16 @@ from __future__ import (
 )
 
 import posixpath
-import zipfile
 from collections import defaultdict
 from io import BytesIO
 
-from pydocx.exceptions import MalformedDocxException
+from pydocx import tracing
 from pydocx.util.xml import (
     parse_xml_from_string,
     xml_tag_split,
     XmlNamespaceManager,
 )
+from pydocx.util.zip import BufferStream, get_zip_source
 
 
 class PackageRelationship(object):
@@ -163,7 +163,7 @@ class ZipPackagePart(PackageRelationshipManager):
 
     @property
     def stream(self):
-        return self.package.streams[self.uri]
+        return self.package.get_stream(self.uri)
 
 
 class ZipPackage(PackageRelationshipManager):
@@ -180,26 +180,80 @@ class ZipPackage(PackageRelationshipManager):
         self.streams = {}
         self.uri = '/'
         self._parts = None
+        self._source = None
+        self._zip_file = None
+        self._archive_members = {}
         self.relationship_uri = ZipPackagePart.get_relationship_part_uri(
             self.uri,
         )
 
+    @property
+    def source(self):
+        '''
+        The ZipSource that provides the archive. `path` may be a path, a
+        file-like object, or a bytes-like object holding the archive.
+        '''
+        if self._source is None:
+            self._source = get_zip_source(self.path)
+        return self._source
+
+    def _open_zip_file(self):
+        if self._zip_file is None:
+            self._zip_file = self.source.open_zip_file()
+        return self._zip_file
+
     def _load_parts(self):
         if self.path is None:
             return
-        try:
-            f = zipfile.ZipFile(self.path)
-        except zipfile.BadZipfile:
-            raise MalformedDocxException()
-        try:
-            uris = f.namelist()
-            for uri in uris:
-                data = f.read(uri)
-                self.streams[self.uri + uri] = BytesIO(data)
-        finally:
-            f.close()
-        for uri in self.streams:
-            self.create_part(uri)
+        # Only the archive directory is read here. The data for each part is
+        # decompressed on demand the first time the part's stream is accessed.
+        with tracing.trace('open_archive') as info:
+            f = self._open_zip_file()
+            zip_infos = f.infolist()
+            for zip_info in zip_infos:
+                uri = self.uri + zip_info.filename
+                self._archive_members[uri] = zip_info
+                self.create_part(uri)
+            info['parts'] = len(zip_infos)
+
+    def get_stream(self, uri):
+        '''
+        Return the stream for the part at the given uri. Parts stored in the
+        archive are decompressed the first time they are requested, and the
+        resulting stream is kept for subsequent requests. Parts stored without
+        compression are returned as read-only views of the archive if the
+        source allows it.
+        '''
+        stream = self.streams.get(uri)
+        if stream is None:
+            zip_info = self._archive_members.get(uri)
+            if zip_info is None:
+                raise KeyError(uri)
+            with tracing.trace(
+                'decompress',
+                uri=uri,
+                compressed_bytes=zip_info.compress_size,
+                bytes=zip_info.file_size,
+            ):
+                view = self.source.get_stored_member_view(zip_info)
+                if view is not None:
+                    stream = BufferStream(view)
+                else:
+                    stream = BytesIO(self._open_zip_file().read(zip_info))
+            self.streams[uri] = stream
+        return stream
+
+    def close(self):
+        '''
+        Release the handle to the underlying archive. Streams that were already
+        decompressed remain available, and the archive is re-opened if a part
+        that has not been read yet is requested afterwards.
+        '''
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+        if self._source is not None:
+            self._source.close()
 
     def get_part_container(self):
         return self
@@ -4,14 +4,36 @@ from __future__ import (
     unicode_literals,
 )
 
-from pydocx.export import PyDocXHTMLExporter, PyDocXMarkdownExporter
+# The exporters (and the models that they import) are only imported when
+# they're first used, which keeps `import pydocx` cheap. See
+# tests/test_import_time.py
 
 
 class PyDocX(object):
     @staticmethod
     def to_html(path_or_stream):
+        from pydocx.export import PyDocXHTMLExporter
         return PyDocXHTMLExporter(path_or_stream).export()
 
+    @staticmethod
+    def to_html_stream(path_or_stream, output_stream, encoding='utf-8'):
+        '''
+        Write the html to the binary file-like `output_stream` as it's
+        generated. See PyDocXHTMLExporter.export_to
+        '''
+        from pydocx.export import PyDocXHTMLExporter
+        PyDocXHTMLExporter(path_or_stream).export_to(output_stream, encoding)
+
     @staticmethod
     def to_markdown(path_or_stream):
+        from pydocx.export import PyDocXMarkdownExporter
         return PyDocXMarkdownExporter(path_or_stream).export()
+
+    @staticmethod
+    def convert_many(paths, format='html', workers=None, **kwargs):
+        '''
+        Convert many documents in parallel, yielding a ConversionResult for
+        each one. See pydocx.batch.convert_many
+        '''
+        from pydocx import batch
+        return batch.convert_many(paths, format=format, workers=workers, **kwargs)
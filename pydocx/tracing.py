@@ -0,0 +1,121 @@
+# coding: utf-8
+'''
+Hooks around the phases of a conversion, so that tracing tools can attribute
+the time spent converting a document.
+
+A hook is a callable that's called with the name of a phase and a dictionary
+of information about it, whenever a phase starts. It may return a context
+manager, which is entered right away and exited when the phase ends. The
+dictionary is filled in as the phase goes on (e.g. with the number of bytes
+that were parsed), so it's complete when the context manager is exited:
+
+>>> from contextlib import contextmanager
+>>> @contextmanager
+... def print_phase(phase, info):
+...     yield
+...     print(phase, sorted(info.items()))
+>>> add_hook(print_phase)
+>>> with trace('parse', uri='/word/document.xml') as info:
+...     info['bytes'] = 1024
+parse [('bytes', 1024), ('uri', '/word/document.xml')]
+>>> remove_hook(print_phase)
+
+The phases, and the information about each of them, are:
+
+open_archive
+    Reading the directory of the docx archive. `parts` is the number of
+    parts in the archive.
+decompress
+    Reading (and usually decompressing) a part of the archive. `uri` is the
+    part, `compressed_bytes` and `bytes` are its size before and after
+    decompression.
+parse
+    Parsing the xml of a part. `uri` is the part and `bytes` is the size of
+    the xml.
+load
+    Constructing the models of a part (or of a body child, when the body is
+    streamed). `model` is the name of the model class of the root and
+    `nodes` is the number of models that were constructed.
+first_pass
+    Collecting the complex fields of the document. `complex_field_runs` is
+    the number of runs that make up complex fields.
+numbering_spans
+    Grouping the children of a body or table cell into numbering spans.
+    `nodes` is the number of children and `items` is the number of top level
+    items (spans and other children) that resulted. Not traced when the body
+    is streamed, since the spans are then built as the body is loaded.
+render
+    Exporting the document. `results` is the number of results that were
+    produced.
+
+When no hook is registered, tracing costs next to nothing.
+'''
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+hooks = []
+
+
+def add_hook(hook):
+    '''
+    Register a hook that's called whenever a phase starts, in every thread.
+    '''
+    hooks.append(hook)
+
+
+def remove_hook(hook):
+    hooks.remove(hook)
+
+
+class Trace(object):
+    '''
+    The context manager returned by `trace` while hooks are registered.
+    '''
+
+    def __init__(self, phase, info):
+        self.phase = phase
+        self.info = info
+        self.contexts = []
+
+    def __enter__(self):
+        for hook in list(hooks):
+            context = hook(self.phase, self.info)
+            if context is not None:
+                context.__enter__()
+                self.contexts.append(context)
+        return self.info
+
+    def __exit__(self, exc_type, exc_value, tb):
+        while self.contexts:
+            self.contexts.pop().__exit__(exc_type, exc_value, tb)
+        # Exceptions are never suppressed
+        return False
+
+
+class NoTrace(object):
+    '''
+    The context manager returned by `trace` while no hooks are registered.
+    '''
+
+    def __init__(self, info):
+        self.info = info
+
+    def __enter__(self):
+        return self.info
+
+    def __exit__(self, exc_type, exc_value, tb):
+        return False
+
+
+def trace(phase, **info):
+    '''
+    Return a context manager around the given phase, which passes the phase to
+    the registered hooks. Entering it returns the `info` dictionary, which may
+    be filled in until the phase ends.
+    '''
+    if hooks:
+        return Trace(phase, info)
+    return NoTrace(info)
@@ -6,12 +6,35 @@ from __future__ import (
 
 
 class SimpleType(object):
+    '''
+    Simple types are compared and hashed by their type and value, so that
+    equal values can be shared.
+
+    >>> OnOff('on') == OnOff('on')
+    True
+    >>> OnOff('on') == OnOff('off')
+    False
+    >>> OnOff('none') == Underline('none')
+    False
+    '''
+
     def __init__(self, value):
         self.value = value
 
     def __bool__(self):
         return self.__nonzero__()
 
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return False
+        return self.value == other.value
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((type(self), self.value))
+
 
 class OnOff(SimpleType):
     '''
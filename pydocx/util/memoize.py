@@ -5,8 +5,61 @@ from __future__ import (
     unicode_literals,
 )
 
-import collections
 import functools
+import threading
+import weakref
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    '''
+    A dictionary-like cache that holds at most `maxsize` items. When it is
+    full, the least recently used item is evicted. If `maxsize` is None, the
+    cache is unbounded.
+
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache.set('a', 1)
+    >>> cache.set('b', 2)
+    >>> cache.get('a')
+    1
+    >>> cache.set('c', 3)
+    >>> 'b' in cache
+    False
+    >>> sorted(cache.keys())
+    ['a', 'c']
+    '''
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def __len__(self):
+        return len(self.items)
+
+    def keys(self):
+        return self.items.keys()
+
+    def get(self, key, default=None):
+        try:
+            value = self.items.pop(key)
+        except KeyError:
+            return default
+        # Move the key to the end, as the most recently used
+        self.items[key] = value
+        return value
+
+    def set(self, key, value):
+        self.items.pop(key, None)
+        self.items[key] = value
+        if self.maxsize is not None:
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+
+_missing = object()
 
 
 class memoized(object):
@@ -14,26 +67,98 @@ class memoized(object):
     Decorator. Caches a function's return value each time it is called.
     If called later with the same arguments, the cached value is returned
     (not reevaluated).
+
+    When used on a method, each instance gets its own cache, which is only
+    weakly referenced by the decorator: the cached values go away with the
+    instance instead of living as long as the process. Each cache holds at
+    most `maxsize` values, evicting the least recently used ones first.
+    Calls whose first argument can't be weakly referenced share a single
+    cache that is bounded in the same way.
+
+    The caches are safe to use from several threads. The function itself is
+    called without holding the lock, so two threads may occasionally compute
+    the same value.
+
+    Use either as `@memoized` or as `@memoized(maxsize=100)`.
     '''
 
-    def __init__(self, func):
+    default_maxsize = 1024
+
+    def __new__(cls, func=None, maxsize=_missing):
+        if func is None:
+            # Called with arguments, as @memoized(maxsize=...)
+            if maxsize is _missing:
+                maxsize = cls.default_maxsize
+            return functools.partial(cls, maxsize=maxsize)
+        return super(memoized, cls).__new__(cls)
+
+    def __init__(self, func, maxsize=_missing):
+        if maxsize is _missing:
+            maxsize = self.default_maxsize
         self.func = func
-        self.cache = {}
+        self.maxsize = maxsize
+        self.lock = threading.RLock()
+        # Shared by the calls whose first argument can't be weakly referenced
+        self.cache = LRUCache(maxsize=maxsize)
+        # first argument (usually the instance) -> LRUCache
+        self.instance_caches = weakref.WeakKeyDictionary()
 
-    def __call__(self, *args):
-        if not isinstance(args, collections.Hashable):
+    def get_cache(self, args, create=False):
+        '''
+        Return the cache that stores the value for the given arguments, and the
+        key within that cache. If the value cannot be cached, the cache is
+        None.
+
+        The values are cached per first argument (the instance, for methods)
+        if it can be weakly referenced. Otherwise, they are kept in a cache
+        shared by all calls.
+        '''
+        try:
+            hash(args)
+        except TypeError:
             # uncacheable. a list, for instance.
             # better to not cache than blow up.
-            return self.func(*args)
-        if args in self.cache:
-            return self.cache[args]
-        else:
-            value = self.func(*args)
-            self.set_cache(value, *args)
-            return value
+            return None, None
+        if not args:
+            return self.cache, args
+        instance, key = args[0], args[1:]
+        try:
+            cache = self.instance_caches.get(instance)
+        except TypeError:
+            # The first argument can't be weakly referenced
+            return self.cache, args
+        if cache is None and create:
+            cache = LRUCache(maxsize=self.maxsize)
+            self.instance_caches[instance] = cache
+        return cache, key
+
+    def __call__(self, *args):
+        with self.lock:
+            cache, key = self.get_cache(args)
+            if cache is not None:
+                value = cache.get(key, _missing)
+                if value is not _missing:
+                    return value
+        value = self.func(*args)
+        self.set_cache(value, *args)
+        return value
 
     def set_cache(self, value, *args):
-        self.cache[args] = value
+        with self.lock:
+            cache, key = self.get_cache(args, create=True)
+            if cache is not None:
+                cache.set(key, value)
+
+    def clear(self, instance=_missing):
+        '''
+        Forget the cached values of the given instance, or the values in the
+        shared cache if no instance is given.
+        '''
+        with self.lock:
+            if instance is _missing:
+                self.cache = LRUCache(maxsize=self.maxsize)
+            else:
+                self.instance_caches.pop(instance, None)
 
     def __repr__(self):
         '''Return the function's docstring.'''
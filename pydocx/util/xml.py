@@ -4,17 +4,60 @@ from __future__ import (
     unicode_literals,
 )
 
+import os
 import re
+import threading
 from xml.etree import cElementTree
 from xml.parsers.expat import ExpatError
 
 try:
-    from defusedxml.cElementTree import fromstring
+    from defusedxml.cElementTree import fromstring, iterparse
     cElementTree.fromstring = fromstring
+    cElementTree.iterparse = iterparse
 except ImportError:
     pass
 
+try:
+    from defusedxml import EntitiesForbidden
+except ImportError:
+    EntitiesForbidden = None
+
 from pydocx.exceptions import MalformedDocxException
+from pydocx.util.memoize import memoized
+
+# The name of the parser backend to use when none is given explicitly. See
+# get_xml_parser
+XML_PARSER_ENVIRONMENT_VARIABLE = 'PYDOCX_XML_PARSER'
+
+
+@memoized
+def get_lxml_etree():
+    '''
+    Return lxml.etree, or None if lxml isn't installed. lxml is only imported
+    when it's first needed, since importing it is relatively slow.
+    '''
+    try:
+        from lxml import etree
+    except ImportError:
+        return None
+    return etree
+
+
+_sax_quoteattr = None
+
+
+def quoteattr(data):
+    '''
+    xml.sax.saxutils.quoteattr, which is only imported when it's first needed,
+    since importing xml.sax.saxutils imports urllib.request as well.
+
+    >>> quoteattr('a < b')
+    '"a &lt; b"'
+    '''
+    global _sax_quoteattr
+    if _sax_quoteattr is None:
+        from xml.sax.saxutils import quoteattr as _sax_quoteattr
+    return _sax_quoteattr(data)
 
 
 def filter_children(element, tags):
@@ -37,31 +80,433 @@ def el_iter(el):
             yield child
 
 
-def xml_remove_namespaces(xml_bytes):
-    """
-    Given a stream of xml bytes, strip all namespaces from tag and attribute
-    names.
-    """
+class ElementTreeXmlParser(object):
+    '''
+    Parses xml using the standard library's cElementTree. If defusedxml is
+    installed, entity declarations and external references are rejected.
+    '''
+
+    name = 'etree'
+
+    def fromstring(self, xml):
+        return cElementTree.fromstring(xml)
+
+    def iterparse(self, source, events):
+        return cElementTree.iterparse(source, events=events)
+
+    def tostring(self, element, encoding='utf-8'):
+        return cElementTree.tostring(element, encoding=encoding)
+
+    def iter_elements(self, root):
+        return el_iter(root)
+
+    def set_attributes(self, element, attributes):
+        element.attrib = attributes
+
+
+class LxmlXmlParser(ElementTreeXmlParser):
+    '''
+    Parses xml using lxml. Documents that declare entities are rejected, and
+    DTDs and network access are never loaded. lxml's limits on the depth of
+    the tree and the size of its text are kept, unless `huge_tree` is set.
+    Comments and processing instructions are dropped.
+
+    lxml parsers can't be shared between threads, so each thread gets its
+    own.
+    '''
+
+    name = 'lxml'
+
+    parser_options = dict(
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        remove_comments=True,
+        remove_pis=True,
+    )
+
+    def __init__(self, huge_tree=False):
+        self.etree = get_lxml_etree()
+        if self.etree is None:
+            raise ImportError('The lxml xml parser requires lxml')
+        self.huge_tree = huge_tree
+        self.local = threading.local()
+
+    @property
+    def parser(self):
+        try:
+            return self.local.parser
+        except AttributeError:
+            self.local.parser = self.etree.XMLParser(
+                huge_tree=self.huge_tree,
+                **self.parser_options
+            )
+            return self.local.parser
+
+    def fromstring(self, xml):
+        if not isinstance(xml, bytes):
+            # lxml refuses unicode strings that have an encoding declaration
+            xml = xml.encode('utf-8')
+        root = self.etree.fromstring(xml, parser=self.parser)
+        self.forbid_entities(root)
+        return root
+
+    def iterparse(self, source, events):
+        events = self.etree.iterparse(
+            source,
+            events=events,
+            **self.parser_options
+        )
+        checked = False
+        for event, element in events:
+            if not checked:
+                self.forbid_entities(element)
+                checked = True
+            yield event, element
+
+    def forbid_entities(self, element):
+        '''
+        Raise an exception if the document containing `element` declares any
+        entities, in the same way that defusedxml does for cElementTree.
+        '''
+        dtd = element.getroottree().docinfo.internalDTD
+        if dtd is None:
+            return
+        for entity in dtd.iterentities():
+            if EntitiesForbidden is None:
+                raise MalformedDocxException(
+                    'Entity declarations are not allowed',
+                )
+            raise EntitiesForbidden(
+                entity.name,
+                entity.content,
+                None,
+                None,
+                None,
+                None,
+            )
+
+    def tostring(self, element, encoding='utf-8'):
+        # Drop the namespace declarations that are no longer used
+        self.etree.cleanup_namespaces(element)
+        return self.etree.tostring(element, encoding=encoding)
+
+    def iter_elements(self, root):
+        # Skip unresolved entity references
+        return root.iter(self.etree.Element)
+
+    def set_attributes(self, element, attributes):
+        # lxml does not allow attrib to be replaced
+        attrib = element.attrib
+        attrib.clear()
+        attrib.update(attributes)
+
+
+XML_PARSERS = dict(
+    (parser_class.name, parser_class)
+    for parser_class in [
+        ElementTreeXmlParser,
+        LxmlXmlParser,
+    ]
+)
+
+_xml_parser_instances = {}
+
+
+def get_xml_parser(xml_parser=None):
+    '''
+    Return the xml parser backend for the given name. `xml_parser` may be one
+    of the names in XML_PARSERS, 'auto' to use lxml if it is installed and
+    cElementTree otherwise, or an already constructed parser, which is
+    returned as is.
+
+    If no parser is given, the name is taken from the PYDOCX_XML_PARSER
+    environment variable, defaulting to 'etree'.
+
+    >>> get_xml_parser('etree').name
+    'etree'
+    >>> get_xml_parser('sax')
+    Traceback (most recent call last):
+    ...
+    ValueError: Unknown xml parser: sax
+    '''
+    if xml_parser is None:
+        xml_parser = os.environ.get(XML_PARSER_ENVIRONMENT_VARIABLE) or 'etree'
+    if hasattr(xml_parser, 'fromstring'):
+        return xml_parser
+    name = xml_parser
+    if name == 'auto':
+        name = 'etree' if get_lxml_etree() is None else 'lxml'
+    if name not in _xml_parser_instances:
+        if name not in XML_PARSERS:
+            raise ValueError('Unknown xml parser: {0}'.format(name))
+        _xml_parser_instances[name] = XML_PARSERS[name]()
+    return _xml_parser_instances[name]
+
+
+class NamespaceStripper(object):
+    '''
+    Removes the namespace from element tags and attribute names in place.
+
+    Namespaced names are translated using a table that is filled as new names
+    are encountered, so each distinct name is only split once no matter how
+    many times it occurs in the tree.
+    '''
+
+    def __init__(self, xml_parser=None):
+        self.xml_parser = get_xml_parser(xml_parser)
+        self.local_names = {}
+
+    def get_local_name(self, name):
+        try:
+            return self.local_names[name]
+        except KeyError:
+            local_name = name.rpartition('}')[2]
+            self.local_names[name] = local_name
+            return local_name
+
+    def strip_element(self, element):
+        '''
+        Strip the namespaces from the given element, but not its children.
+        '''
+        local_names = self.local_names
+        tag = element.tag
+        try:
+            element.tag = local_names[tag]
+        except KeyError:
+            element.tag = self.get_local_name(tag)
+        attrib = element.attrib
+        if attrib:
+            get_local_name = self.get_local_name
+            self.xml_parser.set_attributes(element, dict(
+                (get_local_name(name), value)
+                for name, value in attrib.items()
+            ))
+
+    def strip(self, root):
+        '''
+        Strip the namespaces from the given element and all of its descendants.
+        '''
+        strip_element = self.strip_element
+        for element in self.xml_parser.iter_elements(root):
+            strip_element(element)
+        return root
+
+
+def parse_xml_without_namespaces(xml, xml_parser=None, stripper=None):
+    '''
+    Parse the given xml and return the root element with all namespaces
+    stripped from tag and attribute names. The xml is only parsed once; the
+    names are rewritten on the resulting tree.
+
+    If a NamespaceStripper is given, it is used instead of `xml_parser`, and
+    its `local_names` afterwards hold every name that occurs in the xml.
+    '''
+    if stripper is None:
+        stripper = NamespaceStripper(xml_parser)
     try:
-        root = parse_xml_from_string(xml_bytes, remove_namespaces=False)
+        root = stripper.xml_parser.fromstring(xml)
     except (SyntaxError, ExpatError):
         raise MalformedDocxException('This document cannot be converted.')
-    for child in el_iter(root):
-        child.tag = child.tag.split("}")[-1]
-        child.attrib = dict(
-            (k.split("}")[-1], v)
-            for k, v in child.attrib.items()
+    return stripper.strip(root)
+
+
+# Python 2's cElementTree only accepts native strings as iterparse events
+ITERPARSE_EVENTS = (str('start'), str('end'))
+
+
+def iterparse_without_namespaces(source, depth, tags=None, xml_parser=None):
+    '''
+    Incrementally parse the xml from the file-like `source`, and yield each
+    element at the given `depth` as soon as the element is complete. The
+    children of the root element are at depth 1. Yielded elements have their
+    namespaces stripped and have been detached from their parent, so that they
+    can be garbage collected as soon as the caller no longer references them.
+
+    If `tags` is given, only elements with one of those (namespace-free) tag
+    names are yielded. The others are discarded without being processed.
+    '''
+    stripper = NamespaceStripper(xml_parser)
+    open_elements = []
+    events = stripper.xml_parser.iterparse(source, events=ITERPARSE_EVENTS)
+    try:
+        for event, element in events:
+            if event == 'start':
+                open_elements.append(element)
+                continue
+            open_elements.pop()
+            if len(open_elements) != depth:
+                continue
+            open_elements[-1].remove(element)
+            if tags is not None:
+                if stripper.get_local_name(element.tag) not in tags:
+                    continue
+            yield stripper.strip(element)
+    except (SyntaxError, ExpatError):
+        raise MalformedDocxException('This document cannot be converted.')
+
+
+XML_ROOT_START_TAG_PATTERN = re.compile(br'<([^?!\s/>]+)[^>]*>')
+
+
+def parse_trailing_element_without_namespaces(
+    source,
+    tag,
+    parent_tag,
+    xml_parser=None,
+    chunk_size=4096,
+):
+    '''
+    Return the element with the given (namespace-free) `tag` name if it is the
+    last child of the last `parent_tag` element in the xml from the seekable
+    file-like `source`, or None otherwise. The element's namespaces are
+    stripped.
+
+    Usually, only the root start tag (for its namespace declarations) and as
+    much of the end of the xml as the element takes up are read and parsed,
+    so the element is found without parsing the rest of the document. If the
+    end of the xml isn't laid out as expected (e.g. a comment follows the
+    element, or the xml isn't encoded in utf-8), the entire xml is parsed
+    instead. The position of `source` is left unchanged.
+    '''
+    position = source.tell()
+    try:
+        element = _parse_trailing_element_without_namespaces(
+            source,
+            tag,
+            parent_tag,
+            xml_parser,
+            chunk_size,
         )
+        if element is None:
+            source.seek(0)
+            element = _find_trailing_element_without_namespaces(
+                source,
+                tag,
+                parent_tag,
+                xml_parser,
+            )
+        return element
+    finally:
+        source.seek(position)
+
+
+def _find_trailing_element_without_namespaces(source, tag, parent_tag, xml_parser):
+    stripper = NamespaceStripper(xml_parser)
+    open_elements = []
+    last_child = None
+    element = None
+    events = stripper.xml_parser.iterparse(source, events=ITERPARSE_EVENTS)
+    try:
+        for event, parsed_element in events:
+            if event == 'start':
+                open_elements.append(parsed_element)
+                continue
+            open_elements.pop()
+            local_name = stripper.get_local_name(parsed_element.tag)
+            if local_name == parent_tag:
+                element = last_child
+                last_child = None
+                continue
+            if not open_elements:
+                continue
+            parent = open_elements[-1]
+            if stripper.get_local_name(parent.tag) == parent_tag:
+                last_child = None
+                if local_name == tag:
+                    last_child = parsed_element
+                # The other children aren't needed once they're complete
+                parent.remove(parsed_element)
+    except (SyntaxError, ExpatError):
+        return
+    if element is not None:
+        return stripper.strip(element)
+
+
+def _parse_trailing_element_without_namespaces(
+    source,
+    tag,
+    parent_tag,
+    xml_parser,
+    chunk_size,
+):
+    prefix = br'(?:[^\s<>/:]+:)?'
+    parent_end_pattern = re.compile(
+        br'</' + prefix + parent_tag.encode('ascii') + br'\s*>',
+    )
+    tag_pattern = re.compile(
+        br'<(/?)' + prefix + tag.encode('ascii') + br'(?=[\s/>])[^>]*>',
+    )
+
+    source.seek(0)
+    head = b''
+    root_start = None
+    while root_start is None:
+        data = source.read(chunk_size)
+        if not data:
+            return
+        head += data
+        root_start = XML_ROOT_START_TAG_PATTERN.search(head)
+    head = head[:root_start.end()]
+    root_end = b'</' + root_start.group(1) + b'>'
+
+    source.seek(0, os.SEEK_END)
+    size = source.tell()
+    length = chunk_size
+    while True:
+        start = max(0, size - length)
+        source.seek(start)
+        tail = source.read(size - start)
+        parent_ends = list(parent_end_pattern.finditer(tail))
+        if parent_ends:
+            fragment = tail[:parent_ends[-1].start()].rstrip()
+            tags = list(tag_pattern.finditer(fragment))
+            if start > 0 and b'<' not in fragment:
+                # The last tag of the parent starts before the tail
+                tags = []
+            elif not tags or tags[-1].end() != len(fragment):
+                # The last child is some other element
+                return
+            # Walk back to the start tag that matches the last end tag, since
+            # the element may contain elements of the same name
+            depth = 0
+            for match in reversed(tags):
+                if match.group(1):
+                    depth += 1
+                elif not match.group(0).endswith(b'/>'):
+                    depth -= 1
+                if depth == 0:
+                    xml = head + fragment[match.start():] + root_end
+                    try:
+                        root = parse_xml_without_namespaces(
+                            xml,
+                            xml_parser=xml_parser,
+                        )
+                    except MalformedDocxException:
+                        return
+                    return root[0]
+        if start == 0:
+            return
+        length *= 2
+
+
+def xml_remove_namespaces(xml_bytes, xml_parser=None):
+    """
+    Given a stream of xml bytes, strip all namespaces from tag and attribute
+    names.
+    """
+    xml_parser = get_xml_parser(xml_parser)
+    root = parse_xml_without_namespaces(xml_bytes, xml_parser=xml_parser)
     # Regardless of whatever the original encoding was
     # (fromstring deals with it for us), always deal in terms of utf-8
     # internally.
-    return cElementTree.tostring(root, encoding='utf-8')
+    return xml_parser.tostring(root, encoding='utf-8')
 
 
-def parse_xml_from_string(xml, remove_namespaces=False):
+def parse_xml_from_string(xml, remove_namespaces=False, xml_parser=None):
     if remove_namespaces:
-        xml = xml_remove_namespaces(xml)
-    return cElementTree.fromstring(xml)
+        return parse_xml_without_namespaces(xml, xml_parser=xml_parser)
+    return get_xml_parser(xml_parser).fromstring(xml)
 
 
 def convert_dictionary_to_style_fragment(style):
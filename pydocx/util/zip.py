@@ -4,11 +4,21 @@ from __future__ import (
     unicode_literals,
 )
 
+import io
+import mmap
+import os
+import struct
 import zipfile
 from contextlib import contextmanager
 from io import BytesIO
 
 from pydocx.exceptions import MalformedDocxException
+from pydocx.util.memoize import memoized
+
+ZIP_SIGNATURES = (
+    b'PK\x03\x04',  # local file header
+    b'PK\x05\x06',  # end of central directory (empty archive)
+)
 
 
 @contextmanager
@@ -43,3 +53,240 @@ def create_zip_archive(paths_to_data):
                 continue
             zf.writestr(arcname, data.encode('utf-8'))
     return archive
+
+
+def is_zip_data(obj):
+    '''
+    Return True if `obj` is a bytes-like object holding the contents of a zip
+    archive, as opposed to a path to one.
+
+    >>> is_zip_data(b'PK\\x03\\x04...')
+    True
+    >>> is_zip_data(bytearray(b'PK\\x05\\x06'))
+    True
+    >>> is_zip_data(b'document.docx')
+    False
+    >>> is_zip_data('document.docx')
+    False
+    '''
+    if isinstance(obj, (bytearray, memoryview)):
+        return True
+    if isinstance(obj, bytes):
+        return obj[:4] in ZIP_SIGNATURES
+    return False
+
+
+class BufferStream(io.RawIOBase):
+    '''
+    A read-only, seekable file-like object over a buffer. Unlike BytesIO,
+    wrapping a buffer does not copy it, and `getbuffer` returns a read-only
+    view of the data instead of a copy.
+    '''
+
+    def __init__(self, buffer):
+        super(BufferStream, self).__init__()
+        view = memoryview(buffer)
+        toreadonly = getattr(view, 'toreadonly', None)
+        if callable(toreadonly):
+            view = toreadonly()
+        self._view = view
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def getbuffer(self):
+        return self._view
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError('Invalid whence ({0})'.format(whence))
+        if position < 0:
+            raise IOError('Negative seek position {0}'.format(position))
+        self._position = position
+        return position
+
+    def read(self, size=-1):
+        start = min(self._position, len(self._view))
+        if size is None or size < 0:
+            end = len(self._view)
+        else:
+            end = min(start + size, len(self._view))
+        self._position = end
+        return self._view[start:end].tobytes()
+
+    def readall(self):
+        return self.read()
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+
+class ZipSource(object):
+    '''
+    Provides access to the zip archive backing a ZipPackage. Use
+    `get_zip_source` to create the appropriate source for a path, stream or
+    buffer.
+    '''
+
+    def open_zip_file(self):
+        raise NotImplementedError
+
+    def get_stored_member_view(self, zip_info):
+        '''
+        If the member described by `zip_info` is stored without compression,
+        and the source can address the archive's bytes directly, return a
+        read-only view of the member's data. Otherwise, return None.
+        '''
+        return None
+
+    def close(self):
+        pass
+
+
+class PathOrStreamZipSource(ZipSource):
+    '''
+    Reads the archive through zipfile from a path or a file-like object.
+    '''
+
+    def __init__(self, path_or_stream):
+        self.path_or_stream = path_or_stream
+
+    def open_zip_file(self):
+        try:
+            return zipfile.ZipFile(self.path_or_stream)
+        except zipfile.BadZipfile:
+            raise MalformedDocxException()
+
+
+class BufferZipSource(ZipSource):
+    '''
+    Reads the archive from a bytes-like object without copying it. Members
+    stored without compression are handed out as views into the buffer.
+    '''
+
+    def __init__(self, buffer=None):
+        self.buffer = None
+        if buffer is not None:
+            self.buffer = BufferStream(buffer).getbuffer()
+
+    def get_buffer(self):
+        return self.buffer
+
+    def open_zip_file(self):
+        try:
+            return zipfile.ZipFile(BufferStream(self.get_buffer()))
+        except zipfile.BadZipfile:
+            raise MalformedDocxException()
+
+    def get_stored_member_view(self, zip_info):
+        if zip_info.compress_type != zipfile.ZIP_STORED:
+            return None
+        if zip_info.flag_bits & 0x1:
+            # Encrypted
+            return None
+        buffer = self.get_buffer()
+        header_start = zip_info.header_offset
+        header_end = header_start + zipfile.sizeFileHeader
+        header = buffer[header_start:header_end].tobytes()
+        if len(header) != zipfile.sizeFileHeader:
+            raise MalformedDocxException()
+        header = struct.unpack(zipfile.structFileHeader, header)
+        if header[0] != zipfile.stringFileHeader:
+            raise MalformedDocxException()
+        # The local header may have a different extra field than the central
+        # directory, so the data offset has to be computed from the local one
+        data_start = header_end + header[zipfile._FH_FILENAME_LENGTH]
+        data_start += header[zipfile._FH_EXTRA_FIELD_LENGTH]
+        data_end = data_start + zip_info.file_size
+        if data_end > len(buffer):
+            raise MalformedDocxException()
+        return buffer[data_start:data_end]
+
+
+class MemoryMappedZipSource(BufferZipSource):
+    '''
+    Memory-maps the archive at the given path, so that its bytes are paged in
+    by the operating system instead of being read into memory up front.
+    '''
+
+    def __init__(self, path):
+        super(MemoryMappedZipSource, self).__init__()
+        self.path = path
+        self._mmap = None
+
+    def get_buffer(self):
+        if self.buffer is None:
+            with open(self.path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.buffer = memoryview(self._mmap)
+        return self.buffer
+
+    def close(self):
+        if self._mmap is None:
+            return
+        self.buffer.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views of stored members are still referenced. The mapping is
+            # released once the last of them is garbage collected.
+            pass
+        self.buffer = None
+        self._mmap = None
+
+
+@memoized
+def memory_maps_are_buffers():
+    '''
+    Return True if a memoryview can be made of a memory-mapped file. Python
+    2's mmap doesn't support the buffer interface, so files can't be mapped
+    there.
+    '''
+    mapping = mmap.mmap(-1, 1)
+    try:
+        view = memoryview(mapping)
+    except TypeError:
+        return False
+    else:
+        view.release()
+        return True
+    finally:
+        mapping.close()
+
+
+def get_zip_source(path_or_stream):
+    '''
+    Return the ZipSource for the given path, file-like object or bytes-like
+    object.
+    '''
+    if isinstance(path_or_stream, ZipSource):
+        return path_or_stream
+    if is_zip_data(path_or_stream):
+        return BufferZipSource(path_or_stream)
+    if hasattr(path_or_stream, 'read'):
+        return PathOrStreamZipSource(path_or_stream)
+    try:
+        size = os.path.getsize(path_or_stream)
+    except (EnvironmentError, TypeError, ValueError):
+        size = 0
+    if not size:
+        # Empty or missing files cannot be mapped. Let zipfile report them.
+        return PathOrStreamZipSource(path_or_stream)
+    if not memory_maps_are_buffers():
+        return PathOrStreamZipSource(path_or_stream)
+    return MemoryMappedZipSource(path_or_stream)
@@ -0,0 +1,78 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+from io import BytesIO
+
+from pydocx import PyDocX
+from pydocx.openxml.packaging import MainDocumentPart
+from pydocx.test import DocumentGeneratorTestCase
+from pydocx.test.testcases import PyDocXHTMLExporterNoStyle
+from pydocx.test.utils import WordprocessingDocumentFactory
+
+
+class WriteCountingStream(BytesIO):
+    def __init__(self, *args, **kwargs):
+        super(WriteCountingStream, self).__init__(*args, **kwargs)
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super(WriteCountingStream, self).write(data)
+
+
+class ExportToTestCase(DocumentGeneratorTestCase):
+    document_xml = '''
+        <p><r><t>AAA</t></r></p>
+        <p><r><t>ÀÉÎ</t></r></p>
+        <p><r><t>BBB</t></r></p>
+    '''
+
+    def get_exporter(self, exporter_class=PyDocXHTMLExporterNoStyle):
+        document = WordprocessingDocumentFactory()
+        document.add(MainDocumentPart, self.document_xml)
+        return exporter_class(self.get_zip_archive_for_document(document))
+
+    def test_same_html_as_export(self):
+        stream = BytesIO()
+        self.get_exporter().export_to(stream)
+        self.assertEqual(
+            stream.getvalue().decode('utf-8'),
+            self.get_exporter().export(),
+        )
+
+    def test_html_is_written_in_chunks(self):
+        class SmallBufferExporter(PyDocXHTMLExporterNoStyle):
+            export_to_buffer_size = 10
+
+        stream = WriteCountingStream()
+        self.get_exporter(SmallBufferExporter).export_to(stream)
+        html = self.get_exporter().export()
+        self.assertTrue(stream.writes > 1)
+        self.assertTrue(stream.writes <= len(html) // 10 + 1)
+        self.assertEqual(stream.getvalue().decode('utf-8'), html)
+
+    def test_html_is_written_in_a_single_chunk_if_it_fits_the_buffer(self):
+        stream = WriteCountingStream()
+        self.get_exporter().export_to(stream)
+        self.assertEqual(stream.writes, 1)
+
+    def test_encoding(self):
+        class SmallBufferExporter(PyDocXHTMLExporterNoStyle):
+            export_to_buffer_size = 10
+
+        stream = BytesIO()
+        self.get_exporter(SmallBufferExporter).export_to(stream, encoding='utf-16')
+        self.assertEqual(
+            stream.getvalue().decode('utf-16'),
+            self.get_exporter().export(),
+        )
+
+    def test_to_html_stream(self):
+        path = 'tests/fixtures/inline_tags.docx'
+        stream = BytesIO()
+        PyDocX.to_html_stream(path, stream)
+        self.assertEqual(stream.getvalue().decode('utf-8'), PyDocX.to_html(path))
@@ -6,9 +6,9 @@ from __future__ import (
     unicode_literals,
 )
 
-
 from pydocx.openxml.packaging import MainDocumentPart, StyleDefinitionsPart
 from pydocx.test import DocumentGeneratorTestCase
+from pydocx.test.testcases import PyDocXHTMLExporterNoStyle
 from pydocx.test.utils import WordprocessingDocumentFactory
 
 
@@ -342,3 +342,71 @@ class HyperlinkTestCase(DocumentGeneratorTestCase):
 
         expected_html = '<p>Link: <a href="http://www.google.com/#awesome">AAA</a>.</p>'
         self.assert_document_generates_html(document, expected_html)
+
+
+class StreamBodyPyDocXHTMLExporter(PyDocXHTMLExporterNoStyle):
+    stream_body = True
+
+
+class StreamBodyFieldCodeTestCase(FieldCodeTestCase):
+    exporter = StreamBodyPyDocXHTMLExporter
+
+
+class StreamBodyHyperlinkTestCase(HyperlinkTestCase):
+    exporter = StreamBodyPyDocXHTMLExporter
+
+
+class IterationCountingList(list):
+    def __iter__(self):
+        self.iterations += 1
+        return super(IterationCountingList, self).__iter__()
+
+
+class ChildIterationCountingExporter(PyDocXHTMLExporterNoStyle):
+    # How many times the children of each paragraph were iterated while
+    # converting the complex fields
+    iterations = []
+
+    def _convert_complex_fields_into_simple_fields(self):
+        paragraphs = []
+        for paragraph in self.main_document_part.document.body.children:
+            paragraph.children = IterationCountingList(paragraph.children)
+            paragraph.children.iterations = 0
+            paragraphs.append(paragraph.children)
+        exporter = super(ChildIterationCountingExporter, self)
+        exporter._convert_complex_fields_into_simple_fields()
+        self.iterations.extend(children.iterations for children in paragraphs)
+
+
+class ManyFieldsTestCase(DocumentGeneratorTestCase):
+    exporter = ChildIterationCountingExporter
+
+    field_xml = '''
+        <r><fldChar fldCharType="begin"/></r>
+        <r><instrText> HYPERLINK "http://www.google.com/{index}"</instrText></r>
+        <r><fldChar fldCharType="separate"/></r>
+        <r><t>{index}</t></r>
+        <r><fldChar fldCharType="end"/></r>
+        <r><t>.</t></r>
+    '''
+
+    def setUp(self):
+        del ChildIterationCountingExporter.iterations[:]
+
+    def test_paragraph_with_1000_fields(self):
+        count = 1000
+        document_xml = '<p>{0}</p>'.format(''.join(
+            self.field_xml.format(index=index)
+            for index in range(count)
+        ))
+        document = WordprocessingDocumentFactory()
+        document.add(MainDocumentPart, document_xml)
+
+        expected_html = '<p>{0}</p>'.format(''.join(
+            '<a href="http://www.google.com/{index}">{index}</a>.'.format(index=index)
+            for index in range(count)
+        ))
+        self.assert_document_generates_html(document, expected_html)
+        # Splicing the fields into the paragraph one at a time goes through
+        # its children once per field, which is quadratic
+        self.assertEqual(ChildIterationCountingExporter.iterations, [1])
@@ -0,0 +1,89 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+from unittest import TestCase
+
+from pydocx.export.html import HtmlTag, PyDocXHTMLExporter
+
+
+class HtmlTagTestCase(TestCase):
+    def test_to_html(self):
+        self.assertEqual(HtmlTag('p').to_html(), '<p>')
+        self.assertEqual(HtmlTag('p').close().to_html(), '</p>')
+        self.assertEqual(
+            HtmlTag('span', **{'class': 'a', 'style': 'b'}).to_html(),
+            '<span class="a" style="b">',
+        )
+        self.assertEqual(
+            HtmlTag('hr', allow_self_closing=True).to_html(),
+            '<hr />',
+        )
+
+    def test_closing_tag(self):
+        closed = HtmlTag('td', colspan='2').close()
+        self.assertTrue(closed.closed)
+        self.assertEqual(closed.to_html(), '</td>')
+
+    def test_subclass_is_rendered_by_itself(self):
+        class UpperCaseHtmlTag(HtmlTag):
+            def get_html_attrs(self):
+                return super(UpperCaseHtmlTag, self).get_html_attrs().upper()
+
+        self.assertEqual(HtmlTag('p', id='a').to_html(), '<p id="a">')
+        self.assertEqual(UpperCaseHtmlTag('p', id='a').to_html(), '<p ID="A">')
+
+
+class RenderTagTestCase(TestCase):
+    def setUp(self):
+        self.exporter = PyDocXHTMLExporter('unused.docx')
+
+    def test_markup_is_rendered_once_per_distinct_tag(self):
+        render_tag = self.exporter.render_tag
+        self.assertEqual(render_tag(HtmlTag('span', **{'class': 'a'})), '<span class="a">')
+        self.assertEqual(render_tag(HtmlTag('span', **{'class': 'a'})), '<span class="a">')
+        self.assertEqual(len(self.exporter.rendered_tags), 1)
+        self.assertEqual(render_tag(HtmlTag('span', **{'class': 'b'})), '<span class="b">')
+        self.assertEqual(len(self.exporter.rendered_tags), 2)
+
+    def test_tags_that_only_differ_in_self_closing_are_not_confused(self):
+        self.assertEqual(self.exporter.render_tag(HtmlTag('br')), '<br>')
+        self.assertEqual(
+            self.exporter.render_tag(HtmlTag('br', allow_self_closing=True)),
+            '<br />',
+        )
+
+    def test_closing_tags_are_rendered_once_per_tag_name(self):
+        render_tag = self.exporter.render_tag
+        self.assertEqual(render_tag(HtmlTag('td', colspan='2').close()), '</td>')
+        self.assertEqual(render_tag(HtmlTag('td').close()), '</td>')
+        self.assertEqual(self.exporter.rendered_closing_tags, {'td': '</td>'})
+
+    def test_each_exporter_has_its_own_cache(self):
+        self.exporter.render_tag(HtmlTag('p'))
+        self.assertEqual(PyDocXHTMLExporter('unused.docx').rendered_tags, {})
+
+    def test_cache_size_is_bounded(self):
+        max_size = self.exporter.rendered_tags_max_size
+        for index in range(max_size + 10):
+            self.exporter.render_tag(HtmlTag('a', href='#{0}'.format(index)))
+        self.assertTrue(len(self.exporter.rendered_tags) <= max_size)
+
+    def test_unhashable_attribute(self):
+        tag = HtmlTag('p', id=['a'])
+        self.assertEqual(self.exporter.render_tag(tag), tag.to_html())
+        self.assertEqual(self.exporter.rendered_tags, {})
+
+    def test_subclass_is_rendered_by_itself(self):
+        class UpperCaseHtmlTag(HtmlTag):
+            def get_html_attrs(self):
+                return super(UpperCaseHtmlTag, self).get_html_attrs().upper()
+
+        self.assertEqual(self.exporter.render_tag(HtmlTag('p', id='a')), '<p id="a">')
+        self.assertEqual(
+            self.exporter.render_tag(UpperCaseHtmlTag('p', id='a')),
+            '<p ID="A">',
+        )
@@ -259,3 +259,63 @@ class TableTestCase(DocumentGeneratorTestCase):
             <p>AAA</p>
         '''
         self.assert_document_generates_html(document, expected_html)
+
+    def test_each_alternate_content_is_replaced_by_its_own_fallback(self):
+        document_xml = '''
+            <p>
+                <r>
+                    <AlternateContent>
+                        <Fallback>
+                            <t>AAA</t>
+                        </Fallback>
+                    </AlternateContent>
+                    <t>BBB</t>
+                    <AlternateContent>
+                        <Fallback>
+                            <t>CCC</t>
+                        </Fallback>
+                    </AlternateContent>
+                </r>
+            </p>
+        '''
+
+        document = WordprocessingDocumentFactory()
+        document.add(MainDocumentPart, document_xml)
+
+        expected_html = '''
+            <p>AAABBBCCC</p>
+        '''
+        self.assert_document_generates_html(document, expected_html)
+
+    def test_fallback_contains_a_field(self):
+        document_xml = '''
+        <AlternateContent>
+            <Fallback>
+                <p>
+                    <r>
+                        <fldChar fldCharType="begin"/>
+                    </r>
+                    <r>
+                        <instrText> HYPERLINK "http://www.google.com/"</instrText>
+                    </r>
+                    <r>
+                        <fldChar fldCharType="separate"/>
+                    </r>
+                    <r>
+                        <t>AAA</t>
+                    </r>
+                    <r>
+                        <fldChar fldCharType="end"/>
+                    </r>
+                </p>
+            </Fallback>
+        </AlternateContent>
+        '''
+
+        document = WordprocessingDocumentFactory()
+        document.add(MainDocumentPart, document_xml)
+
+        expected_html = '''
+            <p><a href="http://www.google.com/">AAA</a></p>
+        '''
+        self.assert_document_generates_html(document, expected_html)
@@ -6,7 +6,10 @@ from __future__ import (
     unicode_literals,
 )
 
-from pydocx.export.numbering_span import BaseNumberingSpanBuilder
+from pydocx.export.numbering_span import (
+    BaseNumberingSpanBuilder,
+    NumberingSpan,
+)
 from pydocx.test import DocumentGeneratorTestCase
 from pydocx.test.utils import (
     PyDocXHTMLExporterNoStyle,
@@ -1114,6 +1117,81 @@ class NumberingTestCase(NumberingTestBase, DocumentGeneratorTestCase):
         self.assert_document_generates_html(document, expected_html)
 
 
+class NumberingSpanLookaheadTestCase(NumberingTestBase, DocumentGeneratorTestCase):
+    def get_document(self, paragraphs_between_items):
+        numbering_xml = self.simple_list_definition.format(
+            num_id=1,
+            num_format='decimal',
+        )
+        document_xml = ''.join([
+            self.simple_list_item.format(content='AAA', num_id=1, ilvl=0),
+            '<p><r><t>Foo</t></r></p>' * paragraphs_between_items,
+            self.simple_list_item.format(content='BBB', num_id=1, ilvl=0),
+        ])
+        document = WordprocessingDocumentFactory()
+        document.add(NumberingDefinitionsPart, numbering_xml)
+        document.add(MainDocumentPart, document_xml)
+        return document
+
+    def export(self, document, lookahead):
+        class LookaheadExporter(PyDocXHTMLExporterNoStyle):
+            numbering_span_lookahead = lookahead
+
+        zip_archive = self.get_zip_archive_for_document(document)
+        return LookaheadExporter(zip_archive).export()
+
+    def test_list_continues_within_the_lookahead(self):
+        document = self.get_document(paragraphs_between_items=2)
+        self.assertEqual(
+            self.export(document, lookahead=2),
+            self.export(document, lookahead=None),
+        )
+
+    def test_list_is_restarted_beyond_the_lookahead(self):
+        self.exporter = type(
+            str('LookaheadExporter'),
+            (PyDocXHTMLExporterNoStyle,),
+            {'numbering_span_lookahead': 1},
+        )
+        expected_html = '''
+            <ol class="pydocx-list-style-type-decimal">
+                <li>AAA</li>
+            </ol>
+            <p>Foo</p>
+            <p>Foo</p>
+            <ol class="pydocx-list-style-type-decimal">
+                <li>BBB</li>
+            </ol>
+        '''
+        self.assert_document_generates_html(
+            self.get_document(paragraphs_between_items=2),
+            expected_html,
+        )
+
+    def test_items_are_yielded_as_soon_as_they_are_complete(self):
+        document = self.get_document(paragraphs_between_items=10)
+        exporter = PyDocXHTMLExporterNoStyle(
+            self.get_zip_archive_for_document(document),
+        )
+        children = exporter.main_document_part.document.body.children
+        consumed = []
+
+        def yield_children():
+            for child in children:
+                consumed.append(child)
+                yield child
+
+        builder = exporter.numbering_span_builder_class(yield_children())
+        items = builder.iter_numbering_spans(lookahead=3)
+        numbering_span = next(items)
+        self.assertTrue(isinstance(numbering_span, NumberingSpan))
+        # The list item, and the paragraphs that were held until there were
+        # more than the lookahead
+        self.assertEqual(len(consumed), 1 + 4)
+        self.assertEqual(len(list(items)), 11)
+        self.assertEqual(len(consumed), len(children))
+
+
 class FakedNumberingManyItemsTestCase(NumberingTestBase, DocumentGeneratorTestCase):
     def assert_html(self, list_type, digit_generator):
         paragraphs = []
@@ -0,0 +1,79 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+from io import BytesIO
+
+from pydocx.export.html import PyDocXHTMLExporter
+from pydocx.openxml.packaging import MainDocumentPart
+from pydocx.test import DocumentGeneratorTestCase
+from pydocx.test.testcases import PyDocXHTMLExporterNoStyle
+from pydocx.test.utils import WordprocessingDocumentFactory
+
+
+class StyleClassesExporter(PyDocXHTMLExporter):
+    style_classes = True
+
+
+class StyleClassesTestCase(DocumentGeneratorTestCase):
+    document_xml = '''
+        <p>
+            <pPr><ind left="720"/></pPr>
+            <r><rPr><color val="FF0000"/></rPr><t>AAA</t></r>
+        </p>
+        <p>
+            <pPr><ind left="720"/></pPr>
+            <r><rPr><color val="FF0000"/></rPr><t>BBB</t></r>
+            <r><rPr><color val="0000FF"/></rPr><t>CCC</t></r>
+        </p>
+    '''
+
+    def get_archive(self):
+        document = WordprocessingDocumentFactory()
+        document.add(MainDocumentPart, self.document_xml)
+        return self.get_zip_archive_for_document(document)
+
+    def test_styles_are_replaced_by_classes(self):
+        html = StyleClassesExporter(self.get_archive()).export()
+        style, body = html.split('</style>')
+        self.assertTrue(style.endswith(
+            '.pydocx-s1 {margin-left:3.00em}'
+            '.pydocx-s2 {color:#FF0000}'
+            '.pydocx-s3 {color:#0000FF}'
+        ))
+        self.assertFalse('style=' in body)
+        self.assertEqual(body.count('class="pydocx-s1"'), 2)
+        self.assertEqual(body.count('class="pydocx-s2"'), 2)
+        self.assertEqual(body.count('class="pydocx-s3"'), 1)
+
+    def test_inline_styles_by_default(self):
+        html = PyDocXHTMLExporter(self.get_archive()).export()
+        self.assertFalse('pydocx-s1' in html)
+        self.assertEqual(html.count('style="color:#FF0000"'), 2)
+
+    def test_export_to(self):
+        exporter = StyleClassesExporter(self.get_archive())
+        expected_html = exporter.export()
+        stream = BytesIO()
+        StyleClassesExporter(self.get_archive()).export_to(stream)
+        self.assertEqual(stream.getvalue().decode('utf-8'), expected_html)
+
+    def test_visitor_engine(self):
+        class VisitorEngineExporter(StyleClassesExporter):
+            visitor_engine = True
+
+        html = VisitorEngineExporter(self.get_archive()).export()
+        style, body = html.split('</style>')
+        self.assertFalse('style=' in body)
+        self.assertEqual(style.count(' {color:#'), 2)
+        self.assertEqual(style.count(' {margin-left:3.00em}'), 1)
+
+    def test_without_a_style_block(self):
+        class NoStyleExporter(PyDocXHTMLExporterNoStyle):
+            style_classes = True
+
+        html = NoStyleExporter(self.get_archive()).export()
+        self.assertTrue(html.endswith('</html>'))
@@ -0,0 +1,437 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+from pydocx.export.html import HtmlTag, is_not_empty_and_not_only_whitespace
+from pydocx.export.visitor import ExportPlaceholder
+from pydocx.openxml import wordprocessing
+from pydocx.openxml.packaging import (
+    FootnotesPart,
+    MainDocumentPart,
+    NumberingDefinitionsPart,
+)
+from pydocx.test import DocumentGeneratorTestCase
+from pydocx.test.testcases import PyDocXHTMLExporterNoStyle
+from pydocx.test.utils import WordprocessingDocumentFactory
+
+
+class FirstPassCountingExporter(PyDocXHTMLExporterNoStyle):
+    def __init__(self, *args, **kwargs):
+        super(FirstPassCountingExporter, self).__init__(*args, **kwargs)
+        self.scanned_nodes = []
+
+    def first_pass_scan(self, node):
+        self.scanned_nodes.append(node)
+        return super(FirstPassCountingExporter, self).first_pass_scan(node)
+
+
+class FirstPassTestCase(DocumentGeneratorTestCase):
+    exporter = FirstPassCountingExporter
+
+    def export(self, document_xml):
+        document = WordprocessingDocumentFactory()
+        document.add(MainDocumentPart, document_xml)
+        exporter = self.exporter(self.get_zip_archive_for_document(document))
+        html = exporter.export()
+        return exporter, html
+
+    def test_document_without_fields_is_not_scanned(self):
+        exporter, html = self.export('''
+            <p><r><t>AAA</t></r></p>
+            <p><r><t>BBB</t></r></p>
+        ''')
+        self.assertEqual(exporter.scanned_nodes, [])
+        self.assertTrue('<p>AAA</p>' in html)
+
+    def test_document_with_a_complex_field_is_scanned(self):
+        exporter, html = self.export('''
+            <p>
+                <r><fldChar fldCharType="begin"/></r>
+                <r><instrText> HYPERLINK "http://www.google.com/"</instrText></r>
+                <r><fldChar fldCharType="separate"/></r>
+                <r><t>AAA</t></r>
+                <r><fldChar fldCharType="end"/></r>
+            </p>
+        ''')
+        self.assertEqual(len(exporter.scanned_nodes), 1)
+        self.assertTrue('<a href="http://www.google.com/">AAA</a>' in html)
+
+    def test_document_with_alternate_content_is_scanned(self):
+        exporter, html = self.export('''
+            <p><r><AlternateContent><Fallback><t>AAA</t></Fallback></AlternateContent></r></p>
+        ''')
+        self.assertEqual(len(exporter.scanned_nodes), 1)
+        self.assertTrue('<p>AAA</p>' in html)
+
+    def test_streaming_body_scans_each_child(self):
+        class StreamingExporter(FirstPassCountingExporter):
+            stream_body = True
+
+        self.exporter = StreamingExporter
+        exporter, html = self.export('''
+            <p><r><t>AAA</t></r></p>
+            <p><r><t>BBB</t></r></p>
+        ''')
+        self.assertEqual(len(exporter.scanned_nodes), 2)
+        self.assertTrue('<p>BBB</p>' in html)
+
+
+class VisitorEngineExporter(PyDocXHTMLExporterNoStyle):
+    visitor_engine = True
+
+
+class VisitorEngineTestCase(DocumentGeneratorTestCase):
+    exporter = VisitorEngineExporter
+
+    def export(self, document_xml, exporter=None, parts=()):
+        document = WordprocessingDocumentFactory()
+        for part, xml in parts:
+            document.add(part, xml)
+        document.add(MainDocumentPart, document_xml)
+        if exporter is None:
+            exporter = self.exporter
+        return exporter(self.get_zip_archive_for_document(document)).export()
+
+    def assert_engines_generate_the_same_html(self, document_xml, parts=()):
+        self.assertEqual(
+            self.export(document_xml, parts=parts),
+            self.export(document_xml, exporter=PyDocXHTMLExporterNoStyle, parts=parts),
+        )
+
+    def test_deeply_nested_tables(self):
+        # lxml limits the depth of the tree by default
+        class EtreeExporter(VisitorEngineExporter):
+            xml_parser = 'etree'
+
+        depth = 100
+        document_xml = '<p><r><t>AAA</t></r></p>'
+        for _ in range(depth):
+            document_xml = '<tbl><tr><tc>{0}</tc></tr></tbl>'.format(document_xml)
+        html = self.export(document_xml, exporter=EtreeExporter)
+        self.assertEqual(html.count('<table border="1">'), depth)
+        self.assertTrue('<td>AAA</td>' in html)
+
+    def test_overridden_export_method_is_used(self):
+        class UpperCaseExporter(VisitorEngineExporter):
+            def export_text(self, text):
+                yield text.text.upper()
+
+        html = self.export(
+            '<p><r><t>aaa</t></r></p>',
+            exporter=UpperCaseExporter,
+        )
+        self.assertTrue('<p>AAA</p>' in html)
+
+    def test_overridden_method_that_calls_export_node_is_used(self):
+        class SdtExporter(VisitorEngineExporter):
+            def export_sdt(self, sdt):
+                yield 'sdt'
+
+        html = self.export(
+            '<sdt><sdtContent><p><r><t>AAA</t></r></p></sdtContent></sdt>',
+            exporter=SdtExporter,
+        )
+        self.assertTrue('sdt' in html)
+        self.assertFalse('AAA' in html)
+
+    def test_results_are_yielded_as_they_are_produced(self):
+        class ParagraphCountingExporter(VisitorEngineExporter):
+            exported_paragraphs = 0
+
+            def export_paragraph(self, paragraph):
+                self.exported_paragraphs += 1
+                return super(ParagraphCountingExporter, self).export_paragraph(
+                    paragraph,
+                )
+
+        document = WordprocessingDocumentFactory()
+        document.add(MainDocumentPart, '''
+            <p><r><t>AAA</t></r></p>
+            <p><r><t>BBB</t></r></p>
+            <p><r><t>CCC</t></r></p>
+        ''')
+        exporter = ParagraphCountingExporter(self.get_zip_archive_for_document(document))
+        results = exporter.export_root(exporter.main_document_part.document)
+        for result in results:
+            self.assertFalse(isinstance(result, ExportPlaceholder))
+            if isinstance(result, HtmlTag) and result.closed and result.tag == 'p':
+                break
+        self.assertEqual(exporter.exported_paragraphs, 1)
+        list(results)
+        self.assertEqual(exporter.exported_paragraphs, 3)
+
+    def test_overridden_method_can_look_at_the_results_of_its_children(self):
+        class EmptyRunExporter(VisitorEngineExporter):
+            def export_run(self, run):
+                results = super(EmptyRunExporter, self).export_run(run)
+                results = is_not_empty_and_not_only_whitespace(results)
+                if results is None:
+                    return ['(empty)']
+                return results
+
+        html = self.export(
+            '''
+            <p>
+                <r><t>AAA</t></r>
+                <r><t xml:space="preserve"> </t></r>
+                <r><rPr><b/></rPr><t>BBB</t></r>
+            </p>
+            ''',
+            exporter=EmptyRunExporter,
+        )
+        self.assertTrue('<p>AAA(empty)<strong>BBB</strong></p>' in html)
+
+    def test_overridden_method_gets_the_results_of_its_children(self):
+        class JoiningExporter(VisitorEngineExporter):
+            def export_paragraph(self, paragraph):
+                results = list(super(JoiningExporter, self).export_paragraph(
+                    paragraph,
+                ))
+                for result in results:
+                    assert not isinstance(result, ExportPlaceholder)
+                text = ''.join(
+                    result for result in results
+                    if not isinstance(result, HtmlTag)
+                )
+                yield '[{0}]'.format(text)
+
+        document_xml = '''
+            <p><r><t>AAA</t></r><r><rPr><b/></rPr><t>BBB</t></r></p>
+            <tbl><tr><tc><p><r><t>CCC</t></r></p></tc></tr></tbl>
+        '''
+        html = self.export(document_xml, exporter=JoiningExporter)
+        self.assertTrue('[AAABBB]' in html)
+        self.assertTrue('<td>[CCC]</td>' in html)
+
+        class GeneratorEngineJoiningExporter(JoiningExporter):
+            visitor_engine = False
+
+        self.assertEqual(
+            html,
+            self.export(document_xml, exporter=GeneratorEngineJoiningExporter),
+        )
+
+    def test_overridden_helper_method_gets_the_results_of_its_children(self):
+        class BoldExporter(VisitorEngineExporter):
+            def export_run_property_bold(self, run, results):
+                results = list(results)
+                for result in results:
+                    assert not isinstance(result, ExportPlaceholder)
+                return ['*'] + results + ['*']
+
+        html = self.export(
+            '<p><r><rPr><b/></rPr><t>AAA</t></r></p>',
+            exporter=BoldExporter,
+        )
+        self.assertTrue('<p>*AAA*</p>' in html)
+
+    def test_pydocx_export_methods_are_visited(self):
+        exporter = VisitorEngineExporter(self.get_zip_archive_for_document(
+            WordprocessingDocumentFactory(),
+        ))
+        self.assertFalse(exporter.overrides_result_methods())
+        self.assertTrue(exporter.node_type_can_be_visited(wordprocessing.Paragraph))
+
+    def test_same_html_for_a_table_in_a_textbox(self):
+        self.assert_engines_generate_the_same_html('''
+            <p>
+                <r><t>AAA</t></r>
+                <r>
+                    <pict>
+                        <shape>
+                            <textbox>
+                                <txbxContent>
+                                    <tbl><tr><tc><p><r><t>BBB</t></r></p></tc></tr></tbl>
+                                </txbxContent>
+                            </textbox>
+                        </shape>
+                    </pict>
+                </r>
+            </p>
+            <p>
+                <r>
+                    <pict>
+                        <shape>
+                            <textbox>
+                                <txbxContent>
+                                    <tbl><tr><tc><p><r><t>CCC</t></r></p></tc></tr></tbl>
+                                </txbxContent>
+                            </textbox>
+                        </shape>
+                    </pict>
+                </r>
+            </p>
+        ''')
+
+    def test_same_html_for_paragraphs_in_a_table_cell(self):
+        self.assert_engines_generate_the_same_html('''
+            <tbl>
+                <tr>
+                    <tc>
+                        <p><r><t>AAA</t></r></p>
+                        <p></p>
+                        <p><r><t>BBB</t></r></p>
+                        <tbl><tr><tc><p><r><t>CCC</t></r></p></tc></tr></tbl>
+                        <p><r><t>DDD</t></r></p>
+                    </tc>
+                </tr>
+            </tbl>
+        ''')
+
+    def test_same_html_for_runs_with_properties_in_a_hyperlink(self):
+        self.assert_engines_generate_the_same_html('''
+            <p>
+                <hyperlink id="foobar">
+                    <r><rPr><u val="single"/><b/></rPr><t> AAA</t></r>
+                </hyperlink>
+                <r><rPr><u val="single"/></rPr><t>BBB</t></r>
+                <r><tab/><t>CCC</t><br/></r>
+            </p>
+        ''')
+
+    def test_same_html_for_lists_and_footnotes(self):
+        numbering_xml = '''
+            <num numId="1">
+                <abstractNumId val="1"/>
+            </num>
+            <abstractNum abstractNumId="1">
+                <lvl ilvl="0"><numFmt val="decimal"/></lvl>
+            </abstractNum>
+        '''
+        footnotes_xml = '''
+            <footnote id="1">
+                <p><r><footnoteRef/></r><r><t>Footnote</t></r></p>
+            </footnote>
+        '''
+        self.assert_engines_generate_the_same_html(
+            '''
+            <p>
+                <pPr><numPr><ilvl val="0"/><numId val="1"/></numPr></pPr>
+                <r><t>AAA</t></r>
+                <r><footnoteReference id="1"/></r>
+            </p>
+            <p>
+                <pPr><numPr><ilvl val="0"/><numId val="1"/></numPr></pPr>
+                <r><t>BBB</t></r>
+            </p>
+            <p><r><t>CCC</t></r></p>
+            ''',
+            parts=[
+                (NumberingDefinitionsPart, numbering_xml),
+                (FootnotesPart, footnotes_xml),
+            ],
+        )
+
+
+class CoalesceRunsExporter(PyDocXHTMLExporterNoStyle):
+    coalesce_runs = True
+
+
+class CoalesceRunsTestCase(DocumentGeneratorTestCase):
+    exporter = CoalesceRunsExporter
+
+    def test_runs_with_the_same_properties_are_merged(self):
+        document_xml = '''
+            <p>
+                <r><rPr><b/><u val="single"/></rPr><t>AAA</t></r>
+                <r><rPr><b/><u val="single"/></rPr><t xml:space="preserve"> BBB</t></r>
+                <r><rPr><b/><u val="single"/></rPr><tab/><t>CCC</t></r>
+            </p>
+        '''
+        expected_html = '''
+            <p>
+                <span class="pydocx-underline">
+                    <strong>AAA BBB<span class="pydocx-tab"></span>CCC</strong>
+                </span>
+            </p>
+        '''
+        self.assert_main_document_xml_generates_html(document_xml, expected_html)
+
+    def test_runs_with_different_properties_are_not_merged(self):
+        document_xml = '''
+            <p>
+                <r><rPr><b/></rPr><t>AAA</t></r>
+                <r><rPr><i/></rPr><t>BBB</t></r>
+                <r><rPr><i/><color val="FF0000"/></rPr><t>CCC</t></r>
+            </p>
+        '''
+        expected_html = '''
+            <p>
+                <strong>AAA</strong>
+                <em>BBB</em>
+                <span style="color:#FF0000"><em>CCC</em></span>
+            </p>
+        '''
+        self.assert_main_document_xml_generates_html(document_xml, expected_html)
+
+    def test_run_that_starts_with_whitespace_is_not_merged(self):
+        # The leading whitespace of a run isn't formatted, so merging the
+        # run would format the whitespace
+        document_xml = '''
+            <p>
+                <r><rPr><b/></rPr><t>AAA</t></r>
+                <r><rPr><b/></rPr><t xml:space="preserve"> </t></r>
+                <r><rPr><b/></rPr><t>BBB</t></r>
+            </p>
+        '''
+        expected_html = '''
+            <p><strong>AAA</strong> <strong>BBB</strong></p>
+        '''
+        self.assert_main_document_xml_generates_html(document_xml, expected_html)
+
+    def test_runs_with_other_content_are_not_merged(self):
+        footnotes_xml = '''
+            <footnote id="1">
+                <p><r><t>Footnote</t></r></p>
+            </footnote>
+        '''
+        document = WordprocessingDocumentFactory()
+        document.add(FootnotesPart, footnotes_xml)
+        document.add(MainDocumentPart, '''
+            <p>
+                <r><rPr><b/></rPr><t>AAA</t></r>
+                <r><rPr><b/></rPr><footnoteReference id="1"/></r>
+                <r><rPr><b/></rPr><t>BBB</t></r>
+            </p>
+        ''')
+        zip_archive = self.get_zip_archive_for_document(document)
+        self.assertEqual(
+            CoalesceRunsExporter(zip_archive).export(),
+            PyDocXHTMLExporterNoStyle(zip_archive).export(),
+        )
+
+    def test_runs_of_a_complex_field_are_not_merged(self):
+        document_xml = '''
+            <p>
+                <r><t>AAA</t></r>
+                <r><fldChar fldCharType="begin"/></r>
+                <r><instrText> HYPERLINK "http://www.google.com/"</instrText></r>
+                <r><fldChar fldCharType="separate"/></r>
+                <r><t>BBB</t></r>
+                <r><fldChar fldCharType="end"/></r>
+                <r><t>CCC</t></r>
+            </p>
+        '''
+        expected_html = '''
+            <p>AAA<a href="http://www.google.com/">BBB</a>CCC</p>
+        '''
+        self.assert_main_document_xml_generates_html(document_xml, expected_html)
+
+    def test_visitor_engine(self):
+        class VisitorEngineCoalesceRunsExporter(CoalesceRunsExporter):
+            visitor_engine = True
+
+        document = WordprocessingDocumentFactory()
+        document.add(MainDocumentPart, '''
+            <p>
+                <r><rPr><b/></rPr><t>AAA</t></r>
+                <r><rPr><b/></rPr><t>BBB</t></r>
+            </p>
+        ''')
+        zip_archive = self.get_zip_archive_for_document(document)
+        html = VisitorEngineCoalesceRunsExporter(zip_archive).export()
+        self.assertEqual(html, CoalesceRunsExporter(zip_archive).export())
+        self.assertTrue('<strong>AAABBB</strong>' in html)
@@ -5,15 +5,21 @@ from __future__ import (
 )
 
 import base64
+import glob
 import os
 from tempfile import NamedTemporaryFile
+from unittest import TestCase
+from xml.etree import ElementTree
 
+from nose import SkipTest
 from nose.tools import raises
 
 from pydocx.exceptions import MalformedDocxException
 from pydocx.export.html import PyDocXHTMLExporter
 from pydocx.test.testcases import BASE_HTML, DocXFixtureTestCaseFactory
+from pydocx.test.testcases import PyDocXHTMLExporterNoStyle
 from pydocx.test.utils import assert_html_equal
+from pydocx.util.xml import get_lxml_etree
 from pydocx.util.zip import ZipFile
 
 
@@ -121,3 +127,96 @@ def test_has_image():
 def test_malformed_docx_exception():
     with NamedTemporaryFile(suffix='.docx') as f:
         convert(f.name)
+
+
+class StreamBodyPyDocXHTMLExporter(PyDocXHTMLExporter):
+    stream_body = True
+
+
+class StreamBodyConvertDocxToHtmlTestCase(ConvertDocxToHtmlTestCase):
+    exporter = StreamBodyPyDocXHTMLExporter
+
+
+class VisitorEnginePyDocXHTMLExporter(PyDocXHTMLExporter):
+    visitor_engine = True
+
+
+class VisitorEngineConvertDocxToHtmlTestCase(ConvertDocxToHtmlTestCase):
+    exporter = VisitorEnginePyDocXHTMLExporter
+
+
+class LxmlPyDocXHTMLExporter(PyDocXHTMLExporter):
+    xml_parser = 'lxml'
+
+
+class LxmlConvertDocxToHtmlTestCase(ConvertDocxToHtmlTestCase):
+    exporter = LxmlPyDocXHTMLExporter
+
+    def setUp(self):
+        if get_lxml_etree() is None:
+            raise SkipTest('This test case requires lxml')
+
+
+class CoalesceRunsPyDocXHTMLExporter(PyDocXHTMLExporter):
+    coalesce_runs = True
+
+
+class CoalesceRunsConvertDocxToHtmlTestCase(ConvertDocxToHtmlTestCase):
+    exporter = CoalesceRunsPyDocXHTMLExporter
+
+
+def get_formatted_content(html):
+    '''
+    Return the content of the given html as a list of pieces of text and
+    empty elements, each with the elements it's nested within. Consecutive
+    pieces of text within the same elements are joined, so that splitting an
+    element into several identical ones doesn't change the result.
+    '''
+    content = []
+
+    def visit(element, ancestors):
+        ancestors = ancestors + ((element.tag, sorted(element.attrib.items())),)
+        if element.text:
+            content.append((element.text, ancestors))
+        elif len(element) == 0:
+            content.append((None, ancestors))
+        for child in element:
+            visit(child, ancestors)
+            if child.tail:
+                content.append((child.tail, ancestors))
+
+    visit(ElementTree.fromstring(html.encode('utf-8')), ())
+    joined_content = []
+    for text, ancestors in content:
+        if joined_content and text is not None:
+            previous_text, previous_ancestors = joined_content[-1]
+            if previous_text is not None and previous_ancestors == ancestors:
+                joined_content[-1] = (previous_text + text, ancestors)
+                continue
+        joined_content.append((text, ancestors))
+    return joined_content
+
+
+class CoalesceRunsFixturesTestCase(TestCase):
+    fixtures_path = os.path.join(
+        os.path.abspath(os.path.dirname(__file__)),
+        '..',
+        'fixtures',
+    )
+
+    def test_same_formatted_content_for_all_fixtures(self):
+        class CoalesceRunsExporter(PyDocXHTMLExporterNoStyle):
+            coalesce_runs = True
+
+        paths = sorted(glob.glob(os.path.join(self.fixtures_path, '*.docx')))
+        self.assertTrue(paths)
+        for path in paths:
+            try:
+                html = PyDocXHTMLExporterNoStyle(path).export()
+            except MalformedDocxException:
+                continue
+            self.assertEqual(
+                get_formatted_content(CoalesceRunsExporter(path).export()),
+                get_formatted_content(html),
+                os.path.basename(path),
+            )
@@ -0,0 +1,139 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+from pydocx.export.instrumentation import ExportReport
+from pydocx.openxml.packaging import MainDocumentPart
+from pydocx.test import DocumentGeneratorTestCase
+from pydocx.test.testcases import PyDocXHTMLExporterNoStyle
+from pydocx.test.utils import WordprocessingDocumentFactory
+
+
+class InstrumentedExporter(PyDocXHTMLExporterNoStyle):
+    instrument = True
+
+
+class InstrumentationTestCase(DocumentGeneratorTestCase):
+    exporter = InstrumentedExporter
+
+    document_xml = '''
+        <p><r><t>AAA</t></r><r><t>BBB</t></r></p>
+        <tbl>
+            <tr>
+                <tc><p><r><t>CCC</t></r></p></tc>
+            </tr>
+        </tbl>
+    '''
+
+    def export(self, exporter_class=None):
+        document = WordprocessingDocumentFactory()
+        document.add(MainDocumentPart, self.document_xml)
+        if exporter_class is None:
+            exporter_class = self.exporter
+        exporter = exporter_class(self.get_zip_archive_for_document(document))
+        html = exporter.export()
+        return exporter, html
+
+    def test_node_types_and_export_methods_are_counted(self):
+        exporter, _ = self.export()
+        report = exporter.report
+        counts = dict(
+            (name, stats.count)
+            for name, stats in report.node_types.items()
+        )
+        self.assertEqual(counts, {
+            'Document': 1,
+            'Body': 1,
+            'Paragraph': 2,
+            'Run': 3,
+            'Text': 3,
+            'Table': 1,
+            'TableRow': 1,
+            'TableCell': 1,
+        })
+        self.assertEqual(report.export_methods['export_run'].count, 3)
+
+    def test_nested_time_is_excluded_from_self_time(self):
+        exporter, _ = self.export()
+        for stats in exporter.report.node_types.values():
+            self.assertTrue(0 <= stats.self_time <= stats.total_time)
+        document = exporter.report.node_types['Document']
+        body = exporter.report.node_types['Body']
+        self.assertTrue(document.total_time >= body.total_time)
+        self.assertTrue(
+            document.self_time <= document.total_time - body.total_time + 1e-6,
+        )
+
+    def test_phases(self):
+        exporter, _ = self.export()
+        self.assertEqual(
+            sorted(exporter.report.phases.keys()),
+            ['first_pass', 'load', 'open', 'render'],
+        )
+        render = exporter.report.phases['render']
+        document = exporter.report.node_types['Document']
+        self.assertTrue(render.total_time >= document.total_time)
+
+    def test_streaming_body(self):
+        class StreamingExporter(InstrumentedExporter):
+            stream_body = True
+
+        exporter, html = self.export(StreamingExporter)
+        _, expected_html = self.export(PyDocXHTMLExporterNoStyle)
+        self.assertEqual(html, expected_html)
+        self.assertEqual(exporter.report.phases['first_pass'].count, 2)
+        self.assertEqual(exporter.report.node_types['Paragraph'].count, 2)
+
+    def test_visitor_engine(self):
+        class VisitorEngineExporter(InstrumentedExporter):
+            visitor_engine = True
+
+        exporter, html = self.export(VisitorEngineExporter)
+        _, expected_html = self.export(PyDocXHTMLExporterNoStyle)
+        self.assertEqual(html, expected_html)
+        self.assertEqual(exporter.report.node_types['Run'].count, 3)
+
+    def test_disabled_by_default(self):
+        exporter, _ = self.export(PyDocXHTMLExporterNoStyle)
+        self.assertEqual(exporter.report, None)
+        export_func = exporter.node_type_to_export_func_map[
+            exporter.main_document_part.document.__class__
+        ]
+        self.assertEqual(export_func, exporter.export_document)
+
+    def test_exporting_twice(self):
+        exporter, html = self.export()
+        self.assertEqual(exporter.export(), html)
+        self.assertEqual(exporter.report.node_types['Run'].count, 3)
+        self.assertEqual(exporter.report.export_methods['export_run'].count, 3)
+        export_func = exporter.node_type_to_export_func_map[
+            exporter.main_document_part.document.__class__
+        ]
+        self.assertEqual(export_func, exporter.export_document)
+
+    def test_report_as_dict_and_format(self):
+        exporter, _ = self.export()
+        data = exporter.report.as_dict()
+        self.assertEqual(data['node_types']['Run']['count'], 3)
+        self.assertEqual(
+            sorted(data.keys()),
+            ['export_methods', 'node_types', 'phases'],
+        )
+        text = exporter.report.format(limit=2)
+        self.assertTrue('render' in text)
+        self.assertEqual(
+            len(text.strip().splitlines()),
+            # 4 phases, 2 node types and 2 export methods, with a header and
+            # a blank line between each section
+            3 + 4 + 2 + 2 + 2,
+        )
+
+    def test_empty_report(self):
+        self.assertEqual(ExportReport().as_dict(), {
+            'phases': {},
+            'node_types': {},
+            'export_methods': {},
+        })
@@ -5,10 +5,15 @@ from __future__ import (
     unicode_literals,
 )
 
-
+import gc
 from unittest import TestCase
 
-from pydocx.export.numbering_span import NumberingSpanBuilder
+from pydocx.export.numbering_span import (
+    BaseNumberingSpanBuilder,
+    DefaultFakeNumberingDetector,
+    NumberingSpan,
+    NumberingSpanBuilder,
+)
 from pydocx.openxml.wordprocessing import (
     Break,
     Paragraph,
@@ -16,6 +21,7 @@ from pydocx.openxml.wordprocessing import (
     TabChar,
     Text,
 )
+from pydocx.util.memoize import memoized
 
 
 class NumberingSpanTestBase(TestCase):
@@ -370,3 +376,113 @@ class RemoveInitialTabCharsFromParagraphTestCase(NumberingSpanTestBase):
 
         self.builder.remove_initial_tab_chars_from_paragraph(paragraph)
         self.assertEqual(repr(paragraph), repr(expected))
+
+
+class MatchLeadingTextTestCase(TestCase):
+    texts = [
+        '1. Foo',
+        '  1 .  Foo',
+        '1.Foo',
+        '10. Foo',
+        '1) Foo',
+        '(1) Foo',
+        '( iv )Foo',
+        'iv) Foo',
+        'IV. Foo',
+        'Iv. Foo',
+        'ab. Foo',
+        '1a. Foo',
+        '(1 Foo',
+        'Foo',
+        '',
+    ]
+    digits = ['1', '10', 'iv', 'IV', 'ab']
+
+    def test_matches_the_same_text_as_the_detect_methods(self):
+        detectors = DefaultFakeNumberingDetector()
+        self.assertTrue(detectors.can_match_leading_text())
+        for text in self.texts:
+            leading_text = detectors.match_leading_text(text)
+            for digit in self.digits:
+                expected = [detector(digit, text) for detector in detectors]
+                expected = [matching for matching in expected if matching]
+                if leading_text and leading_text[1] == digit:
+                    actual = [leading_text[0]]
+                else:
+                    actual = []
+                self.assertEqual(actual, expected, (text, digit))
+
+    def test_returns_the_digit(self):
+        detectors = DefaultFakeNumberingDetector()
+        self.assertEqual(
+            detectors.match_leading_text('( iv ) Foo'),
+            ('( iv ) ', 'iv'),
+        )
+        self.assertEqual(detectors.match_leading_text('Foo'), None)
+
+
+class CustomFakeNumberingDetectorTestCase(TestCase):
+    def test_detect_methods_of_a_subclass_are_used(self):
+        class ColonFakeNumberingDetector(DefaultFakeNumberingDetector):
+            def detect_digit_colon(self, digit, text):
+                if text.startswith('{0}: '.format(digit)):
+                    return '{0}: '.format(digit)
+
+        class ColonNumberingSpanBuilder(NumberingSpanBuilder):
+            faked_list_detector_class = ColonFakeNumberingDetector
+
+        self.assertFalse(ColonFakeNumberingDetector().can_match_leading_text())
+        paragraphs = [
+            Paragraph(children=[Run(children=[Text(text='1: Foo')])]),
+            Paragraph(children=[Run(children=[Text(text='2) Bar')])]),
+        ]
+        [numbering_span] = ColonNumberingSpanBuilder(paragraphs).get_numbering_spans()
+        self.assertTrue(isinstance(numbering_span, NumberingSpan))
+        self.assertEqual(numbering_span.numbering_level.num_format, 'decimal')
+        self.assertEqual(len(numbering_span.children), 2)
+        self.assertEqual(paragraphs[0].get_text(), 'Foo')
+        self.assertEqual(paragraphs[1].get_text(), 'Bar')
+
+
+class NumberingLevelCacheTestCase(TestCase):
+    def test_numbering_level_is_detected_once_per_paragraph(self):
+        class CountingNumberingSpanBuilder(NumberingSpanBuilder):
+            detected = 0
+
+            def detect_faked_list(self, paragraph):
+                self.detected += 1
+                return super(CountingNumberingSpanBuilder, self).detect_faked_list(
+                    paragraph,
+                )
+
+        # More paragraphs than a memoized cache holds by default
+        paragraphs = [
+            Paragraph(children=[Run(children=[Text(text='Foo')])])
+            for _ in range(memoized.default_maxsize * 2)
+        ]
+        builder = CountingNumberingSpanBuilder()
+        for _ in range(2):
+            for paragraph in paragraphs:
+                builder.get_numbering_level(paragraph)
+        self.assertEqual(builder.detected, len(paragraphs))
+
+        del paragraph, paragraphs
+        gc.collect()
+        self.assertEqual(len(builder.numbering_levels), 0)
+
+    def test_numbering_level_does_not_keep_the_paragraph(self):
+        builder = BaseNumberingSpanBuilder()
+        paragraph = Paragraph(children=[Run(children=[Text(text='Foo')])])
+        self.assertEqual(builder.get_numbering_level(paragraph), None)
+        self.assertEqual(len(builder.numbering_levels), 1)
+
+        del paragraph
+        gc.collect()
+        self.assertEqual(len(builder.numbering_levels), 0)
+
+    def test_leading_text_is_forgotten_when_the_paragraph_is_cleaned(self):
+        builder = NumberingSpanBuilder()
+        paragraph = Paragraph(children=[Run(children=[Text(text='1) 2) Foo')])])
+        self.assertEqual(builder.get_faked_list_leading_text(paragraph), ('1) ', '1'))
+        builder.clean_paragraph(paragraph, '1) ')
+        self.assertEqual(builder.get_faked_list_leading_text(paragraph), ('2) ', '2'))
@@ -11,7 +11,7 @@ from pydocx.openxml.packaging import (
     MainDocumentPart,
     WordprocessingDocument,
 )
-from pydocx.openxml.wordprocessing import Document
+from pydocx.openxml.wordprocessing import Document, Paragraph, Table
 from pydocx.test.utils import WordprocessingDocumentFactory
 from pydocx.util.zip import create_zip_archive
 
@@ -26,3 +26,37 @@ class MainDocumentPartTestCase(unittest.TestCase):
         document = WordprocessingDocument(path=package)
         part = document.main_document_part
         assert isinstance(part.document, Document), part.document
+
+    def get_main_document_part(self, document_xml):
+        factory = WordprocessingDocumentFactory()
+        factory.add(MainDocumentPart, document_xml)
+        package = create_zip_archive(factory.to_zip_dict())
+        document = WordprocessingDocument(path=package)
+        return document.main_document_part
+
+    def test_iter_body_children_yields_each_block_with_body_as_parent(self):
+        part = self.get_main_document_part('''
+            <p><r><t>AAA</t></r></p>
+            <tbl><tr><tc><p><r><t>BBB</t></r></p></tc></tr></tbl>
+            <p><r><t>CCC</t></r></p>
+            <sectPr><pgSz w="12240" h="15840"/></sectPr>
+        ''')
+        document = part.load_streaming_document()
+        body = document.body
+        children = list(part.iter_body_children(body))
+        self.assertEqual(
+            [type(child) for child in children],
+            [Paragraph, Table, Paragraph],
+        )
+        self.assertEqual(children[2].get_text(), 'CCC')
+        for child in children:
+            assert child.parent is body
+        self.assertEqual(body.children, [])
+
+    def test_load_final_section_properties(self):
+        part = self.get_main_document_part('''
+            <p><r><t>AAA</t></r></p>
+            <sectPr><pgSz w="12240" h="15840"/></sectPr>
+        ''')
+        section_properties = part.load_final_section_properties()
+        self.assertEqual(section_properties.page_size['w'], '12240')
@@ -0,0 +1,114 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+import unittest
+
+from pydocx.openxml.packaging import (
+    MainDocumentPart,
+    StyleDefinitionsPart,
+    WordprocessingDocument,
+)
+from pydocx.test.utils import WordprocessingDocumentFactory
+from pydocx.util.zip import create_zip_archive
+
+
+class StyleDefinitionsPartResolvedStylesTestCase(unittest.TestCase):
+    style_xml = '''
+        <style styleId="base" type="paragraph">
+          <name val="Base"/>
+          <rPr>
+            <b val="on"/>
+            <i val="on"/>
+          </rPr>
+        </style>
+        <style styleId="heading1" type="paragraph">
+          <name val="Heading 1"/>
+          <basedOn val="base"/>
+          <rPr>
+            <i val="off"/>
+          </rPr>
+        </style>
+        <style styleId="special" type="paragraph">
+          <name val="Special"/>
+          <basedOn val="heading1"/>
+          <rPr>
+            <caps val="on"/>
+          </rPr>
+        </style>
+        <style styleId="loopA" type="paragraph">
+          <basedOn val="loopB"/>
+        </style>
+        <style styleId="loopB" type="paragraph">
+          <basedOn val="loopA"/>
+        </style>
+        <style styleId="base" type="character">
+          <name val="Character Base"/>
+        </style>
+    '''
+
+    def setUp(self):
+        factory = WordprocessingDocumentFactory()
+        factory.add(StyleDefinitionsPart, self.style_xml)
+        factory.add(MainDocumentPart, '')
+        package = create_zip_archive(factory.to_zip_dict())
+        document = WordprocessingDocument(path=package)
+        self.part = document.main_document_part.style_definitions_part
+
+    def get_style_ids(self, resolved_style):
+        return [style.style_id for style in resolved_style.style_chain]
+
+    def test_every_style_is_resolved(self):
+        self.assertEqual(
+            sorted(self.part.resolved_styles.keys()),
+            [
+                ('character', 'base'),
+                ('paragraph', 'base'),
+                ('paragraph', 'heading1'),
+                ('paragraph', 'loopA'),
+                ('paragraph', 'loopB'),
+                ('paragraph', 'special'),
+            ],
+        )
+
+    def test_style_chain_matches_get_style_chain_stack(self):
+        resolved_style = self.part.get_resolved_style('paragraph', 'special')
+        self.assertEqual(
+            self.get_style_ids(resolved_style),
+            ['special', 'heading1', 'base'],
+        )
+        self.assertEqual(
+            list(resolved_style.style_chain),
+            list(self.part.get_style_chain_stack('paragraph', 'special')),
+        )
+
+    def test_run_properties_are_flattened_nearest_style_first(self):
+        resolved_style = self.part.get_resolved_style('paragraph', 'special')
+        run_properties = resolved_style.run_properties
+        self.assertTrue(run_properties['bold'])
+        self.assertFalse(run_properties['italic'])
+        self.assertTrue(run_properties['caps'])
+
+    def test_heading_style_is_the_nearest_heading_in_the_chain(self):
+        resolved_style = self.part.get_resolved_style('paragraph', 'special')
+        self.assertEqual(resolved_style.heading_style.style_id, 'heading1')
+        resolved_style = self.part.get_resolved_style('paragraph', 'base')
+        self.assertEqual(resolved_style.heading_style, None)
+
+    def test_loops_are_broken(self):
+        resolved_style = self.part.get_resolved_style('paragraph', 'loopA')
+        self.assertEqual(self.get_style_ids(resolved_style), ['loopA', 'loopB'])
+
+    def test_style_types_are_kept_apart(self):
+        resolved_style = self.part.get_resolved_style('character', 'base')
+        self.assertEqual(resolved_style.style_chain[0].name, 'Character Base')
+        self.assertEqual(resolved_style.run_properties, {})
+
+    def test_missing_style_is_None(self):
+        self.assertEqual(
+            self.part.get_resolved_style('paragraph', 'missing'),
+            None,
+        )
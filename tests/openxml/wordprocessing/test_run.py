@@ -7,7 +7,8 @@ from __future__ import (
 
 from unittest import TestCase
 
-from pydocx.openxml.wordprocessing import Run
+from pydocx.openxml.wordprocessing import Run, RunProperties
+from pydocx.types import OnOff
 
 
 class RunTestCase(TestCase):
@@ -18,6 +19,26 @@ class RunTestCase(TestCase):
     def test_effective_properties_is_memoized(self):
         run = Run()
         effective_properties = run.effective_properties
-        sentinel = object()
-        effective_properties.bold = sentinel
-        self.assertEqual(run.effective_properties.bold, sentinel)
+        self.assertTrue(run.effective_properties is effective_properties)
+
+    def test_effective_properties_are_interned(self):
+        first = Run(properties=RunProperties(bold=OnOff('on')))
+        second = Run(properties=RunProperties(bold=OnOff('on')))
+        third = Run(properties=RunProperties(bold=OnOff('off')))
+        self.assertTrue(
+            first.effective_properties is second.effective_properties,
+        )
+        self.assertFalse(
+            first.effective_properties is third.effective_properties,
+        )
+
+    def test_effective_properties_are_immutable(self):
+        run = Run()
+        effective_properties = run.effective_properties
+        self.assertRaises(
+            AttributeError,
+            setattr,
+            effective_properties,
+            'bold',
+            OnOff('on'),
+        )
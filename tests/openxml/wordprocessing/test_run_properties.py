@@ -5,9 +5,13 @@ from __future__ import (
     unicode_literals,
 )
 
+import gc
 from unittest import TestCase
 
-from pydocx.openxml.wordprocessing import RunProperties
+from pydocx import PyDocX
+from pydocx.openxml.wordprocessing import RFonts, RunProperties
+from pydocx.openxml.wordprocessing.run_properties import _interned_run_properties
+from pydocx.types import OnOff
 from pydocx.util.xml import parse_xml_from_string
 
 
@@ -91,3 +95,54 @@ class RunPropertiesTestCase(TestCase):
         xml = '<rPr><sz val="abcdef"/></rPr>'
         properties = self._load_styles_from_xml(xml)
         self.assertEqual(properties.size, None)
+
+
+class RunPropertiesGetInternedTestCase(TestCase):
+    def test_identical_properties_share_an_instance(self):
+        first = RunProperties.get_interned({'bold': OnOff('on'), 'sz': '10'})
+        second = RunProperties.get_interned({'sz': '10', 'bold': OnOff('on')})
+        self.assertTrue(first is second)
+        self.assertEqual(
+            sorted(dict(first.fields).items()),
+            [('bold', OnOff('on')), ('sz', '10')],
+        )
+
+    def test_default_values_are_ignored(self):
+        first = RunProperties.get_interned({'bold': OnOff('on')})
+        second = RunProperties.get_interned({'bold': OnOff('on'), 'sz': None})
+        self.assertTrue(first is second)
+
+    def test_different_properties_do_not_share_an_instance(self):
+        first = RunProperties.get_interned({'bold': OnOff('on')})
+        second = RunProperties.get_interned({'bold': OnOff('off')})
+        self.assertFalse(first is second)
+
+    def test_interned_instances_are_immutable(self):
+        properties = RunProperties.get_interned({'bold': OnOff('on')})
+        self.assertRaises(AttributeError, setattr, properties, 'sz', '10')
+        self.assertEqual(properties.sz, None)
+
+    def test_loaded_instances_are_mutable(self):
+        properties = RunProperties()
+        properties.sz = '10'
+        self.assertEqual(properties.sz, '10')
+
+    def test_models_are_copied_and_compared_by_their_fields(self):
+        r_fonts = RFonts(h_ansi='Symbol')
+        first = RunProperties.get_interned({'r_fonts': r_fonts})
+        self.assertTrue(r_fonts.parent is None)
+        self.assertFalse(first.r_fonts is r_fonts)
+        self.assertTrue(first.r_fonts.parent is first)
+        self.assertTrue(first.r_fonts.is_symbol())
+
+        second = RunProperties.get_interned({'r_fonts': RFonts(h_ansi='Symbol')})
+        self.assertTrue(first is second)
+
+    def test_documents_are_not_kept_alive(self):
+        path = 'tests/fixtures/styled_color.docx'
+        PyDocX.to_html(path)
+        gc.collect()
+        size = len(_interned_run_properties)
+        PyDocX.to_html(path)
+        gc.collect()
+        self.assertEqual(len(_interned_run_properties), size)
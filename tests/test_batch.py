@@ -0,0 +1,125 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from pydocx import PyDocX
+from pydocx.batch import ConversionResult, convert_many
+
+FIXTURES = [
+    'tests/fixtures/inline_tags.docx',
+    'tests/fixtures/missing_relationships.docx',
+    'tests/fixtures/simple.docx',
+    'tests/fixtures/tables_in_lists.docx',
+]
+
+
+class ConvertManyTestCase(TestCase):
+    def test_results_are_ordered(self):
+        results = list(PyDocX.convert_many(FIXTURES, workers=2))
+        self.assertEqual([result.index for result in results], [0, 1, 2, 3])
+        self.assertEqual([result.path for result in results], FIXTURES)
+        self.assertEqual(results[0].output, PyDocX.to_html(FIXTURES[0]))
+
+    def test_unordered_results(self):
+        results = convert_many(FIXTURES, workers=2, ordered=False, chunksize=2)
+        self.assertEqual(
+            sorted(result.index for result in results),
+            [0, 1, 2, 3],
+        )
+
+    def test_failures_are_isolated(self):
+        paths = FIXTURES + ['tests/fixtures/does_not_exist.docx']
+        results = list(convert_many(paths, workers=2))
+        self.assertEqual(
+            [result.succeeded for result in results],
+            [True, False, True, True, False],
+        )
+        self.assertEqual(
+            results[1].error,
+            'pydocx.exceptions.MalformedDocxException',
+        )
+        self.assertEqual(results[1].output, None)
+        self.assertTrue('Traceback' in results[4].traceback)
+
+    def test_single_worker_converts_in_the_current_process(self):
+        results = list(convert_many(FIXTURES, workers=1))
+        self.assertEqual(
+            [result.succeeded for result in results],
+            [True, False, True, True],
+        )
+        self.assertEqual(results[2].output, PyDocX.to_html(FIXTURES[2]))
+        self.assertTrue(results[2].duration >= 0)
+
+    def test_results_are_streamed(self):
+        def paths():
+            for path in FIXTURES:
+                consumed.append(path)
+                yield path
+
+        consumed = []
+        results = convert_many(paths(), workers=1)
+        self.assertEqual(consumed, [])
+        next(results)
+        self.assertEqual(consumed, FIXTURES[:1])
+
+    def test_output_paths(self):
+        output_dir = tempfile.mkdtemp()
+        try:
+            output_paths = [
+                os.path.join(output_dir, '{0}.html'.format(index))
+                for index in range(len(FIXTURES))
+            ]
+            results = list(convert_many(
+                FIXTURES,
+                workers=2,
+                output_paths=output_paths,
+            ))
+            self.assertEqual(results[0].output, None)
+            self.assertEqual(results[0].output_path, output_paths[0])
+            with open(output_paths[0], 'rb') as f:
+                html = f.read().decode('utf-8')
+            self.assertEqual(html, PyDocX.to_html(FIXTURES[0]))
+        finally:
+            shutil.rmtree(output_dir)
+
+    def test_failed_conversion_keeps_the_existing_output(self):
+        output_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(output_dir, 'corrupt.docx')
+            with open(path, 'wb') as f:
+                f.write(b'not a docx')
+            output_path = os.path.join(output_dir, 'corrupt.html')
+            with open(output_path, 'wb') as f:
+                f.write(b'previous')
+            for format in ['html', 'markdown']:
+                results = list(convert_many(
+                    [path],
+                    format=format,
+                    workers=1,
+                    output_paths=[output_path],
+                ))
+                self.assertFalse(results[0].succeeded)
+                self.assertEqual(
+                    sorted(os.listdir(output_dir)),
+                    ['corrupt.docx', 'corrupt.html'],
+                )
+                with open(output_path, 'rb') as f:
+                    self.assertEqual(f.read(), b'previous')
+        finally:
+            shutil.rmtree(output_dir)
+
+    def test_unknown_format(self):
+        self.assertRaises(ValueError, convert_many, FIXTURES, format='pdf')
+
+    def test_result_repr(self):
+        result = ConversionResult(0, 'a.docx')
+        self.assertTrue(result.succeeded)
+        self.assertTrue('a.docx' in repr(result))
@@ -0,0 +1,77 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+import subprocess
+import sys
+from unittest import TestCase
+
+
+def get_imported_modules(statement):
+    '''
+    Run `statement` in a new interpreter, and return the set of the names of
+    the modules that it imported.
+    '''
+    script = '; '.join([
+        'import sys',
+        'before = set(sys.modules)',
+        statement,
+        'sys.stdout.write("\\n".join(sorted(set(sys.modules) - before)))',
+    ])
+    process = subprocess.Popen(
+        [sys.executable, '-c', script],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stdout, stderr = process.communicate()
+    if process.returncode != 0:
+        raise AssertionError(stderr.decode('utf-8'))
+    return set(stdout.decode('utf-8').splitlines())
+
+
+class ImportTimeTestCase(TestCase):
+    # The pydocx modules that `import pydocx` imports. Everything else,
+    # including the exporters, is imported when it's first used, which keeps
+    # the import down to a few milliseconds instead of well over 100ms.
+    eager_modules = set([
+        'pydocx',
+        'pydocx.pydocx',
+    ])
+
+    # Modules that are expensive to import, and that `import pydocx` must not
+    # import
+    lazy_modules = [
+        'lxml.etree',
+        'multiprocessing',
+        'pydocx.batch',
+        'pydocx.export',
+        'pydocx.models',
+        'pydocx.openxml',
+        'xml.sax.saxutils',
+    ]
+
+    def test_import_pydocx_only_imports_the_entry_point(self):
+        modules = get_imported_modules('import pydocx')
+        pydocx_modules = set(
+            module for module in modules
+            if module.split('.')[0] == 'pydocx'
+        )
+        self.assertEqual(pydocx_modules, self.eager_modules)
+
+    def test_import_pydocx_does_not_import_expensive_modules(self):
+        modules = get_imported_modules('import pydocx')
+        for module in self.lazy_modules:
+            self.assertFalse(
+                module in modules,
+                '{0} is imported by import pydocx'.format(module),
+            )
+
+    def test_exporters_are_imported_on_first_use(self):
+        modules = get_imported_modules(
+            'from pydocx import PyDocX; '
+            'PyDocX.to_html("tests/fixtures/inline_tags.docx")'
+        )
+        self.assertTrue('pydocx.export.html' in modules)
@@ -4,15 +4,20 @@ from __future__ import (
     unicode_literals,
 )
 
+import json
+import os
+from io import StringIO
 from os import unlink
-from shutil import copyfile
+from shutil import copyfile, rmtree
 from subprocess import Popen, PIPE
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, mkdtemp
 from unittest import TestCase
 
 from nose import SkipTest
 
-from pydocx.__main__ import main
+from pydocx.__main__ import main, serve
+from pydocx.exceptions import MalformedDocxException
+from pydocx.export import PyDocXHTMLExporter
 from pydocx.test.testcases import BASE_HTML
 from pydocx.test.utils import assert_html_equal
 
@@ -59,6 +64,29 @@ class MainTestCase(TestCase):
             assert_html_equal(data, expected_html)
         self.assertEqual(result, 0)
 
+    def test_failed_conversion_does_not_leave_an_output(self):
+        output_dir = mkdtemp()
+        try:
+            output_path = os.path.join(output_dir, 'output.html')
+            self.assertRaises(
+                MalformedDocxException,
+                main,
+                ['--html', 'tests/fixtures/missing_relationships.docx', output_path],
+            )
+            self.assertEqual(os.listdir(output_dir), [])
+
+            with open(output_path, 'w') as f:
+                f.write('previous')
+            self.assertRaises(
+                MalformedDocxException,
+                main,
+                ['--html', 'tests/fixtures/missing_relationships.docx', output_path],
+            )
+            self.assertEqual(os.listdir(output_dir), ['output.html'])
+            self.assertEqual(open(output_path).read(), 'previous')
+        finally:
+            rmtree(output_dir)
+
     def test_convert_to_markdown_result(self):
         raise SkipTest('Fixture files for markdown do not exist yet')
 
@@ -97,3 +125,174 @@ class MainTestCase(TestCase):
                 f.name
             ], stdout=PIPE).wait()
         self.assertEqual(result, 0)
+
+
+class BatchTestCase(TestCase):
+    def setUp(self):
+        self.input_dir = mkdtemp()
+        self.output_dir = mkdtemp()
+        os.mkdir(os.path.join(self.input_dir, 'nested'))
+        for path in ['a.docx', 'nested/b.docx', 'notes.txt']:
+            copyfile(
+                'tests/fixtures/inline_tags.docx',
+                os.path.join(self.input_dir, path),
+            )
+
+    def tearDown(self):
+        rmtree(self.input_dir)
+        rmtree(self.output_dir)
+
+    def get_outputs(self):
+        outputs = []
+        for dirpath, _, filenames in os.walk(self.output_dir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                outputs.append(os.path.relpath(path, self.output_dir))
+        return sorted(outputs)
+
+    def test_directory(self):
+        result = main([
+            '--html',
+            '--batch',
+            self.input_dir,
+            self.output_dir,
+            '--jobs',
+            '2',
+        ])
+        self.assertEqual(result, 0)
+        self.assertEqual(
+            self.get_outputs(),
+            ['a.html', os.path.join('nested', 'b.html')],
+        )
+        fixture_html = open('tests/fixtures/inline_tags.html').read()
+        data = open(os.path.join(self.output_dir, 'a.html')).read()
+        assert_html_equal(data, BASE_HTML % fixture_html)
+
+    def test_glob(self):
+        result = main([
+            '--html',
+            '--batch',
+            os.path.join(self.input_dir, '*', '*.docx'),
+            self.output_dir,
+        ])
+        self.assertEqual(result, 0)
+        self.assertEqual(
+            self.get_outputs(),
+            [os.path.join('nested', 'b.html')],
+        )
+
+    def test_outputs_that_are_up_to_date_are_skipped(self):
+        args = ['--html', '--batch', self.input_dir, self.output_dir, '--jobs', '1']
+        self.assertEqual(main(args), 0)
+        output_path = os.path.join(self.output_dir, 'a.html')
+        with open(output_path, 'w') as f:
+            f.write('up to date')
+
+        self.assertEqual(main(args), 0)
+        self.assertEqual(open(output_path).read(), 'up to date')
+
+        self.assertEqual(main(args + ['--force']), 0)
+        self.assertNotEqual(open(output_path).read(), 'up to date')
+
+    def test_interrupted_conversion_is_not_up_to_date(self):
+        def interrupted_export_to(exporter, stream, encoding='utf-8'):
+            stream.write(b'<html>')
+            raise KeyboardInterrupt()
+
+        args = ['--html', '--batch', self.input_dir, self.output_dir, '--jobs', '1']
+        export_to = PyDocXHTMLExporter.export_to
+        PyDocXHTMLExporter.export_to = interrupted_export_to
+        try:
+            self.assertRaises(KeyboardInterrupt, main, args)
+        finally:
+            PyDocXHTMLExporter.export_to = export_to
+        # No partial output is left behind to be mistaken for an up to date one
+        self.assertEqual(self.get_outputs(), [])
+
+        self.assertEqual(main(args), 0)
+        self.assertEqual(
+            self.get_outputs(),
+            ['a.html', os.path.join('nested', 'b.html')],
+        )
+
+    def test_failures(self):
+        copyfile(
+            'tests/fixtures/missing_relationships.docx',
+            os.path.join(self.input_dir, 'c.docx'),
+        )
+        result = main(['--html', '--batch', self.input_dir, self.output_dir])
+        self.assertEqual(result, 3)
+        self.assertEqual(
+            self.get_outputs(),
+            ['a.html', os.path.join('nested', 'b.html')],
+        )
+
+    def test_return_code_with_invalid_arguments(self):
+        self.assertEqual(main(['--html', '--batch', self.input_dir]), 1)
+        self.assertEqual(
+            main(['--html', '--batch', self.input_dir, self.output_dir, '--jobs']),
+            1,
+        )
+        self.assertEqual(
+            main(['--foo', '--batch', self.input_dir, self.output_dir]),
+            2,
+        )
+
+
+class ServeStdinTestCase(TestCase):
+    def serve(self, jobs):
+        stdin = StringIO(''.join(
+            (json.dumps(job) if isinstance(job, dict) else job) + '\n'
+            for job in jobs
+        ))
+        stdout = StringIO()
+        self.assertEqual(serve(stdin, stdout), 0)
+        return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def test_jobs(self):
+        with NamedTemporaryFile(suffix='.html') as f:
+            results = self.serve([
+                {
+                    'id': 'first',
+                    'input': 'tests/fixtures/inline_tags.docx',
+                    'output': f.name,
+                },
+                {'input': 'tests/fixtures/inline_tags.docx'},
+            ])
+            data = open(f.name).read()
+        fixture_html = open('tests/fixtures/inline_tags.html').read()
+        assert_html_equal(data, BASE_HTML % fixture_html)
+        self.assertEqual(
+            [(result['id'], result['ok']) for result in results],
+            [('first', True), (None, True)],
+        )
+        self.assertEqual(results[0]['output'], f.name)
+        assert_html_equal(results[1]['output'], BASE_HTML % fixture_html)
+
+    def test_failed_jobs_do_not_stop_the_worker(self):
+        results = self.serve([
+            'not json',
+            '',
+            {'id': 2, 'input': 'tests/fixtures/missing_relationships.docx'},
+            {'id': 3, 'input': 'tests/fixtures/inline_tags.docx', 'format': 'pdf'},
+            {'id': 4},
+            {'id': 5, 'input': 'tests/fixtures/inline_tags.docx'},
+        ])
+        self.assertEqual(
+            [(result['id'], result['ok']) for result in results],
+            [(None, False), (2, False), (3, False), (4, False), (5, True)],
+        )
+        self.assertEqual(
+            results[1]['error'],
+            'pydocx.exceptions.MalformedDocxException',
+        )
+        self.assertEqual(results[2]['error'], "ValueError: Unknown format: 'pdf'")
+        self.assertEqual(results[2]['input'], 'tests/fixtures/inline_tags.docx')
+
+    def test_cli(self):
+        process = Popen(['pydocx', '--serve-stdin'], stdin=PIPE, stdout=PIPE)
+        job = {'input': 'tests/fixtures/inline_tags.docx'}
+        stdout, _ = process.communicate((json.dumps(job) + '\n').encode('utf-8'))
+        self.assertEqual(process.returncode, 0)
+        result = json.loads(stdout.decode('utf-8'))
+        self.assertTrue(result['ok'])
@@ -5,8 +5,11 @@ from __future__ import (
     unicode_literals,
 )
 
+import sys
 from unittest import TestCase
 
+from nose import SkipTest
+
 from pydocx.models import (
     XmlAttribute,
     XmlChild,
@@ -16,8 +19,19 @@ from pydocx.models import (
     XmlRootElementMismatchException,
 )
 
+from pydocx.openxml.wordprocessing import (
+    Paragraph,
+    Run,
+    RunProperties,
+    Text,
+)
 from pydocx.util.xml import parse_xml_from_string
 
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
 
 class AppleModel(XmlModel):
     XML_TAG = 'apple'
@@ -298,3 +312,153 @@ class XmlCollectionTestCase(BaseTestCase):
             'four',
         ]
         self.assertEqual(types, expected_types)
+
+
+class LoadPlanTestCase(TestCase):
+    def test_plan_is_created_once_per_class(self):
+        plan = BucketModel.get_load_plan()
+        self.assertTrue(BucketModel.get_load_plan() is plan)
+        self.assertTrue(plan.model is BucketModel)
+
+    def test_subclass_has_its_own_plan(self):
+        class BigBucketModel(BucketModel):
+            lid = XmlChild()
+
+        BucketModel.get_load_plan()
+        plan = BigBucketModel.get_load_plan()
+        self.assertTrue(plan.model is BigBucketModel)
+        self.assertEqual([name for name, _ in plan.fields], ['lid'])
+
+    def test_child_tags_are_mapped_to_fields_and_collections(self):
+        plan = BucketModel.get_load_plan()
+        self.assertEqual(
+            sorted(plan.child_handlers.keys()),
+            ['attr_child', 'circle', 'data', 'items', 'prop', 'water'],
+        )
+        self.assertEqual(
+            sorted(name for name, _, _ in plan.child_handlers['circle']),
+            ['circle_color', 'circle_size'],
+        )
+
+        plan = ItemsModel.get_load_plan()
+        self.assertEqual(plan.collection_field_names, ['children'])
+        for tag_name in ['apple', 'orange']:
+            handlers = plan.child_handlers[tag_name]
+            self.assertEqual(
+                [(name, is_collection) for name, _, is_collection in handlers],
+                [('children', True)],
+            )
+
+
+class SlotsTestCase(TestCase):
+    def test_instances_do_not_have_a_dict(self):
+        for model in [Run, Text, RunProperties, Paragraph]:
+            self.assertFalse(hasattr(model(), '__dict__'))
+
+    def test_fields_are_not_stored_in_the_dict(self):
+        # BucketModel doesn't declare __slots__, so it has a __dict__
+        bucket = BucketModel(agua='water')
+        self.assertEqual(bucket.agua, 'water')
+        self.assertEqual(bucket.__dict__, {})
+
+    def test_fields_are_not_class_attributes(self):
+        self.assertFalse(isinstance(BucketModel.__dict__['agua'], XmlChild))
+        self.assertEqual(
+            [name for name, _ in BucketModel._fields],
+            [name for name, _ in BucketModel.get_load_plan().fields],
+        )
+
+    def test_unset_field_uses_the_default_from_the_class(self):
+        apple = AppleModel()
+        self.assertEqual(apple.type, 'Honey Crisp')
+        self.assertEqual(list(apple.fields), [])
+        apple.type = 'Gala'
+        self.assertEqual(apple.type, 'Gala')
+        self.assertEqual(list(apple.fields), [('type', 'Gala')])
+
+    def test_undeclared_attributes_cannot_be_set(self):
+        run = Run()
+        self.assertRaises(AttributeError, lambda: run.color)
+        self.assertRaises(AttributeError, setattr, run, 'color', 'red')
+
+    def test_undeclared_attributes_can_be_set_without_slots(self):
+        class ColoredRun(Run):
+            def __init__(self, *args, **kwargs):
+                super(ColoredRun, self).__init__(*args, **kwargs)
+                self.color = 'red'
+
+        run = ColoredRun()
+        self.assertEqual(run.color, 'red')
+        self.assertEqual(run.__dict__, {'color': 'red'})
+        self.assertRaises(AttributeError, lambda: AppleModel().color)
+
+    def test_bytes_per_node(self):
+        if tracemalloc is None:
+            raise SkipTest('This test requires tracemalloc')
+
+        def measure(factory, count=1000):
+            tracemalloc.start()
+            try:
+                nodes = [factory() for _ in range(count)]
+                size = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+            return (size - sys.getsizeof(nodes)) // count
+
+        class DictNode(object):
+            pass
+
+        def create_dict_node(model):
+            # How nodes were stored before they had slots: every field was
+            # set on the instance's __dict__
+            def factory():
+                node = DictNode()
+                node._parent = None
+                node.container = None
+                for field_name, field in model._fields:
+                    setattr(node, field_name, field.default)
+                return node
+            return factory
+
+        for model in [Run, Text, RunProperties, Paragraph]:
+            bytes_per_node = measure(model)
+            bytes_per_dict_node = measure(create_dict_node(model))
+            sys.stdout.write('{0}: {1} bytes per node ({2} with a dict)\n'.format(
+                model.__name__,
+                bytes_per_node,
+                bytes_per_dict_node,
+            ))
+            self.assertTrue(bytes_per_node < bytes_per_dict_node)
+
+
+class IterDescendantsTestCase(TestCase):
+    def test_models_are_yielded_in_document_order(self):
+        xml = '''
+            <bucket>
+                <items>
+                    <apple type="Gala" />
+                    <orange type="Navel" />
+                </items>
+                <prop val="red" />
+                <water>Smart Water</water>
+            </bucket>
+        '''
+        bucket = BucketModel.load(parse_xml_from_string(xml))
+        self.assertEqual(
+            [type(node) for node in bucket.iter_descendants()],
+            [BucketModel, ItemsModel, AppleModel, OrangeModel, PropertiesModel],
+        )
+
+    def test_empty_model(self):
+        bucket = BucketModel()
+        self.assertEqual(list(bucket.iter_descendants()), [bucket])
+
+    def test_children_can_be_replaced_before_they_are_visited(self):
+        items = ItemsModel(children=[AppleModel()])
+        orange = OrangeModel()
+        visited = []
+        for node in items.iter_descendants():
+            visited.append(node)
+            if node is items:
+                items.children = [orange]
+        self.assertEqual(visited, [items, orange])
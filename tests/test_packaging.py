@@ -6,6 +6,8 @@ from __future__ import (
 )
 
 import unittest
+import zipfile
+from io import BytesIO
 
 from pydocx.packaging import ZipPackage
 
@@ -33,3 +35,57 @@ class ZipPackageTestCase(unittest.TestCase):
         data = part.stream.read()
         assert data
         assert data.startswith(b'<?xml version="1.0" encoding="UTF-8"?>')
+
+    def test_parts_are_not_decompressed_until_their_stream_is_read(self):
+        self.package.get_parts()
+        self.assertEqual(self.package.streams, {})
+
+        part = self.package.get_part('/word/document.xml')
+        assert part.stream.read()
+        self.assertEqual(list(self.package.streams), ['/word/document.xml'])
+
+    def test_part_stream_is_available_after_the_package_is_closed(self):
+        part = self.package.get_part('/word/document.xml')
+        data = part.stream.read()
+        self.package.close()
+        part.stream.seek(0)
+        self.assertEqual(part.stream.read(), data)
+
+    def test_closed_package_reopens_the_archive_for_unread_parts(self):
+        self.package.get_parts()
+        self.package.close()
+        part = self.package.get_part('/_rels/.rels')
+        assert part.stream.read()
+
+
+class ZipPackageSourceTestCase(unittest.TestCase):
+    def get_fixture_data(self):
+        with open('tests/fixtures/no_break_hyphen.docx', 'rb') as f:
+            return f.read()
+
+    def assert_document_part_is_readable(self, package):
+        part = package.get_part('/word/document.xml')
+        assert part.stream.read().startswith(b'<?xml')
+
+    def test_package_from_bytes(self):
+        package = ZipPackage(path=self.get_fixture_data())
+        self.assert_document_part_is_readable(package)
+
+    def test_package_from_memoryview(self):
+        package = ZipPackage(path=memoryview(self.get_fixture_data()))
+        self.assert_document_part_is_readable(package)
+
+    def test_package_from_bytearray(self):
+        package = ZipPackage(path=bytearray(self.get_fixture_data()))
+        self.assert_document_part_is_readable(package)
+
+    def test_stored_part_stream_is_a_view_of_the_archive(self):
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr('word/media/image1.png', b'png data')
+        package = ZipPackage(path=archive.getvalue())
+        stream = package.get_part('/word/media/image1.png').stream
+        view = stream.getbuffer()
+        assert view.readonly
+        self.assertEqual(view.tobytes(), b'png data')
+        self.assertEqual(stream.read(), b'png data')
@@ -0,0 +1,172 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+from contextlib import contextmanager
+from unittest import TestCase
+
+from pydocx import tracing
+from pydocx.openxml.packaging import MainDocumentPart
+from pydocx.test import DocumentGeneratorTestCase
+from pydocx.test.testcases import PyDocXHTMLExporterNoStyle
+from pydocx.test.utils import WordprocessingDocumentFactory
+
+
+class RecordingHook(object):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    @contextmanager
+    def __call__(self, phase, info):
+        self.started.append(phase)
+        try:
+            yield
+        finally:
+            self.ended.append((phase, dict(info)))
+
+    def get_ended(self, phase):
+        return [info for name, info in self.ended if name == phase]
+
+
+class TraceTestCase(TestCase):
+    def tearDown(self):
+        del tracing.hooks[:]
+
+    def test_without_hooks(self):
+        with tracing.trace('parse', bytes=1) as info:
+            info['nodes'] = 2
+        self.assertEqual(info, {'bytes': 1, 'nodes': 2})
+
+    def test_hook_sees_the_complete_info_when_the_phase_ends(self):
+        hook = RecordingHook()
+        tracing.add_hook(hook)
+        with tracing.trace('parse', bytes=1) as info:
+            self.assertEqual(hook.started, ['parse'])
+            self.assertEqual(hook.ended, [])
+            info['nodes'] = 2
+        self.assertEqual(hook.ended, [('parse', {'bytes': 1, 'nodes': 2})])
+
+    def test_hook_that_does_not_return_a_context_manager(self):
+        phases = []
+        tracing.add_hook(lambda phase, info: phases.append(phase))
+        with tracing.trace('load'):
+            pass
+        self.assertEqual(phases, ['load'])
+
+    def test_exceptions_are_passed_to_the_hook_and_not_suppressed(self):
+        hook = RecordingHook()
+        tracing.add_hook(hook)
+
+        def fail():
+            with tracing.trace('load'):
+                raise ValueError
+
+        self.assertRaises(ValueError, fail)
+        self.assertEqual(hook.ended, [('load', {})])
+
+    def test_remove_hook(self):
+        hook = RecordingHook()
+        tracing.add_hook(hook)
+        tracing.remove_hook(hook)
+        with tracing.trace('load'):
+            pass
+        self.assertEqual(hook.started, [])
+
+
+class ConversionTracingTestCase(DocumentGeneratorTestCase):
+    def setUp(self):
+        self.hook = RecordingHook()
+        tracing.add_hook(self.hook)
+
+    def tearDown(self):
+        tracing.remove_hook(self.hook)
+
+    def export(self, exporter_class=PyDocXHTMLExporterNoStyle):
+        document = WordprocessingDocumentFactory()
+        document.add(MainDocumentPart, '''
+            <p>
+                <r><fldChar fldCharType="begin"/></r>
+                <r><instrText> HYPERLINK "http://www.google.com/"</instrText></r>
+                <r><fldChar fldCharType="separate"/></r>
+                <r><t>AAA</t></r>
+                <r><fldChar fldCharType="end"/></r>
+            </p>
+            <p><r><t>BBB</t></r></p>
+        ''')
+        archive = self.get_zip_archive_for_document(document)
+        return exporter_class(archive).export()
+
+    def test_phases(self):
+        self.export()
+        self.assertEqual(
+            set(self.hook.started),
+            set([
+                'open_archive',
+                'decompress',
+                'parse',
+                'load',
+                'first_pass',
+                'numbering_spans',
+                'render',
+            ]),
+        )
+        self.assertEqual(
+            len(self.hook.started),
+            len(self.hook.ended),
+        )
+
+    def test_byte_and_node_counts(self):
+        self.export()
+        [open_archive] = self.hook.get_ended('open_archive')
+        self.assertTrue(open_archive['parts'] > 0)
+
+        decompress = dict(
+            (info['uri'], info)
+            for info in self.hook.get_ended('decompress')
+        )
+        document = decompress['/word/document.xml']
+        self.assertTrue(document['bytes'] > 0)
+        self.assertTrue(document['compressed_bytes'] > 0)
+
+        parse = dict(
+            (info['uri'], info)
+            for info in self.hook.get_ended('parse')
+        )
+        self.assertEqual(parse['/word/document.xml']['bytes'], document['bytes'])
+
+        loads = dict(
+            (info['model'], info)
+            for info in self.hook.get_ended('load')
+        )
+        # Document, Body, 2 paragraphs, 6 runs, 3 field chars, 1 instr
+        # text and 2 texts
+        self.assertEqual(loads['Document']['nodes'], 16)
+
+        [first_pass] = self.hook.get_ended('first_pass')
+        self.assertEqual(first_pass['complex_field_runs'], 5)
+
+        [body_numbering_spans] = self.hook.get_ended('numbering_spans')
+        self.assertEqual(body_numbering_spans['nodes'], 2)
+        self.assertEqual(body_numbering_spans['items'], 2)
+
+        [render] = self.hook.get_ended('render')
+        self.assertTrue(render['results'] > 0)
+
+    def test_models_nested_within_a_part_are_not_traced_separately(self):
+        self.export()
+        models = [info['model'] for info in self.hook.get_ended('load')]
+        self.assertEqual(models.count('Document'), 1)
+        self.assertFalse('Paragraph' in models)
+
+    def test_streaming_body(self):
+        class StreamingExporter(PyDocXHTMLExporterNoStyle):
+            stream_body = True
+
+        html = self.export(StreamingExporter)
+        self.assertTrue('<p>BBB</p>' in html)
+        models = [info['model'] for info in self.hook.get_ended('load')]
+        self.assertEqual(models.count('Body'), 2)
@@ -0,0 +1,123 @@
+# coding: utf-8
+from __future__ import (
+    absolute_import,
+    print_function,
+    unicode_literals,
+)
+
+import gc
+import threading
+from unittest import TestCase
+
+from pydocx.util.memoize import LRUCache, memoized
+
+
+class Counter(object):
+    def __init__(self):
+        self.calls = 0
+
+    @memoized
+    def double(self, value):
+        self.calls += 1
+        return value * 2
+
+    @memoized(maxsize=2)
+    def triple(self, value):
+        self.calls += 1
+        return value * 3
+
+
+class LRUCacheTestCase(TestCase):
+    def test_least_recently_used_item_is_evicted(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertEqual(sorted(cache.keys()), ['a', 'c'])
+
+    def test_unbounded(self):
+        cache = LRUCache()
+        for i in range(100):
+            cache.set(i, i)
+        self.assertEqual(len(cache), 100)
+
+
+class MemoizedTestCase(TestCase):
+    def test_value_is_cached_per_instance(self):
+        first = Counter()
+        second = Counter()
+        self.assertEqual(first.double(2), 4)
+        self.assertEqual(first.double(2), 4)
+        self.assertEqual(first.calls, 1)
+        self.assertEqual(second.double(2), 4)
+        self.assertEqual(second.calls, 1)
+
+    def test_cache_does_not_keep_the_instance_alive(self):
+        counter = Counter()
+        counter.double(2)
+        memo = counter.double.memo
+        self.assertEqual(len(memo.instance_caches), 1)
+        del counter
+        gc.collect()
+        self.assertEqual(len(memo.instance_caches), 0)
+
+    def test_cache_is_bounded(self):
+        counter = Counter()
+        for value in [1, 2, 3, 1]:
+            counter.triple(value)
+        # 1 was evicted by 3
+        self.assertEqual(counter.calls, 4)
+        counter.triple(3)
+        self.assertEqual(counter.calls, 4)
+
+    def test_unhashable_arguments_are_not_cached(self):
+        counter = Counter()
+        self.assertEqual(counter.double([1]), [1, 1])
+        self.assertEqual(counter.double([1]), [1, 1])
+        self.assertEqual(counter.calls, 2)
+
+    def test_plain_function_with_arguments_that_cannot_be_weakly_referenced(self):
+        calls = []
+
+        @memoized
+        def square(value):
+            calls.append(value)
+            return value * value
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(calls, [3])
+
+    def test_set_cache(self):
+        counter = Counter()
+        counter.double.memo.set_cache('foo', counter, 2)
+        self.assertEqual(counter.double(2), 'foo')
+        self.assertEqual(counter.calls, 0)
+
+    def test_clear(self):
+        counter = Counter()
+        counter.double(2)
+        counter.double.memo.clear(counter)
+        counter.double(2)
+        self.assertEqual(counter.calls, 2)
+
+    def test_concurrent_use_from_several_threads(self):
+        counters = [Counter() for _ in range(10)]
+        errors = []
+
+        def run():
+            try:
+                for _ in range(100):
+                    for counter in counters:
+                        for value in range(5):
+                            assert counter.triple(value) == value * 3
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
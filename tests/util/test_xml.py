@@ -5,12 +5,26 @@ from __future__ import (
     unicode_literals,
 )
 
+import os
+import threading
+from io import BytesIO
 from unittest import TestCase
 
+from nose import SkipTest
+
 from pydocx.exceptions import MalformedDocxException
 from pydocx.util.xml import (
+    ElementTreeXmlParser,
+    EntitiesForbidden,
+    LxmlXmlParser,
+    XML_PARSER_ENVIRONMENT_VARIABLE,
     el_iter,
+    get_lxml_etree,
+    get_xml_parser,
+    iterparse_without_namespaces,
+    parse_trailing_element_without_namespaces,
     parse_xml_from_string,
+    parse_xml_without_namespaces,
     xml_remove_namespaces,
     xml_tag_split,
     XmlNamespaceManager,
@@ -69,10 +83,243 @@ class UtilsTestCase(TestCase):
             lambda: xml_remove_namespaces('foo')
         )
 
+    def test_parse_xml_without_namespaces(self):
+        xml = b'''<?xml version="1.0"?>
+            <w:one xmlns:w="foo" xmlns:x="bar">
+                <w:two w:val="1" x:other="2" plain="3">
+                    <x:three/>
+                </w:two>
+            </w:one>
+        '''
+        root = parse_xml_without_namespaces(xml)
+        self.assertEqual(
+            list(elements_to_tags(el_iter(root))),
+            ['one', 'two', 'three'],
+        )
+        self.assertEqual(
+            root[0].attrib,
+            {'val': '1', 'other': '2', 'plain': '3'},
+        )
+
+    def test_parse_xml_without_namespaces_junk_xml_causes_malformed_exception(self):
+        self.assertRaises(
+            MalformedDocxException,
+            lambda: parse_xml_without_namespaces(b'foo')
+        )
+
     def test_xml_tag_split(self):
         self.assertEqual(xml_tag_split('{foo}bar'), ('foo', 'bar'))
         self.assertEqual(xml_tag_split('bar'), (None, 'bar'))
 
+    def parse_trailing_section_properties(self, xml, chunk_size=16):
+        return parse_trailing_element_without_namespaces(
+            BytesIO(xml),
+            tag='sectPr',
+            parent_tag='body',
+            chunk_size=chunk_size,
+        )
+
+    def test_parse_trailing_element_without_namespaces(self):
+        xml = b'''<?xml version="1.0" encoding="UTF-8"?>
+            <w:document xmlns:w="foo"><w:body>
+            <w:p><w:pPr><w:sectPr><w:pgSz w:w="1"/></w:sectPr></w:pPr></w:p>
+            <w:sectPr>
+                <w:pgSz w:w="2"/>
+                <w:sectPrChange><w:sectPr><w:pgSz w:w="3"/></w:sectPr></w:sectPrChange>
+            </w:sectPr>
+            </w:body></w:document>
+        '''
+        element = self.parse_trailing_section_properties(xml)
+        self.assertEqual(element.tag, 'sectPr')
+        self.assertEqual([child.tag for child in element], ['pgSz', 'sectPrChange'])
+        self.assertEqual(dict(element[0].attrib), {'w': '2'})
+
+    def test_parse_trailing_element_that_is_not_the_last_child(self):
+        xml = b'''<w:document xmlns:w="foo"><w:body>
+            <w:p><w:pPr><w:sectPr><w:pgSz w:w="1"/></w:sectPr></w:pPr></w:p>
+            </w:body></w:document>
+        '''
+        self.assertEqual(self.parse_trailing_section_properties(xml), None)
+        xml = b'<document><body><p/></body></document>'
+        self.assertEqual(self.parse_trailing_section_properties(xml), None)
+
+    def test_parse_trailing_empty_element(self):
+        xml = b'<document><body><p/><sectPr/></body></document>'
+        element = self.parse_trailing_section_properties(xml, chunk_size=4096)
+        self.assertEqual(element.tag, 'sectPr')
+
+    def test_parse_trailing_element_followed_by_a_comment(self):
+        xml = b'''<w:document xmlns:w="foo"><w:body>
+            <w:p/>
+            <w:sectPr><w:pgSz w:w="2"/></w:sectPr>
+            <!-- </w:body> <w:p/> -->
+            </w:body></w:document>
+        '''
+        element = self.parse_trailing_section_properties(xml)
+        self.assertEqual(element.tag, 'sectPr')
+        self.assertEqual(dict(element[0].attrib), {'w': '2'})
+
+    def test_parse_trailing_element_of_utf_16_xml(self):
+        xml = '''<?xml version="1.0" encoding="UTF-16"?>
+            <w:document xmlns:w="foo"><w:body>
+            <w:p><w:pPr><w:sectPr><w:pgSz w:w="1"/></w:sectPr></w:pPr></w:p>
+            <w:sectPr><w:pgSz w:w="2"/></w:sectPr>
+            </w:body></w:document>
+        '''.encode('utf-16')
+        element = self.parse_trailing_section_properties(xml)
+        self.assertEqual(element.tag, 'sectPr')
+        self.assertEqual(dict(element[0].attrib), {'w': '2'})
+
+        xml = '''<?xml version="1.0" encoding="UTF-16"?>
+            <w:document xmlns:w="foo"><w:body>
+            <w:p><w:pPr><w:sectPr><w:pgSz w:w="1"/></w:sectPr></w:pPr></w:p>
+            </w:body></w:document>
+        '''.encode('utf-16')
+        self.assertEqual(self.parse_trailing_section_properties(xml), None)
+
+    def test_iterparse_without_namespaces(self):
+        xml = b'<w:document xmlns:w="foo"><w:body><w:p/><w:tbl/></w:body></w:document>'
+        elements = iterparse_without_namespaces(BytesIO(xml), depth=2)
+        self.assertEqual([element.tag for element in elements], ['p', 'tbl'])
+
+
+class GetXmlParserTestCase(TestCase):
+    def setUp(self):
+        self.environ_value = os.environ.pop(
+            XML_PARSER_ENVIRONMENT_VARIABLE,
+            None,
+        )
+
+    def tearDown(self):
+        os.environ.pop(XML_PARSER_ENVIRONMENT_VARIABLE, None)
+        if self.environ_value is not None:
+            os.environ[XML_PARSER_ENVIRONMENT_VARIABLE] = self.environ_value
+
+    def test_default_is_element_tree(self):
+        self.assertTrue(isinstance(get_xml_parser(), ElementTreeXmlParser))
+        self.assertEqual(get_xml_parser().name, 'etree')
+
+    def test_environment_variable_selects_the_parser(self):
+        os.environ[XML_PARSER_ENVIRONMENT_VARIABLE] = 'etree'
+        self.assertEqual(get_xml_parser().name, 'etree')
+        os.environ[XML_PARSER_ENVIRONMENT_VARIABLE] = 'unknown'
+        self.assertRaises(ValueError, get_xml_parser)
+
+    def test_explicit_name_overrides_environment_variable(self):
+        os.environ[XML_PARSER_ENVIRONMENT_VARIABLE] = 'unknown'
+        self.assertEqual(get_xml_parser('etree').name, 'etree')
+
+    def test_auto_uses_lxml_if_installed(self):
+        expected = 'etree' if get_lxml_etree() is None else 'lxml'
+        self.assertEqual(get_xml_parser('auto').name, expected)
+
+    def test_parser_instance_is_returned_as_is(self):
+        xml_parser = ElementTreeXmlParser()
+        self.assertTrue(get_xml_parser(xml_parser) is xml_parser)
+
+
+class LxmlXmlParserTestCase(TestCase):
+    def setUp(self):
+        if get_lxml_etree() is None:
+            raise SkipTest('This test case requires lxml')
+        self.xml_parser = LxmlXmlParser()
+
+    def test_parse_xml_without_namespaces(self):
+        xml = b'''<?xml version="1.0"?>
+            <w:one xmlns:w="foo" xmlns:x="bar">
+                <!-- comment -->
+                <w:two w:val="1" x:other="2" plain="3">
+                    <?pi data?>
+                    <x:three/>
+                </w:two>
+            </w:one>
+        '''
+        root = parse_xml_without_namespaces(xml, xml_parser=self.xml_parser)
+        self.assertEqual(
+            list(elements_to_tags(el_iter(root))),
+            ['one', 'two', 'three'],
+        )
+        self.assertEqual(
+            dict(root[0].attrib),
+            {'val': '1', 'other': '2', 'plain': '3'},
+        )
+
+    def test_remove_namespaces(self):
+        xml = b'<w:one xmlns:w="foo"><w:two w:val="1"/></w:one>'
+        result = xml_remove_namespaces(xml, xml_parser=self.xml_parser)
+        self.assertEqual(result, b'<one><two val="1"/></one>')
+
+    def test_junk_xml_causes_malformed_exception(self):
+        self.assertRaises(
+            MalformedDocxException,
+            lambda: parse_xml_without_namespaces(
+                b'foo',
+                xml_parser=self.xml_parser,
+            )
+        )
+
+    def test_entity_declarations_are_rejected(self):
+        xml = b'''<?xml version="1.0"?>
+            <!DOCTYPE xml [<!ENTITY a "123">]>
+            <one>&a;</one>
+        '''
+        expected_exception = EntitiesForbidden or MalformedDocxException
+        self.assertRaises(
+            expected_exception,
+            lambda: parse_xml_without_namespaces(
+                xml,
+                xml_parser=self.xml_parser,
+            )
+        )
+        elements = iterparse_without_namespaces(
+            BytesIO(xml),
+            depth=0,
+            xml_parser=self.xml_parser,
+        )
+        self.assertRaises(expected_exception, lambda: list(elements))
+
+    def test_iterparse_without_namespaces(self):
+        xml = b'''<w:one xmlns:w="foo">
+            <w:two w:val="1"><w:three/></w:two>
+            <w:four/>
+        </w:one>'''
+        elements = iterparse_without_namespaces(
+            BytesIO(xml),
+            depth=1,
+            xml_parser=self.xml_parser,
+        )
+        elements = list(elements)
+        self.assertEqual([el.tag for el in elements], ['two', 'four'])
+        self.assertEqual(elements[0][0].tag, 'three')
+        self.assertEqual(dict(elements[0].attrib), {'val': '1'})
+
+    def test_depth_is_limited(self):
+        depth = 300
+        xml = '<a>' * depth + '</a>' * depth
+        self.assertRaises(
+            MalformedDocxException,
+            parse_xml_without_namespaces,
+            xml,
+            xml_parser=self.xml_parser,
+        )
+
+    def test_depth_is_not_limited_with_huge_tree(self):
+        depth = 300
+        xml = '<a>' * depth + '</a>' * depth
+        xml_parser = LxmlXmlParser(huge_tree=True)
+        root = parse_xml_without_namespaces(xml, xml_parser=xml_parser)
+        self.assertEqual(len(list(el_iter(root))), depth)
+
+    def test_each_thread_has_its_own_parser(self):
+        parsers = []
+        thread = threading.Thread(
+            target=lambda: parsers.append(self.xml_parser.parser),
+        )
+        thread.start()
+        thread.join()
+        self.assertTrue(self.xml_parser.parser is self.xml_parser.parser)
+        self.assertFalse(parsers[0] is self.xml_parser.parser)
+
 
 class XmlNamespaceManagerTestCase(TestCase):
     def test_namespace_manager(self):
@@ -5,10 +5,34 @@ from __future__ import (
     unicode_literals,
 )
 
+import os
+import zipfile
+from tempfile import NamedTemporaryFile
 from unittest import TestCase
 
+from pydocx import PyDocX
 from pydocx.exceptions import MalformedDocxException
-from pydocx.util.zip import ZipFile, BytesIO
+from pydocx.util import zip as zip_util
+from pydocx.util.zip import (
+    BufferStream,
+    BufferZipSource,
+    MemoryMappedZipSource,
+    PathOrStreamZipSource,
+    ZipFile,
+    BytesIO,
+    get_zip_source,
+)
+
+
+def create_archive(compress_type=zipfile.ZIP_STORED):
+    archive = BytesIO()
+    with ZipFile(archive, 'w') as zf:
+        zf.writestr(
+            zipfile.ZipInfo('word/media/image1.png'),
+            b'not really a png',
+            compress_type=compress_type,
+        )
+    return archive.getvalue()
 
 
 class ZipFileTestCase(TestCase):
@@ -20,3 +44,94 @@ class ZipFileTestCase(TestCase):
             raise AssertionError('Excepted MalformedDocxException')
         except MalformedDocxException:
             pass
+
+
+class BufferStreamTestCase(TestCase):
+    def test_read_and_seek(self):
+        stream = BufferStream(b'abcdef')
+        self.assertEqual(stream.read(2), b'ab')
+        self.assertEqual(stream.tell(), 2)
+        self.assertEqual(stream.read(), b'cdef')
+        self.assertEqual(stream.read(), b'')
+        stream.seek(-3, os.SEEK_END)
+        self.assertEqual(stream.read(1), b'd')
+
+    def test_getbuffer_returns_a_read_only_view_of_the_data(self):
+        data = bytearray(b'abcdef')
+        view = BufferStream(data).getbuffer()
+        assert view.readonly
+        data[0:1] = b'z'
+        self.assertEqual(view.tobytes(), b'zbcdef')
+
+
+class GetZipSourceTestCase(TestCase):
+    def test_bytes_holding_an_archive_use_a_buffer_source(self):
+        source = get_zip_source(create_archive())
+        assert isinstance(source, BufferZipSource)
+
+    def test_memoryview_uses_a_buffer_source(self):
+        source = get_zip_source(memoryview(create_archive()))
+        assert isinstance(source, BufferZipSource)
+
+    def test_file_path_is_memory_mapped(self):
+        source = get_zip_source('tests/fixtures/simple.docx')
+        assert isinstance(source, MemoryMappedZipSource)
+
+    def test_file_path_is_read_through_zipfile_if_it_cannot_be_mapped(self):
+        # As on Python 2, where mmap doesn't support the buffer interface
+        memory_maps_are_buffers = zip_util.memory_maps_are_buffers
+        zip_util.memory_maps_are_buffers = lambda: False
+        try:
+            source = get_zip_source('tests/fixtures/simple.docx')
+            assert isinstance(source, PathOrStreamZipSource)
+            html = PyDocX.to_html('tests/fixtures/simple.docx')
+        finally:
+            zip_util.memory_maps_are_buffers = memory_maps_are_buffers
+        with open('tests/fixtures/simple.docx', 'rb') as f:
+            self.assertEqual(html, PyDocX.to_html(f))
+
+    def test_file_path_is_converted(self):
+        html = PyDocX.to_html('tests/fixtures/simple.docx')
+        with open('tests/fixtures/simple.docx', 'rb') as f:
+            self.assertEqual(html, PyDocX.to_html(f))
+        self.assertTrue('<html>' in html)
+
+    def test_file_object_is_read_through_zipfile(self):
+        with open('tests/fixtures/simple.docx', 'rb') as f:
+            source = get_zip_source(f)
+            assert isinstance(source, PathOrStreamZipSource)
+
+    def test_empty_file_is_malformed(self):
+        with NamedTemporaryFile(suffix='.docx') as f:
+            source = get_zip_source(f.name)
+            self.assertRaises(MalformedDocxException, source.open_zip_file)
+
+    def test_junk_buffer_is_malformed(self):
+        source = get_zip_source(bytearray(b'foo'))
+        self.assertRaises(MalformedDocxException, source.open_zip_file)
+
+
+class BufferZipSourceTestCase(TestCase):
+    def test_stored_member_is_a_view_of_the_buffer(self):
+        source = BufferZipSource(create_archive())
+        zip_info = source.open_zip_file().getinfo('word/media/image1.png')
+        view = source.get_stored_member_view(zip_info)
+        assert isinstance(view, memoryview)
+        self.assertEqual(view.tobytes(), b'not really a png')
+
+    def test_compressed_member_has_no_view(self):
+        source = BufferZipSource(create_archive(zipfile.ZIP_DEFLATED))
+        zip_info = source.open_zip_file().getinfo('word/media/image1.png')
+        self.assertEqual(source.get_stored_member_view(zip_info), None)
+
+
+class MemoryMappedZipSourceTestCase(TestCase):
+    def test_view_outlives_close(self):
+        with NamedTemporaryFile(suffix='.docx') as f:
+            f.write(create_archive())
+            f.flush()
+            source = MemoryMappedZipSource(f.name)
+            zip_info = source.open_zip_file().getinfo('word/media/image1.png')
+            view = source.get_stored_member_view(zip_info)
+            source.close()
+            self.assertEqual(view.tobytes(), b'not really a png')